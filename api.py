@@ -0,0 +1,343 @@
+"""
+AGEonT-st: AI-Powered Multilingual Research Article and News Insight System
+HTTP/JSON API Service
+
+Run with:
+    uvicorn api:app --host 0.0.0.0 --port 8000
+"""
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
+
+from utils import ArticleFetcher, AnalysisPipeline, AnalysisCancelled, JobManager, metrics
+from utils.resources import resource_manager
+from utils.profiler import timer
+import config
+
+
+class AnalyzeRequest(BaseModel):
+    """Analysis request for a single article"""
+    text: Optional[str] = Field(None, max_length=config.MAX_INPUT_CHARS)
+    url: Optional[str] = None
+    title: str = ''
+    target_language: str = 'en'
+    options: List[str] = Field(default_factory=lambda: ["Sentiment Analysis", "Summarization", "Keywords"])
+    num_sentences: int = Field(3, ge=1, le=10)
+
+
+class BatchRequest(BaseModel):
+    """Analysis request for several articles"""
+    items: List[AnalyzeRequest] = Field(..., max_length=config.API_MAX_BATCH_ITEMS)
+
+
+# Worker process state
+_worker_pipeline = None
+
+
+def _init_worker():
+    """Create and warm up the pipeline once per worker process"""
+    global _worker_pipeline
+    # Already loaded when the worker was forked from the preloaded parent
+    resource_manager.preload()
+    _worker_pipeline = AnalysisPipeline()
+    _worker_pipeline.analyzer.analyze_sentiment("Warm up the sentiment lexicon.")
+    _worker_pipeline.analyzer.extract_keywords("Warm up the tokenizer models.")
+
+
+def _resource_report():
+    """Residency and memory report of a worker process"""
+    return resource_manager.report()
+
+
+def _analyze_batch(payloads):
+    """
+    Analyze a batch of texts inside a worker process
+
+    Args:
+        payloads (list): Keyword arguments for AnalysisPipeline.analyze
+
+    Returns:
+        list: Result dict or {'error': ...} for each payload
+    """
+    results = []
+    for payload in payloads:
+        try:
+            results.append(_worker_pipeline.analyze(**payload))
+        except Exception as e:
+            results.append({'error': str(e)})
+    return results
+
+
+class MicroBatcher:
+    """
+    Group concurrent analysis requests into batches for the worker pool
+
+    The pipeline analyzes one text at a time, so a batch only saves
+    inter-process round trips. Each collected batch is split into one slice
+    per worker and the slices run in parallel, so concurrent requests do not
+    queue behind each other on a single worker.
+    """
+
+    def __init__(self, executor, max_batch_size, max_wait, workers=1, handler=_analyze_batch):
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.workers = max(1, workers)
+        self.handler = handler
+        self.queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, payload):
+        """
+        Queue one payload and wait for its result
+
+        Args:
+            payload (dict): Keyword arguments for AnalysisPipeline.analyze
+
+        Returns:
+            dict: Analysis result
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((payload, future))
+        return await future
+
+    async def _run(self):
+        """Collect payloads until the batch is full or the wait expires"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Contiguous slices of nearly equal size, one per worker
+            slices = min(self.workers, len(batch))
+            for index in range(slices):
+                start = len(batch) * index // slices
+                end = len(batch) * (index + 1) // slices
+                asyncio.create_task(self._dispatch(batch[start:end]))
+
+    async def _dispatch(self, batch):
+        """Run a slice of a batch in the worker pool and resolve its futures"""
+        loop = asyncio.get_running_loop()
+        payloads = [payload for payload, _ in batch]
+        try:
+            results = await loop.run_in_executor(self.executor, self.handler, payloads)
+        except Exception as e:
+            results = [{'error': str(e)}] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+state = {}
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """Start the worker pool, batcher and job manager"""
+    # Load models before forking so workers share their pages copy-on-write
+    resource_manager.preload()
+    resource_manager.freeze()
+
+    mp_context = (
+        multiprocessing.get_context('fork')
+        if 'fork' in multiprocessing.get_all_start_methods() else None
+    )
+    executor = ProcessPoolExecutor(
+        max_workers=config.API_WORKERS,
+        initializer=_init_worker,
+        mp_context=mp_context
+    )
+    batcher = MicroBatcher(executor, config.API_BATCH_SIZE, config.API_BATCH_WAIT, config.API_WORKERS)
+    batcher.start()
+
+    state['loop'] = asyncio.get_running_loop()
+    state['executor'] = executor
+    state['batcher'] = batcher
+    state['fetcher'] = ArticleFetcher()
+    state['pipeline'] = AnalysisPipeline(fetcher=state['fetcher'])
+    state['jobs'] = JobManager()
+
+    # Warm up every worker process before accepting traffic
+    await asyncio.gather(*[
+        state['loop'].run_in_executor(executor, _analyze_batch, [])
+        for _ in range(config.API_WORKERS)
+    ])
+
+    yield
+
+    await batcher.stop()
+    state['jobs'].shutdown(wait=False)
+    executor.shutdown(wait=False, cancel_futures=True)
+    state.clear()
+
+
+app = FastAPI(title=config.APP_TITLE, lifespan=lifespan)
+
+
+async def run_analysis(request):
+    """
+    Fetch (if needed) and analyze one article
+
+    Args:
+        request (AnalyzeRequest): Analysis request
+
+    Returns:
+        dict: Analysis results
+    """
+    text, title = request.text, request.title
+
+    if not text:
+        if not request.url:
+            raise HTTPException(status_code=422, detail="Provide either 'text' or 'url'")
+
+        article = await asyncio.to_thread(state['fetcher'].fetch_from_url, request.url)
+        if not article['success']:
+            raise HTTPException(status_code=502, detail=article.get('message', 'Failed to fetch article'))
+        text, title = article['text'], title or article['title']
+        if len(text) > config.MAX_INPUT_CHARS:
+            raise HTTPException(status_code=413, detail=f"Article text exceeds {config.MAX_INPUT_CHARS:,} characters")
+
+    # Network I/O (fetching, detection, translation) stays on threads, only
+    # CPU stages go to the process pool
+    language_results = await asyncio.to_thread(
+        state['pipeline'].detect_and_translate, text, request.target_language, request.options
+    )
+
+    payload = {
+        'text': text,
+        'title': title,
+        'target_language': request.target_language,
+        'options': request.options,
+        'num_sentences': request.num_sentences,
+        'language_results': language_results
+    }
+
+    with timer('api.analyze'):
+        result = await state['batcher'].submit(payload)
+
+    if 'error' in result:
+        raise HTTPException(status_code=500, detail=result['error'])
+
+    for stage in result.get('performance', {}).get('stages', []):
+        metrics.record(f"stage.{stage['stage']}", stage['seconds'])
+
+    return result
+
+
+def _run_job(request, cancel_event=None):
+    """Run an API analysis from a JobManager worker thread"""
+    if cancel_event is not None and cancel_event.is_set():
+        raise AnalysisCancelled("Analysis was cancelled")
+    future = asyncio.run_coroutine_threadsafe(run_analysis(request), state['loop'])
+
+    while True:
+        try:
+            return future.result(timeout=config.JOB_POLL_INTERVAL)
+        except FutureTimeout:
+            if cancel_event is not None and cancel_event.is_set():
+                # Stops the fetch/batch wait, a batch already in a worker runs to completion
+                future.cancel()
+                raise AnalysisCancelled("Analysis was cancelled")
+
+
+@app.get("/health")
+async def health():
+    return {'status': 'ok'}
+
+
+@app.post("/analyze")
+async def analyze(request: AnalyzeRequest):
+    """Analyze one article and return the results"""
+    return await run_analysis(request)
+
+
+@app.post("/analyze/batch")
+async def analyze_batch(request: BatchRequest):
+    """Analyze several articles concurrently"""
+    results = await asyncio.gather(
+        *[run_analysis(item) for item in request.items],
+        return_exceptions=True
+    )
+    return {
+        'results': [
+            {'error': result.detail if isinstance(result, HTTPException) else str(result)}
+            if isinstance(result, Exception) else result
+            for result in results
+        ]
+    }
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job(request: AnalyzeRequest):
+    """Queue an analysis and return its job ID"""
+    job_id = state['jobs'].submit(_run_job, request)
+    return {'job_id': job_id}
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get job status, including the result once completed"""
+    status = state['jobs'].status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if status['status'] == 'completed':
+        status['result'] = state['jobs'].result(job_id)
+    return status
+
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """Cancel a queued or running job"""
+    if state['jobs'].status(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {'cancelled': state['jobs'].cancel(job_id)}
+
+
+@app.get("/resources")
+async def get_resources():
+    """Preloaded resources and memory footprint of the API and its workers"""
+    reports = await asyncio.gather(*[
+        state['loop'].run_in_executor(state['executor'], _resource_report)
+        for _ in range(config.API_WORKERS)
+    ])
+    workers = {report['pid']: report for report in reports}
+    return {
+        'parent': resource_manager.report(),
+        'workers': list(workers.values())
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus metrics for this API process"""
+    return metrics.to_prometheus()
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host=config.API_HOST, port=config.API_PORT)
@@ -2,11 +2,17 @@
 AGEonT-st: AI-Powered Multilingual Research Article and News Insight System
 Main Streamlit Application
 """
+import atexit
+import time
 import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
-from utils import ArticleFetcher, Translator, ContentAnalyzer, TextSummarizer
+from utils import ArticleFetcher, Translator, ContentAnalyzer, TextSummarizer, AnalysisPipeline, JobManager, IncrementalAnalyzer, EntityExtractor, TextStore, metrics
+from utils.charting import sentiment_series
+from utils.resources import resource_manager
+from utils.aggregate import results_frame, keyword_frame, sentiment_distribution, source_statistics, keyword_trends, topic_summary
+from utils.clustering import cluster_results
 import config
 
 # Page configuration
@@ -21,20 +27,65 @@ st.set_page_config(
 if 'analysis_results' not in st.session_state:
     st.session_state.analysis_results = None
 
+if 'job_id' not in st.session_state:
+    st.session_state.job_id = None
+
+if 'batch_jobs' not in st.session_state:
+    st.session_state.batch_jobs = []
+
+if 'batch_results' not in st.session_state:
+    st.session_state.batch_results = None
+
+@st.cache_resource
+def get_resources():
+    """Preload models and lexicons once per server process"""
+    resource_manager.preload()
+    return resource_manager
+
+resources = get_resources()
+
+
 # Initialize utility classes
 @st.cache_resource
 def get_utilities():
     """Initialize and cache utility classes"""
+    fetcher = ArticleFetcher()
+    translator = Translator()
+    analyzer = ContentAnalyzer()
+    summarizer = TextSummarizer()
+    entity_extractor = EntityExtractor()
+    text_store = TextStore()
+    # Spilled texts are only referenced by this server's sessions
+    atexit.register(text_store.close)
+    
     return {
-        'fetcher': ArticleFetcher(),
-        'translator': Translator(),
-        'analyzer': ContentAnalyzer(),
-        'summarizer': TextSummarizer()
+        'fetcher': fetcher,
+        'translator': translator,
+        'analyzer': analyzer,
+        'summarizer': summarizer,
+        'entity_extractor': entity_extractor,
+        'text_store': text_store,
+        'pipeline': AnalysisPipeline(fetcher, translator, analyzer, summarizer, text_store=text_store,
+                                     entity_extractor=entity_extractor)
     }
 
 utils = get_utilities()
 
 
+@st.cache_resource
+def get_job_manager():
+    """Initialize the background job pool shared by all sessions"""
+    return JobManager()
+
+jobs = get_job_manager()
+
+# Pipeline stages previewed while an analysis is still running
+PREVIEW_STAGES = ['detect', 'translate', 'sentiment', 'summary', 'keywords', 'entities', 'statistics']
+
+# Characters of stored text shown before the full text is requested
+TEXT_PREVIEW_CHARS = 1000
+
+
 def main():
     """Main application function"""
     
@@ -45,11 +96,12 @@ def main():
     # Sidebar
     with st.sidebar:
         st.header("⚙️ Settings")
+        st.caption(f"Pipeline profile: {config.PIPELINE_PROFILE}")
         
         input_method = st.radio(
             "Input Method:",
-            ["URL", "Text"],
-            help="Choose how to input the article"
+            ["URL", "Text", "Batch"],
+            help="Choose how to input the article, or analyze many at once"
         )
         
         st.markdown("---")
@@ -66,7 +118,7 @@ def main():
         
         analysis_options = st.multiselect(
             "Analysis Options:",
-            ["Translation", "Sentiment Analysis", "Summarization", "Keywords", "Statistics"],
+            ["Translation", "Sentiment Analysis", "Summarization", "Keywords", "Entities", "Statistics"],
             default=["Sentiment Analysis", "Summarization", "Keywords"],
             help="Select analysis types to perform"
         )
@@ -86,6 +138,10 @@ def main():
             "sentiment analysis, and automated insights generation."
         )
     
+    if input_method == "Batch":
+        batch_mode(target_language, analysis_options, summary_sentences)
+        return
+    
     # Main content area
     col1, col2 = st.columns([1, 1])
     
@@ -127,7 +183,8 @@ def main():
                 "Article Text:",
                 height=300,
                 placeholder="Paste the article text here...",
-                help="Paste or type the article content"
+                help="Paste or type the article content",
+                max_chars=config.MAX_INPUT_CHARS
             )
             
             if article_text:
@@ -153,75 +210,366 @@ def main():
                     st.session_state.get('article_title', ''),
                     target_language,
                     analysis_options,
-                    summary_sentences
+                    summary_sentences,
+                    incremental=(input_method == "Text")
                 )
             else:
                 st.warning("Please provide article text first")
+        
+        if st.session_state.job_id:
+            show_job_status(st.session_state.job_id)
     
     # Display results
     if st.session_state.analysis_results:
         display_results(st.session_state.analysis_results)
 
 
-def analyze_article(text, title, target_lang, options, num_sentences):
-    """Perform comprehensive article analysis"""
+def analyze_article(text, title, target_lang, options, num_sentences, incremental=False):
+    """Submit comprehensive article analysis to the background workers"""
     
-    results = {
-        'title': title,
-        'original_text': text
-    }
+    if st.session_state.job_id:
+        jobs.cancel(st.session_state.job_id)
+        jobs.forget(st.session_state.job_id)
+    
+    # Edited drafts only re-analyze the sentences that changed
+    sentence_cache = None
+    if incremental:
+        if 'sentence_cache' not in st.session_state:
+            st.session_state.sentence_cache = IncrementalAnalyzer(utils['analyzer'])
+        sentence_cache = st.session_state.sentence_cache
+    
+    st.session_state.job_id = jobs.submit(
+        utils['pipeline'].analyze,
+        text,
+        title,
+        target_lang,
+        options,
+        num_sentences,
+        analyzer=sentence_cache,
+        summarizer=sentence_cache,
+        report_progress=True
+    )
+
+
+def show_job_status(job_id):
+    """Poll a background analysis and collect its result when done"""
+    
+    status = jobs.status(job_id)
+    
+    if status is None:
+        st.session_state.job_id = None
+        st.warning("Analysis job expired. Please run it again.")
+        return
     
-    with st.spinner("Analyzing article..."):
-        # Language detection
-        lang_result = utils['translator'].detect_language(text)
-        if lang_result['success']:
-            results['detected_language'] = lang_result
+    if status['status'] == 'completed':
+        st.session_state.analysis_results = jobs.result(job_id)
+        st.session_state.job_id = None
+        jobs.forget(job_id)
+        st.success("✅ Analysis complete!")
+    elif status['status'] == 'failed':
+        st.session_state.job_id = None
+        jobs.forget(job_id)
+        st.error(f"❌ Analysis failed: {status['error']}")
+    elif status['status'] == 'cancelled':
+        st.session_state.job_id = None
+        jobs.forget(job_id)
+        st.warning("Analysis cancelled")
+    else:
+        st.info(f"⏳ Analysis {status['status']}... (job {job_id[:8]})")
         
-        # Translation
-        if "Translation" in options and target_lang != 'en':
-            trans_result = utils['translator'].translate_text(text, target_lang)
-            if trans_result['success']:
-                results['translation'] = trans_result
-                analysis_text = trans_result['translated_text']
-            else:
-                analysis_text = text
-        else:
-            analysis_text = text
+        if st.button("Cancel Analysis"):
+            jobs.cancel(job_id)
+            st.rerun()
         
-        # Sentiment Analysis
-        if "Sentiment Analysis" in options:
-            sentiment_result = utils['analyzer'].analyze_sentiment(analysis_text)
-            if sentiment_result['success']:
-                results['sentiment'] = sentiment_result
+        # Poll by rerunning, so widget events such as Cancel are handled between polls
+        render_partial_results(job_id)
+        time.sleep(config.JOB_POLL_INTERVAL)
+        st.rerun()
+
+
+def render_partial_results(job_id):
+    """Render the output of every stage the background job has finished so far"""
+    
+    partial = jobs.partial(job_id)
+    if not partial:
+        return
+    
+    for stage in PREVIEW_STAGES:
+        if stage in partial['stages']:
+            render_stage_preview(stage, partial['results'])
+
+
+def render_stage_preview(stage, results):
+    """Render a compact preview of one finished pipeline stage"""
+    
+    if stage == 'detect' and 'detected_language' in results:
+        st.info(f"🌍 **Detected Language:** {results['detected_language']['language_name']}")
+    
+    elif stage == 'translate' and 'translation' in results:
+        with st.expander("🌐 Translation ready"):
+            st.write(load_text(results['translation']['translated_text_ref'], TEXT_PREVIEW_CHARS))
+    
+    elif stage == 'sentiment' and 'sentiment' in results:
+        sentiment = results['sentiment']
+        st.metric("Overall Sentiment", sentiment['sentiment'], f"polarity {sentiment['polarity']:.2f}")
+    
+    elif stage == 'summary' and 'summary' in results:
+        st.markdown("**Summary**")
+        st.write(results['summary']['summary'])
+    
+    elif stage == 'keywords' and results.get('keywords'):
+        st.markdown("**Key Terms:** " + ", ".join(keyword for keyword, _ in results['keywords'][:10]))
+    
+    elif stage == 'entities' and results.get('entities', {}).get('entities'):
+        st.markdown("**Entities:** " + ", ".join(
+            f"{entity['entity']} ({entity['type']})" for entity in results['entities']['entities'][:10]
+        ))
+    
+    elif stage == 'statistics' and 'statistics' in results:
+        stats = results['statistics']
+        st.caption(f"{stats['word_count']:,} words · {stats['sentence_count']:,} sentences · "
+                   f"{stats['reading_time_minutes']} min read")
+
+
+def batch_mode(target_lang, options, num_sentences):
+    """Collect many URLs/texts, analyze them in parallel and show aggregates"""
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.header("📚 Batch Input")
         
-        # Summarization
-        if "Summarization" in options:
-            summary_result = utils['summarizer'].extractive_summarize(analysis_text, num_sentences)
-            if summary_result['success']:
-                results['summary'] = summary_result
-                
-                # Bullet points
-                bullet_points = utils['summarizer'].bullet_point_summary(analysis_text, num_sentences)
-                results['bullet_points'] = bullet_points
+        urls = st.text_area(
+            "Article URLs:",
+            height=200,
+            placeholder="https://example.com/article-1\nhttps://example.com/article-2",
+            help="One URL per line"
+        )
         
-        # Keywords
-        if "Keywords" in options:
-            keywords = utils['analyzer'].extract_keywords(analysis_text, 15)
-            results['keywords'] = keywords
+        uploads = st.file_uploader(
+            "Or upload articles:",
+            type=["txt", "csv"],
+            accept_multiple_files=True,
+            help="Each .txt file is one article; .csv files need a 'url' or 'text' column "
+                 "and may have a 'title' column"
+        )
+        
+        items = collect_batch_items(urls, uploads)
+        if items:
+            st.caption(f"{len(items)} articles queued for analysis")
+    
+    with col2:
+        st.header("🔍 Analysis")
         
-        # Statistics
-        if "Statistics" in options:
-            stats = utils['analyzer'].get_text_statistics(analysis_text)
-            if stats['success']:
-                results['statistics'] = stats
+        if st.button("Analyze Batch", type="primary", use_container_width=True):
+            if not items:
+                st.warning("Please provide URLs or upload articles first")
+            elif len(items) > config.BATCH_MAX_ITEMS:
+                st.warning(f"Batches are limited to {config.BATCH_MAX_ITEMS} articles")
+            else:
+                analyze_batch(items, target_lang, options, num_sentences)
         
-        # Sentence-level sentiment
-        if "Sentiment Analysis" in options:
-            sentence_sentiments = utils['analyzer'].analyze_sentence_sentiments(analysis_text)
-            results['sentence_sentiments'] = sentence_sentiments
+        if st.session_state.batch_jobs:
+            show_batch_status()
+    
+    if st.session_state.batch_results:
+        display_batch_results(st.session_state.batch_results)
+
+
+def collect_batch_items(urls, uploads):
+    """Turn the batch inputs into a list of {'url'} or {'text', 'title'} items"""
+    
+    items = [{'url': url.strip()} for url in urls.splitlines() if url.strip()]
+    
+    for upload in uploads or []:
+        if upload.name.lower().endswith('.csv'):
+            frame = pd.read_csv(upload)
+            for row in frame.to_dict('records'):
+                if isinstance(row.get('url'), str) and row['url'].strip():
+                    items.append({'url': row['url'].strip()})
+                elif isinstance(row.get('text'), str) and row['text'].strip():
+                    items.append({'text': row['text'], 'title': str(row.get('title') or '')})
+        else:
+            text = upload.getvalue().decode('utf-8', errors='replace')
+            if text.strip():
+                items.append({'text': text, 'title': upload.name.rsplit('.', 1)[0]})
+    
+    return items
+
+
+def analyze_batch(items, target_lang, options, num_sentences):
+    """Submit every batch item to the background workers"""
+    
+    for job_id, _ in st.session_state.batch_jobs:
+        jobs.cancel(job_id)
+        jobs.forget(job_id)
+    
+    pipeline = utils['pipeline']
+    batch_jobs = []
+    for item in items:
+        kwargs = {'target_language': target_lang, 'options': options, 'num_sentences': num_sentences}
+        if 'url' in item:
+            job_id = jobs.submit(pipeline.analyze_url, item['url'], **kwargs)
+            batch_jobs.append((job_id, item['url']))
+        else:
+            job_id = jobs.submit(pipeline.analyze, item['text'], title=item['title'], **kwargs)
+            batch_jobs.append((job_id, item['title'] or f"Text {len(batch_jobs) + 1}"))
+    
+    st.session_state.batch_jobs = batch_jobs
+    st.session_state.batch_results = None
+
+
+def show_batch_status():
+    """Poll the batch jobs and collect all results once every job finished"""
+    
+    statuses = [(job_id, label, jobs.status(job_id)) for job_id, label in st.session_state.batch_jobs]
+    done = sum(1 for _, _, status in statuses if status is None or status['status'] in JobManager.FINISHED)
+    
+    if done < len(statuses):
+        st.progress(done / len(statuses), text=f"⏳ Analyzed {done} of {len(statuses)} articles")
+        
+        if st.button("Cancel Batch"):
+            for job_id, _, _ in statuses:
+                jobs.cancel(job_id)
+            st.rerun()
+        
+        time.sleep(config.JOB_POLL_INTERVAL * 4)
+        st.rerun()
+    
+    results = []
+    failures = []
+    for job_id, label, status in statuses:
+        result = jobs.result(job_id)
+        if result is not None:
+            results.append(result)
+        else:
+            failures.append((label, status['error'] if status else 'expired'))
+        jobs.forget(job_id)
+    
+    st.session_state.batch_jobs = []
+    st.session_state.batch_results = results
+    st.success(f"✅ Analyzed {len(results)} of {len(statuses)} articles")
+    
+    if failures:
+        with st.expander(f"❌ {len(failures)} articles failed"):
+            for label, error in failures:
+                st.markdown(f"- **{label}**: {error or 'cancelled'}")
+
+
+def display_batch_results(results):
+    """Display aggregate metrics over a batch of analysis results"""
+    
+    st.markdown("---")
+    st.header("📊 Batch Results")
+    
+    articles = results_frame(results)
+    keywords = keyword_frame(results, articles)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Articles", len(articles))
+    with col2:
+        st.metric("Sources", articles['source'].nunique())
+    with col3:
+        st.metric("Mean Polarity", f"{articles['polarity'].mean():.3f}" if articles['polarity'].notna().any() else "—")
+    
+    tabs = st.tabs(["Sentiment", "Keywords", "Topics", "Sources", "Articles"])
+    
+    # Sentiment distribution
+    with tabs[0]:
+        if articles['sentiment'].notna().any():
+            col1, col2 = st.columns(2)
+            with col1:
+                counts = articles['sentiment'].value_counts()
+                fig = px.pie(values=counts.values, names=counts.index, title="Sentiment Distribution")
+                st.plotly_chart(fig, use_container_width=True)
+            with col2:
+                fig = px.histogram(articles, x='polarity', nbins=20, title="Polarity Distribution")
+                st.plotly_chart(fig, use_container_width=True)
+            
+            distribution = sentiment_distribution(articles)
+            fig = px.bar(distribution, barmode='stack', title="Sentiment by Source",
+                         labels={'value': 'Articles', 'source': 'Source'})
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Sentiment analysis not performed. Enable in analysis options.")
+    
+    # Keyword trends
+    with tabs[1]:
+        if not keywords.empty:
+            trends = keyword_trends(keywords).reset_index()
+            fig = px.bar(trends, x='keyword', y='articles', hover_data=['total'],
+                         title="Keywords Shared Across Articles",
+                         labels={'keyword': 'Keyword', 'articles': 'Articles'})
+            st.plotly_chart(fig, use_container_width=True)
+            
+            by_source = keywords[keywords['keyword'].isin(trends['keyword'])].pivot_table(
+                index='keyword', columns='source', values='count', aggfunc='sum', fill_value=0
+            )
+            st.dataframe(by_source, use_container_width=True)
+        else:
+            st.info("Keywords not extracted. Enable in analysis options.")
     
-    st.session_state.analysis_results = results
-    st.success("✅ Analysis complete!")
+    # Topic clusters
+    with tabs[2]:
+        if not keywords.empty and len(articles) > 1:
+            # A slider needs min_value < max_value, so two articles get two topics
+            num_topics = 2
+            if len(articles) > 2:
+                num_topics = st.slider(
+                    "Topics:",
+                    min_value=2,
+                    max_value=min(20, len(articles)),
+                    value=min(config.CLUSTER_COUNT, len(articles)),
+                    help="Number of clusters the articles are grouped into by their keywords"
+                )
+            clusters, clusterer = cluster_results(results, num_topics)
+            articles['topic'] = [clusterer.label(cluster) for cluster in clusters]
+            
+            topics = topic_summary(articles).reset_index()
+            fig = px.bar(topics, x='articles', y='topic', orientation='h', color='mean_polarity',
+                         color_continuous_scale='RdYlGn', range_color=[-1, 1],
+                         title="Articles per Topic",
+                         labels={'articles': 'Articles', 'topic': 'Topic', 'mean_polarity': 'Polarity'})
+            st.plotly_chart(fig, use_container_width=True)
+            st.dataframe(topics.round(3), use_container_width=True, hide_index=True)
+        else:
+            st.info("Topics need keywords of at least two articles. Enable Keywords in analysis options.")
+    
+    # Per-source statistics
+    with tabs[3]:
+        st.dataframe(source_statistics(articles).round(3), use_container_width=True)
+    
+    # Article table
+    with tabs[4]:
+        st.dataframe(articles.drop(columns='doc_id').round(3), use_container_width=True, hide_index=True)
+        st.download_button(
+            "Download CSV",
+            articles.to_csv(index=False),
+            file_name="batch_results.csv",
+            mime="text/csv"
+        )
+
+
+def load_text(ref, end=None):
+    """Load article text referenced by the results from the shared text store"""
+    
+    text = utils['text_store'].get(ref, end=end)
+    if text is None:
+        return "_Text is no longer available. Please run the analysis again._"
+    if end is not None and ref['length'] > end:
+        text += "..."
+    return text
+
+
+def show_stored_text(ref, key):
+    """Show a preview of stored text and load the rest only on request"""
+    
+    st.caption(f"{ref['length']:,} characters")
+    if ref['length'] > TEXT_PREVIEW_CHARS and not st.toggle("Show full text", key=key):
+        st.write(load_text(ref, TEXT_PREVIEW_CHARS))
+    else:
+        st.write(load_text(ref))
 
 
 def display_results(results):
@@ -234,8 +582,33 @@ def display_results(results):
     if 'detected_language' in results:
         st.info(f"🌍 **Detected Language:** {results['detected_language']['language_name']}")
     
+    if 'truncated' in results:
+        truncated = results['truncated']
+        st.warning(f"✂️ Document shortened from {truncated['original_chars']:,} to "
+                   f"{truncated['analyzed_chars']:,} characters ({truncated['strategy']}) "
+                   f"by the {results.get('profile', 'current')} profile")
+    
+    if 'sampling' in results:
+        sampling = results['sampling']
+        st.warning(f"≈ Sentiment and keywords estimated from {sampling['sampled_sentences']:,} of "
+                   f"{sampling['sentences']:,} sentences ({sampling['strategy']} sample)")
+    
+    language = results.get('analysis_language', 'en')
+    language_name = config.SUPPORTED_LANGUAGES.get(language, language)
+    sentiment = results.get('sentiment', {})
+    if results.get('translation', {}).get('reason') == 'lexicon_coverage':
+        source = results.get('detected_language', {}).get('language_name', 'source language')
+        st.info(f"🌐 Translated to English for analysis: the {source} sentiment lexicon "
+                f"knows too few of the article's words")
+    elif sentiment.get('approximate'):
+        st.warning(f"≈ Sentiment scored natively in {language_name} from a lexicon that knows only "
+                   f"{sentiment['lexicon_coverage']:.0%} of the article's content words; "
+                   f"enable translation for a reliable score")
+    elif language != 'en' and 'translation' not in results:
+        st.caption(f"Analyzed natively in {language_name}, no translation needed")
+    
     # Create tabs for different results
-    tabs = st.tabs(["Summary", "Sentiment", "Keywords", "Statistics", "Detailed"])
+    tabs = st.tabs(["Summary", "Sentiment", "Keywords", "Statistics", "Detailed", "Performance"])
     
     # Summary Tab
     with tabs[0]:
@@ -248,8 +621,11 @@ def display_results(results):
                 for point in results['bullet_points']:
                     st.markdown(point)
             
-            st.caption(f"Condensed from {results['summary']['original_sentences']} to "
-                      f"{results['summary']['summary_sentences']} sentences")
+            if results['summary']['method'] == 'abstractive':
+                st.caption(f"Generated by {results['summary']['model']}")
+            else:
+                st.caption(f"Condensed from {results['summary']['original_sentences']} to "
+                          f"{results['summary']['summary_sentences']} sentences")
         else:
             st.info("Summary not generated. Enable in analysis options.")
     
@@ -299,15 +675,70 @@ def display_results(results):
             if 'sentence_sentiments' in results and results['sentence_sentiments']:
                 st.subheader("Sentiment Over Sentences")
                 
-                sentiment_data = pd.DataFrame(results['sentence_sentiments'])
-                if not sentiment_data.empty:
-                    fig = px.line(
-                        sentiment_data,
-                        y='polarity',
-                        title='Sentiment Flow',
-                        labels={'index': 'Sentence', 'polarity': 'Sentiment Polarity'}
+                sentence_sentiments = results['sentence_sentiments']
+                start, end = 0, len(sentence_sentiments)
+                
+                # Long documents: pick a range to drill into, the server aggregates the rest
+                if len(sentence_sentiments) > config.CHART_MAX_POINTS:
+                    start, end = st.slider(
+                        "Sentence range:",
+                        min_value=0,
+                        max_value=len(sentence_sentiments),
+                        value=(0, len(sentence_sentiments)),
+                        help="Narrow the range to see individual sentences"
+                    )
+                
+                series = sentiment_series(sentence_sentiments, start, end)
+                
+                fig = go.Figure()
+                fig.add_trace(go.Scattergl(
+                    x=series['index'],
+                    y=series['polarity'],
+                    mode='lines',
+                    name='Min/Max' if series['decimated'] else 'Polarity',
+                    hovertext=(
+                        None if series['decimated']
+                        else [sentence_sentiments[i]['sentence'] for i in series['index']]
+                    )
+                ))
+                fig.add_trace(go.Scattergl(
+                    x=series['mean_index'],
+                    y=series['mean'],
+                    mode='lines',
+                    name='Mean' if series['decimated'] else 'Rolling Mean'
+                ))
+                fig.update_layout(
+                    title='Sentiment Flow',
+                    xaxis_title='Sentence',
+                    yaxis_title='Sentiment Polarity'
+                )
+                fig.add_hline(y=0, line_dash="dash", line_color="gray")
+                st.plotly_chart(fig, use_container_width=True)
+                
+                if series['decimated']:
+                    st.caption(f"Showing {len(series['index']):,} aggregated points for "
+                               f"{end - start:,} sentences. Narrow the range for sentence-level detail.")
+            
+            # Sentiment towards keywords and entities
+            if 'aspect_sentiments' in results:
+                aspects = results['aspect_sentiments']
+                terms = aspects['entities'] + aspects['keywords']
+                if terms:
+                    st.subheader("Sentiment by Term")
+                    
+                    terms_df = pd.DataFrame(terms).head(20)
+                    fig = px.bar(
+                        terms_df.iloc[::-1],
+                        x='polarity',
+                        y='term',
+                        color='polarity',
+                        color_continuous_scale='RdYlGn',
+                        range_color=[-1, 1],
+                        orientation='h',
+                        hover_data=['type', 'mentions', 'positive', 'negative'],
+                        title='Average Polarity of Sentences Mentioning Each Term'
                     )
-                    fig.add_hline(y=0, line_dash="dash", line_color="gray")
+                    fig.update_layout(height=max(300, 25 * len(terms_df)))
                     st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("Sentiment analysis not performed. Enable in analysis options.")
@@ -341,6 +772,37 @@ def display_results(results):
                 st.info("No keywords extracted")
         else:
             st.info("Keyword extraction not performed. Enable in analysis options.")
+        
+        if 'entities' in results:
+            st.subheader("🏷️ Named Entities")
+            
+            entities = results['entities']
+            if entities['entities']:
+                entities_df = pd.DataFrame(entities['entities'])[['entity', 'type', 'count']]
+                entities_df.columns = ['Entity', 'Type', 'Mentions']
+                
+                col1, col2 = st.columns([1, 1])
+                
+                with col1:
+                    st.dataframe(entities_df, use_container_width=True, hide_index=True)
+                
+                with col2:
+                    fig = px.bar(
+                        entities_df.head(10),
+                        x='Mentions',
+                        y='Entity',
+                        color='Type',
+                        orientation='h',
+                        title='Top Entities'
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                
+                if entities['method'] == 'heuristic':
+                    st.caption("Detected from capitalization; configure NER_MODEL with transformers installed for model-based entities")
+            elif entities['method'] == 'unsupported':
+                st.info("Entity detection needs an NER model for this language; configure NER_MODEL with transformers installed")
+            else:
+                st.info("No named entities found")
     
     # Statistics Tab
     with tabs[3]:
@@ -377,6 +839,11 @@ def display_results(results):
                 title='Content Metrics'
             )
             st.plotly_chart(fig, use_container_width=True)
+            
+            if 'vocabulary_size' in stats:
+                st.caption(f"≈ {stats['vocabulary_size']:,} distinct words "
+                           f"(type-token ratio {stats['type_token_ratio']:.3f}), "
+                           f"streamed in constant memory")
         else:
             st.info("Statistics not generated. Enable in analysis options.")
     
@@ -389,10 +856,85 @@ def display_results(results):
                 st.write(f"**Source Language:** {results['translation']['source_language']}")
                 st.write(f"**Target Language:** {results['translation']['target_language']}")
                 st.write(f"**Translated Text:**")
-                st.write(results['translation']['translated_text'])
+                show_stored_text(results['translation']['translated_text_ref'], 'full_translation')
         
         with st.expander("📄 Original Text"):
-            st.write(results['original_text'])
+            show_stored_text(results['original_text_ref'], 'full_original')
+    
+    # Performance Tab
+    with tabs[5]:
+        if 'performance' in results:
+            st.subheader("⏱️ Performance")
+            
+            performance = results['performance']
+            st.metric("Total Time", f"{performance['total_seconds']:.2f} s")
+            
+            if performance['stages']:
+                stages_df = pd.DataFrame(performance['stages'])
+                fig = px.bar(
+                    stages_df,
+                    x='seconds',
+                    y='stage',
+                    orientation='h',
+                    title='Time per Stage',
+                    labels={'seconds': 'Seconds', 'stage': 'Stage'}
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            
+            if performance['calls']:
+                calls_df = pd.DataFrame([
+                    {'Operation': name, 'Calls': call['calls'], 'Seconds': round(call['seconds'], 4)}
+                    for name, call in performance['calls'].items()
+                ])
+                st.dataframe(calls_df, use_container_width=True)
+            
+            if 'memory_peak_bytes' in performance:
+                st.metric(
+                    "Peak Memory (process)",
+                    f"{performance['memory_peak_bytes'] / 1024 / 1024:.1f} MB",
+                    help="Peak of all memory traced in this process while the analysis ran"
+                )
+                if performance.get('memory_peak_shared'):
+                    st.caption("Other memory-profiled analyses ran at the same time and share this peak")
+            
+            if 'cpu_profile' in performance:
+                with st.expander("🔬 CPU Profile"):
+                    st.code(performance['cpu_profile'])
+            
+            with st.expander("🧠 Resident Resources"):
+                report = resources.report()
+                memory = report['memory']
+                cols = st.columns(3)
+                cols[0].metric("Resident Memory", f"{memory['rss_bytes'] / 1024 / 1024:.1f} MB")
+                if 'shared_bytes' in memory:
+                    cols[1].metric("Shared", f"{memory['shared_bytes'] / 1024 / 1024:.1f} MB")
+                    cols[2].metric("Private", f"{memory['private_bytes'] / 1024 / 1024:.1f} MB")
+                st.dataframe(pd.DataFrame([
+                    {
+                        'Resource': name,
+                        'Loaded': status['loaded'],
+                        'Seconds': round(status.get('seconds', 0.0), 3),
+                        'Memory (MB)': round(status.get('rss_delta_bytes', 0) / 1024 / 1024, 1),
+                        'Error': status.get('error') or ''
+                    }
+                    for name, status in report['resources'].items()
+                ]), use_container_width=True)
+            
+            with st.expander("📤 Export Metrics"):
+                st.download_button(
+                    "Download JSON",
+                    metrics.to_json(),
+                    file_name="metrics.json",
+                    mime="application/json"
+                )
+                st.download_button(
+                    "Download Prometheus",
+                    metrics.to_prometheus(),
+                    file_name="metrics.prom",
+                    mime="text/plain"
+                )
+        else:
+            st.info("No performance data available.")
 
 
 if __name__ == "__main__":
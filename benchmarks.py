@@ -0,0 +1,317 @@
+"""
+Benchmark Suite for AGEonT-st System
+Times the analysis utilities on reproducible synthetic documents and
+compares the results against a saved baseline
+
+Usage:
+    python benchmarks.py                    # run and compare with baseline
+    python benchmarks.py --save-baseline    # run and store a new baseline
+    python benchmarks.py --sizes short medium --threshold 0.25
+"""
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+BASELINE_FILE = 'benchmark_baseline.json'
+
+# Document sizes in sentences, with the number of timed repeats for each
+CORPUS_SIZES = {
+    'short': (12, 15),
+    'medium': (150, 7),
+    'book': (6000, 3)
+}
+
+VOCABULARY = [
+    'research', 'analysis', 'market', 'government', 'climate', 'energy', 'policy',
+    'economy', 'technology', 'growth', 'study', 'results', 'report', 'science',
+    'health', 'system', 'network', 'model', 'data', 'future', 'global', 'local',
+    'increase', 'decline', 'improve', 'support', 'challenge', 'problem', 'success',
+    'failure', 'strong', 'weak', 'excellent', 'terrible', 'positive', 'negative',
+    'important', 'significant', 'remarkable', 'difficult', 'the', 'a', 'of', 'and',
+    'to', 'in', 'is', 'was', 'that', 'for', 'with', 'on', 'by', 'from', 'this', 'new'
+]
+
+CJK_VOCABULARY = [
+    '研究', '分析', '市场', '政府', '气候', '能源', '政策', '经济', '技术', '增长',
+    '报告', '科学', '健康', '系统', '网络', '模型', '数据', '未来', '全球', '人工智能',
+    '的', '了', '在', '是', '和', '有', '这个', '我们', '非常', '重要'
+]
+
+# News-style sentences for measuring the fast tokenizer against NLTK
+AGREEMENT_SENTENCES = [
+    "The U.S. economy grew 3.5% in the second quarter, the Commerce Department said on Thursday.",
+    "\"We don't expect rates to fall this year,\" said Dr. Jane O'Neil, chief economist at ABC Corp.",
+    "Shares of AT&T rose $1.25, or 4%, to $32.10 in early trading.",
+    "It's the company's third acquisition since Jan. 2021 -- and probably not its last.",
+    "Officials couldn't confirm whether the 1,200-page report would be released before 5:30 p.m.",
+    "The well-known researcher (who asked not to be named) said the results were \"remarkable.\"",
+    "They'll meet again next week; no agenda has been published yet.",
+    "Why would anyone vote against it?! Nobody knows.",
+    "The model, trained on 1.5 billion words, outperforms GPT-2 on 7 of 9 benchmarks.",
+    "Prices in the U.K. and the E.U. fell by 0.3 and 0.5 percent, respectively.",
+    "\"I'm not sure,\" she said. \"Maybe we'll find out tomorrow.\"",
+    "You cannot simply ignore the data, and we're gonna prove it.",
+    "The CEO's statement -- released late Friday -- didn't address the layoffs.",
+    "Temperatures reached 45°C in parts of Spain, Portugal and southern France.",
+    "The 'green transition' will cost an estimated €2.3 trillion by 2030.",
+    "Contact the press office at press@example.com or call +1 (555) 123-4567.",
+    "Read the full report at https://example.com/reports/2023/climate.pdf for details.",
+    "Mr. and Mrs. Smith arrived at 10:15 a.m. on Monday, Oct. 3.",
+    "Revenue was up 12% year-on-year; operating margin, however, shrank to 8.4%.",
+    "The bill passed 52-48 in the Senate after a 14-hour debate.",
+    "Scientists aren't yet sure why the effect disappears at higher temperatures...",
+    "Isn't it strange that nobody noticed?",
+    "The study's authors say their findings \"should be interpreted with caution\".",
+    "Analysts at Goldman Sachs & Co. expect growth of 2-3% next year.",
+    "Some 40,000 people attended the rally, according to police estimates.",
+    "\"This is a historic day,\" the minister told reporters [in Brussels].",
+    "The team's new AI system can translate between 200 languages in real time.",
+    "Critics say the plan won't work, but supporters aren't worried.",
+    "Ticket prices start at $49.99 (plus fees) for general admission.",
+    "Q3 earnings beat expectations: EPS came in at $2.14 vs. $1.98 forecast.",
+]
+
+
+def make_document(num_sentences, seed=42):
+    """
+    Generate a reproducible synthetic article
+
+    Args:
+        num_sentences (int): Number of sentences to generate
+        seed (int): Random seed
+
+    Returns:
+        str: Generated text
+    """
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(num_sentences):
+        words = rng.choices(VOCABULARY, k=rng.randint(8, 28))
+        sentence = ' '.join(words)
+        sentences.append(sentence[0].upper() + sentence[1:] + rng.choice(['.', '.', '.', '!', '?']))
+    return ' '.join(sentences)
+
+
+def make_cjk_document(num_sentences, seed=42):
+    """Generate a reproducible synthetic Chinese article without spaces"""
+    rng = random.Random(seed)
+    return ''.join(
+        ''.join(rng.choices(CJK_VOCABULARY, k=rng.randint(8, 28))) + rng.choice(['。', '。', '！', '？'])
+        for _ in range(num_sentences)
+    )
+
+
+def split_document(text):
+    """Split a generated document into its sentences"""
+    return re.split(r'(?<=[.!?]) ', text)
+
+
+def make_html(text):
+    """Wrap generated text in a representative HTML page"""
+    paragraphs = ''.join(f"<p>{chunk}</p>\n" for chunk in text.split('. '))
+    return (
+        "<html><head><title>Benchmark</title><style>p {margin: 0}</style>"
+        "<script>var x = 1;</script></head><body><nav>Home | News</nav>"
+        f"<article>{paragraphs}</article><footer>Footer</footer></body></html>"
+    )
+
+
+class OfflineTranslator:
+    """Translator stand-in so pipeline timings exclude network latency"""
+
+    def detect_language(self, text):
+        return {
+            'success': True,
+            'language_code': 'en',
+            'language_name': 'English',
+            'confidence': 1.0
+        }
+
+    def translate_text(self, text, target_language='en', source_language='auto'):
+        return {'success': False, 'error': 'Translation disabled in benchmarks'}
+
+
+def time_call(func, repeats):
+    """
+    Time a callable
+
+    Args:
+        func (callable): Function to call without arguments
+        repeats (int): Number of timed runs
+
+    Returns:
+        dict: Minimum and median duration in seconds
+    """
+    func()  # warm-up
+    durations = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+    return {
+        'min_seconds': min(durations),
+        'median_seconds': statistics.median(durations),
+        'repeats': repeats
+    }
+
+
+def parse_with_newspaper(html):
+    """Previous fetch path: newspaper builds its own tree from the page"""
+    from newspaper import Article
+
+    article = Article('https://example.com/benchmark')
+    article.download(input_html=html)
+    article.parse()
+    return article.text
+
+
+def build_cases(size):
+    """Build the benchmark cases for one document size"""
+    from utils import ArticleFetcher, ContentAnalyzer, TextSummarizer, AnalysisPipeline
+    from utils.article_fetcher import parse_article_html
+    from utils.tokens import TokenStream
+    from utils.tokenizers import fast_tokenize, treebank_tokenize
+
+    num_sentences, _ = CORPUS_SIZES[size]
+    text = make_document(num_sentences)
+    html = make_html(text)
+    cjk_text = make_cjk_document(num_sentences)
+    sentences = split_document(text) + AGREEMENT_SENTENCES
+
+    fetcher = ArticleFetcher()
+    analyzer = ContentAnalyzer()
+    summarizer = TextSummarizer()
+    pipeline = AnalysisPipeline(fetcher, OfflineTranslator(), analyzer, summarizer)
+    options = ["Sentiment Analysis", "Summarization", "Keywords", "Statistics"]
+
+    return {
+        'extract_text_from_html': lambda: fetcher.extract_text_from_html(html),
+        'parse_article_html': lambda: parse_article_html(html, 'https://example.com/benchmark'),
+        'newspaper_parse': lambda: parse_with_newspaper(html),
+        'analyze_sentiment': lambda: analyzer.analyze_sentiment(text),
+        'extract_keywords': lambda: analyzer.extract_keywords(text, 15),
+        'get_text_statistics': lambda: analyzer.get_text_statistics(text),
+        'analyze_sentence_sentiments': lambda: analyzer.analyze_sentence_sentiments(text),
+        'extractive_summarize': lambda: summarizer.extractive_summarize(text, 3),
+        'bullet_point_summary': lambda: summarizer.bullet_point_summary(text, 5),
+        'analyze_article': lambda: pipeline.analyze(text, 'Benchmark', 'en', options, 3),
+        'tokenize_cjk': lambda: TokenStream.from_text(cjk_text, 'zh-cn'),
+        'word_tokenize_nltk': lambda: [treebank_tokenize(sentence) for sentence in sentences],
+        'word_tokenize_fast': lambda: [fast_tokenize(sentence) for sentence in sentences]
+    }
+
+
+def report_tokenizer_agreement(sizes):
+    """Print how often the fast tokenizer reproduces NLTK's tokens"""
+    from utils.tokenizers import tokenizer_agreement
+
+    for name, sentences in [('news', AGREEMENT_SENTENCES)] + [
+        (size, split_document(make_document(CORPUS_SIZES[size][0]))) for size in sizes
+    ]:
+        agreement = tokenizer_agreement(sentences)
+        print(f"  {name:<10} {agreement['sentences'] * 100:>6.1f}% sentences identical, "
+              f"{agreement['tokens'] * 100:>6.1f}% tokens ({agreement['count']} sentences)")
+
+
+def run_benchmarks(sizes):
+    """
+    Run all benchmark cases for the requested sizes
+
+    Returns:
+        dict: Timings keyed by "<case>[<size>]"
+    """
+    results = {}
+    for size in sizes:
+        _, repeats = CORPUS_SIZES[size]
+        for name, func in build_cases(size).items():
+            key = f"{name}[{size}]"
+            results[key] = time_call(func, repeats)
+            print(f"  {key:<45} {results[key]['min_seconds'] * 1000:>10.2f} ms")
+    return results
+
+
+def compare_with_baseline(results, baseline, threshold):
+    """
+    Compare timings with a baseline
+
+    Args:
+        results (dict): Current timings
+        baseline (dict): Baseline timings
+        threshold (float): Allowed relative slowdown, e.g. 0.2 for 20%
+
+    Returns:
+        list: Names of regressed benchmarks
+    """
+    regressions = []
+    for key, current in results.items():
+        if key not in baseline:
+            print(f"  ? {key:<45} no baseline")
+            continue
+
+        before = baseline[key]['min_seconds']
+        after = current['min_seconds']
+        change = (after - before) / before if before > 0 else 0.0
+        regressed = change > threshold
+        status = "✗" if regressed else "✓"
+        print(f"  {status} {key:<45} {change * 100:>+8.1f}%")
+        if regressed:
+            regressions.append(key)
+    return regressions
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="AGEonT-st benchmark suite")
+    parser.add_argument('--sizes', nargs='+', choices=list(CORPUS_SIZES), default=list(CORPUS_SIZES))
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="Baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true', help="Store results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Allowed relative slowdown")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("AGEonT-st Benchmark Suite")
+    print("=" * 60)
+
+    results = run_benchmarks(args.sizes)
+
+    print("\nFast tokenizer agreement with NLTK word_tokenize")
+    report_tokenizer_agreement(args.sizes)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\n✅ Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠️  No baseline found at {args.baseline}. Run with --save-baseline first.")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    print("\n" + "=" * 60)
+    print(f"Comparison with baseline (threshold {args.threshold * 100:.0f}%)")
+    print("=" * 60)
+    regressions = compare_with_baseline(results, baseline, args.threshold)
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) regressed beyond the threshold")
+        return 1
+
+    print("\n🎉 No performance regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,90 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Pipeline Profiles
+# Each profile trades analysis quality for throughput. Individual settings
+# below can still be overridden by their own environment variables.
+PIPELINE_PROFILES = {
+    "fast": {
+        "tokenizer": "fast",
+        "summarizer": "extractive",
+        "translation": "off",
+        "max_document_chars": 200000,
+        "truncation": "head",
+        "max_sentences": 500,
+        "sampling": "stratified",
+        "job_workers": 8,
+        "api_workers": 4,
+        "bulk_parse_workers": 0
+    },
+    "balanced": {
+        "tokenizer": "nltk",
+        "summarizer": "extractive",
+        "translation": "google",
+        "max_document_chars": 2000000,
+        "truncation": "head_tail",
+        "max_sentences": 3000,
+        "sampling": "stratified",
+        "job_workers": 4,
+        "api_workers": 2,
+        "bulk_parse_workers": 0
+    },
+    "thorough": {
+        "tokenizer": "nltk",
+        "summarizer": "abstractive",
+        "translation": "google",
+        "max_document_chars": 0,
+        "truncation": "head_tail",
+        "max_sentences": 0,
+        "sampling": "stratified",
+        "job_workers": 2,
+        "api_workers": 1,
+        "bulk_parse_workers": 0
+    }
+}
+
+
+def _load_profile(name, path):
+    """
+    Resolve a pipeline profile from the built-in presets and a TOML file
+
+    The file may select a profile with a top-level ``profile = "name"`` and
+    define or adjust profiles in ``[profiles.<name>]`` tables. A table can
+    start from another profile with ``extends = "fast"``, otherwise missing
+    settings come from "balanced".
+
+    Args:
+        name (str): Profile name, overrides the file's selection when set
+        path (str): Path of a TOML profile file, or empty
+
+    Returns:
+        tuple: (profile name, settings dict)
+    """
+    profiles = {key: dict(value) for key, value in PIPELINE_PROFILES.items()}
+    if path:
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+        name = name or data.get("profile")
+        for key, overrides in data.get("profiles", {}).items():
+            overrides = dict(overrides)
+            base = profiles.get(overrides.pop("extends", key), profiles["balanced"])
+            profiles[key] = {**base, **overrides}
+
+    name = name or "balanced"
+    if name not in profiles:
+        raise ValueError(f"Unknown pipeline profile '{name}', expected one of {sorted(profiles)}")
+    return name, profiles[name]
+
+
+PIPELINE_PROFILE, PROFILE = _load_profile(
+    os.getenv("PIPELINE_PROFILE", ""),
+    os.getenv("PIPELINE_PROFILE_FILE", "")
+)
+
 # Application Settings
 APP_TITLE = "AGEonT-st: AI-Powered Article & News Insights"
 APP_ICON = "🔍"
@@ -34,7 +118,101 @@ MIN_SUMMARY_LENGTH = int(os.getenv("MIN_SUMMARY_LENGTH", "50"))
 # Analysis Settings
 SENTIMENT_THRESHOLD_POSITIVE = 0.1
 SENTIMENT_THRESHOLD_NEGATIVE = -0.1
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "8"))
+INCREMENTAL_CACHE_SIZE = int(os.getenv("INCREMENTAL_CACHE_SIZE", "5000"))
+# Extra <code>.tsv sentiment lexicons and stopwords/<code>.txt lists
+LEXICON_DIR = os.getenv("LEXICON_DIR", "")
+# Share of content words a language's lexicon must score for native sentiment;
+# below it the text is translated to English first (or marked approximate)
+LEXICON_MIN_COVERAGE = float(os.getenv("LEXICON_MIN_COVERAGE", "0.05"))
+# Word tokenizer for non-CJK text: "nltk" (Treebank) or "fast" (single regex scan)
+TOKENIZER = os.getenv("TOKENIZER") or PROFILE["tokenizer"]
+# Summaries: "extractive" (sentence ranking) or "abstractive" (transformers model)
+SUMMARIZER = os.getenv("SUMMARIZER") or PROFILE["summarizer"]
+SUMMARIZER_MODEL = os.getenv("SUMMARIZER_MODEL", "facebook/bart-large-cnn")
+# Translation backend: "google" or "off" to always analyze in the source language
+TRANSLATION = os.getenv("TRANSLATION") or PROFILE["translation"]
+# Longest text analyzed (0 = no limit) and which part to keep: "head", "tail" or "head_tail"
+MAX_DOCUMENT_CHARS = int(os.getenv("MAX_DOCUMENT_CHARS") or PROFILE["max_document_chars"])
+TRUNCATION = os.getenv("TRUNCATION") or PROFILE["truncation"]
+# Sentences scored for sentiment and keywords (0 = all) and how longer texts are
+# sampled: "head", "tail" or "stratified" (evenly across the document)
+MAX_ANALYSIS_SENTENCES = int(os.getenv("MAX_ANALYSIS_SENTENCES") or PROFILE["max_sentences"])
+SENTENCE_SAMPLING = os.getenv("SENTENCE_SAMPLING") or PROFILE["sampling"]
+# Texts longer than this get constant-memory, approximate statistics
+STREAMING_STATS_MIN_CHARS = int(os.getenv("STREAMING_STATS_MIN_CHARS", "1000000"))
+# Hard limit: longer texts are rejected instead of truncated
+MAX_INPUT_CHARS = int(os.getenv("MAX_INPUT_CHARS", "10000000"))
+# Chinese word segmentation: "auto" uses jieba when installed, "bigram" never does
+CHINESE_SEGMENTER = os.getenv("CHINESE_SEGMENTER", "auto")
+
+# Resource Preloading Settings
+# Resources loaded at startup: punkt, stopwords, textblob, lexicons, tokenizers, jieba
+PRELOAD_RESOURCES = [
+    name.strip() for name in os.getenv("PRELOAD_RESOURCES", "punkt,stopwords,textblob,lexicons,tokenizers").split(",")
+    if name.strip()
+]
+# Transformer pipelines loaded at startup, as comma-separated "task" or "task=model" entries
+TRANSFORMER_MODELS = [
+    tuple(part.strip() for part in entry.split("=", 1)) if "=" in entry else (entry.strip(), None)
+    for entry in os.getenv("TRANSFORMER_MODELS", "").split(",")
+    if entry.strip()
+]
+
+# Chart Settings
+CHART_MAX_POINTS = int(os.getenv("CHART_MAX_POINTS", "2000"))
 
 # Article Fetching Settings
 REQUEST_TIMEOUT = 30
+MAX_DOWNLOAD_BYTES = int(os.getenv("MAX_DOWNLOAD_BYTES", str(20 * 1024 * 1024)))
+FETCH_POOL_SIZE = int(os.getenv("FETCH_POOL_SIZE", "10"))
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Bulk Fetching Settings (0 parse workers = one per CPU)
+BULK_PARSE_WORKERS = int(os.getenv("BULK_PARSE_WORKERS") or PROFILE["bulk_parse_workers"])
+BULK_MAX_DOWNLOADS = int(os.getenv("BULK_MAX_DOWNLOADS", "16"))
+BULK_QUEUE_SIZE = int(os.getenv("BULK_QUEUE_SIZE", "32"))
+
+# Feed Polling Settings
+FEED_STATE_DIR = os.getenv("FEED_STATE_DIR", ".feeds")
+FEED_POLL_INTERVAL = int(os.getenv("FEED_POLL_INTERVAL", "300"))
+FEED_POLL_WORKERS = int(os.getenv("FEED_POLL_WORKERS", "8"))
+
+# Background Job Settings
+JOB_WORKERS = int(os.getenv("JOB_WORKERS") or PROFILE["job_workers"])
+JOB_RESULT_TTL = int(os.getenv("JOB_RESULT_TTL", "3600"))
+JOB_POLL_INTERVAL = 0.25
+
+# Text Store Settings
+TEXT_STORE_MAX_BYTES = int(os.getenv("TEXT_STORE_MAX_BYTES", str(64 * 1024 * 1024)))
+TEXT_STORE_DIR = os.getenv("TEXT_STORE_DIR", ".text_store")
+TEXT_STORE_SPILL_MAX_BYTES = int(os.getenv("TEXT_STORE_SPILL_MAX_BYTES", str(1024 * 1024 * 1024)))
+TEXT_STORE_SPILL_TTL = int(os.getenv("TEXT_STORE_SPILL_TTL", str(7 * 24 * 3600)))
+
+# Batch Mode Settings
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "100"))
+
+# Named-Entity Settings (an empty model name always uses the capitalization heuristic)
+NER_MODEL = os.getenv("NER_MODEL", "dslim/bert-base-NER")
+NER_BATCH_SIZE = int(os.getenv("NER_BATCH_SIZE", "32"))
+NER_CACHE_SIZE = int(os.getenv("NER_CACHE_SIZE", "5000"))
+
+# Topic Clustering Settings
+CLUSTER_COUNT = int(os.getenv("CLUSTER_COUNT", "8"))
+CLUSTER_FEATURES = int(os.getenv("CLUSTER_FEATURES", str(2 ** 16)))
+CLUSTER_BATCH_SIZE = int(os.getenv("CLUSTER_BATCH_SIZE", "1024"))
+
+# API Settings
+API_HOST = os.getenv("API_HOST", "0.0.0.0")
+API_PORT = int(os.getenv("API_PORT", "8000"))
+API_WORKERS = int(os.getenv("API_WORKERS") or PROFILE["api_workers"])
+API_BATCH_SIZE = int(os.getenv("API_BATCH_SIZE", "8"))
+API_BATCH_WAIT = float(os.getenv("API_BATCH_WAIT", "0.01"))
+API_MAX_BATCH_ITEMS = 100
+
+# Export Settings
+EXPORT_ROW_GROUP_SIZE = int(os.getenv("EXPORT_ROW_GROUP_SIZE", "10000"))
+
+# Profiling Settings
+PROFILE_CPU = os.getenv("PROFILE_CPU", "false").lower() == "true"
+PROFILE_MEMORY = os.getenv("PROFILE_MEMORY", "false").lower() == "true"
@@ -210,7 +210,7 @@ def demo_technologies():
         ],
         "Web & Data": [
             "Requests - HTTP library for fetching content",
-            "BeautifulSoup4 - HTML parsing",
+            "lxml - HTML parsing",
             "Newspaper3k - Article extraction",
             "googletrans - Translation service"
         ],
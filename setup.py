@@ -39,11 +39,13 @@ def verify_installation():
     modules = [
         'streamlit',
         'requests',
-        'bs4',
+        'lxml',
+        'defusedxml',
         'newspaper',
         'googletrans',
         'textblob',
         'nltk',
+        'numpy',
         'pandas',
         'plotly'
     ]
@@ -27,6 +27,26 @@ def test_project_structure():
         'utils/translator.py',
         'utils/analyzer.py',
         'utils/summarizer.py',
+        'utils/pipeline.py',
+        'utils/profiler.py',
+        'utils/tokens.py',
+        'utils/jobs.py',
+        'utils/feeds.py',
+        'utils/corpus.py',
+        'utils/exporter.py',
+        'utils/bulk_fetcher.py',
+        'utils/incremental.py',
+        'utils/charting.py',
+        'utils/aggregate.py',
+        'utils/text_store.py',
+        'utils/languages.py',
+        'utils/tokenizers.py',
+        'utils/resources.py',
+        'utils/streaming_stats.py',
+        'utils/clustering.py',
+        'utils/entities.py',
+        'utils/aspects.py',
+        'utils/lexicons/es.tsv',
         '.streamlit/config.toml'
     ]
     
@@ -54,15 +74,36 @@ def test_python_syntax():
     
     python_files = [
         'app.py',
+        'api.py',
         'config.py',
         'setup.py',
         'examples.py',
         'demo.py',
+        'benchmarks.py',
         'utils/__init__.py',
         'utils/article_fetcher.py',
         'utils/translator.py',
         'utils/analyzer.py',
-        'utils/summarizer.py'
+        'utils/summarizer.py',
+        'utils/pipeline.py',
+        'utils/profiler.py',
+        'utils/tokens.py',
+        'utils/jobs.py',
+        'utils/feeds.py',
+        'utils/corpus.py',
+        'utils/exporter.py',
+        'utils/bulk_fetcher.py',
+        'utils/incremental.py',
+        'utils/charting.py',
+        'utils/aggregate.py',
+        'utils/text_store.py',
+        'utils/languages.py',
+        'utils/tokenizers.py',
+        'utils/resources.py',
+        'utils/streaming_stats.py',
+        'utils/clustering.py',
+        'utils/entities.py',
+        'utils/aspects.py'
     ]
     
     all_valid = True
@@ -100,6 +141,9 @@ def test_module_structure():
         ("translator.py contains Translator class", "class Translator" in open('utils/translator.py').read()),
         ("analyzer.py contains ContentAnalyzer class", "class ContentAnalyzer" in open('utils/analyzer.py').read()),
         ("summarizer.py contains TextSummarizer class", "class TextSummarizer" in open('utils/summarizer.py').read()),
+        ("pipeline.py contains AnalysisPipeline class", "class AnalysisPipeline" in open('utils/pipeline.py').read()),
+        ("profiler.py contains RequestProfiler class", "class RequestProfiler" in open('utils/profiler.py').read()),
+        ("jobs.py contains JobManager class", "class JobManager" in open('utils/jobs.py').read()),
         ("app.py contains main function", "def main" in open('app.py').read()),
         ("app.py contains Streamlit imports", "import streamlit" in open('app.py').read()),
     ]
@@ -170,13 +214,13 @@ def test_requirements():
     required_packages = [
         'streamlit',
         'requests',
-        'beautifulsoup4',
         'newspaper3k',
         'transformers',
         'torch',
         'googletrans',
         'textblob',
         'nltk',
+        'numpy',
         'pandas',
         'plotly',
         'python-dotenv'
@@ -257,6 +301,1292 @@ def test_config_files():
         return False
 
 
+def report_checks(tests, success_message, failure_message):
+    """Print named checks and return whether all passed"""
+    all_passed = True
+    for test_name, result in tests:
+        status = "✓" if result else "✗"
+        print(f"{status} {test_name}")
+        if not result:
+            all_passed = False
+    
+    print(f"\n✅ {success_message}" if all_passed else f"\n❌ {failure_message}")
+    return all_passed
+
+
+def test_profiling():
+    """Test that request profiles and metrics record stages and instrumented calls"""
+    print("\n" + "="*60)
+    print("TEST: Profiling")
+    print("="*60)
+    
+    from utils.profiler import MetricsRegistry, RequestProfiler, metrics, timed
+    
+    @timed('tests.profiled_call')
+    def profiled_call(fail=False):
+        if fail:
+            raise ValueError("failed call")
+        return sum(range(1000))
+    
+    before = metrics.snapshot().get('tests.profiled_call', {'calls': 0, 'errors': 0})
+    with RequestProfiler(memory_profile=True) as profiler:
+        with profiler.stage('first'):
+            profiled_call()
+        with profiler.stage('second'):
+            profiled_call()
+            try:
+                profiled_call(fail=True)
+            except ValueError:
+                pass
+    report = profiler.report()
+    after = metrics.snapshot()['tests.profiled_call']
+    
+    # Calls outside the profiler only reach the process-wide registry
+    profiled_call()
+    
+    registry = MetricsRegistry()
+    registry.record('stage', 0.5)
+    registry.record('stage', 1.5, error=True)
+    
+    tests = [
+        ("Stages are timed in order", [stage['stage'] for stage in report['stages']] == ['first', 'second']),
+        ("Total time covers the stages",
+         report['total_seconds'] >= sum(stage['seconds'] for stage in report['stages'])),
+        ("Instrumented calls are attributed to the active request",
+         report['calls']['tests.profiled_call']['calls'] == 3),
+        ("Memory peak is reported", report.get('memory_peak_bytes', 0) > 0),
+        ("Process metrics count calls and errors",
+         after['calls'] - before['calls'] == 3 and after['errors'] - before['errors'] == 1),
+        ("Registry aggregates totals and maxima",
+         registry.snapshot()['stage'] == {'calls': 2, 'errors': 1, 'total_seconds': 2.0, 'max_seconds': 1.5}),
+        ("Prometheus export names the operation",
+         'ageont_calls_total{operation="stage"} 2' in registry.to_prometheus()),
+    ]
+    return report_checks(tests, "Profiling works", "Profiling is broken")
+
+
+def test_overlapping_memory_profiles():
+    """Test that overlapping memory profiles keep tracing and report a shared peak"""
+    print("\n" + "="*60)
+    print("TEST: Overlapping Memory Profiles")
+    print("="*60)
+    
+    import threading
+    import tracemalloc
+    from utils.profiler import RequestProfiler
+    
+    was_tracing = tracemalloc.is_tracing()
+    first, second = RequestProfiler(memory_profile=True), RequestProfiler(memory_profile=True)
+    first_started, second_started, first_done = threading.Event(), threading.Event(), threading.Event()
+    observed = {}
+    
+    def run_first():
+        with first:
+            first_started.set()
+            second_started.wait()
+        observed['tracing_after_first'] = tracemalloc.is_tracing()
+        first_done.set()
+    
+    def run_second():
+        first_started.wait()
+        with second:
+            second_started.set()
+            first_done.wait()
+            # Allocated after the first request finished, while this one still runs
+            block = bytearray(8 * 1024 * 1024)
+            del block
+    
+    threads = [threading.Thread(target=run_first), threading.Thread(target=run_second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    tracing_after_first = observed['tracing_after_first']
+    tracing_after_second = tracemalloc.is_tracing()
+    
+    with RequestProfiler(memory_profile=True) as alone:
+        pass
+    
+    tests = [
+        ("Tracing continues while another profile runs", tracing_after_first),
+        ("Tracing stops with the last profile", tracing_after_second == was_tracing),
+        ("The second peak includes its own allocations", second.memory_peak_bytes >= 8 * 1024 * 1024),
+        ("Overlapping peaks are reported as shared",
+         first.report()['memory_peak_shared'] and second.report()['memory_peak_shared']),
+        ("A profile running alone has its own peak",
+         alone.report()['memory_peak_shared'] is False and alone.memory_peak_bytes < 8 * 1024 * 1024),
+    ]
+    return report_checks(tests, "Memory profiles can overlap", "Overlapping memory profiles interfere")
+
+
+def test_benchmark_suite():
+    """Test that benchmark corpora are reproducible and regressions are detected"""
+    print("\n" + "="*60)
+    print("TEST: Benchmark Suite")
+    print("="*60)
+    
+    import contextlib
+    import io
+    from benchmarks import compare_with_baseline, make_cjk_document, make_document, split_document
+    
+    document = make_document(50)
+    baseline = {'fast': {'min_seconds': 1.0}, 'slow': {'min_seconds': 1.0}}
+    results = {'fast': {'min_seconds': 1.1}, 'slow': {'min_seconds': 1.5}, 'new': {'min_seconds': 1.0}}
+    with contextlib.redirect_stdout(io.StringIO()):
+        regressions = compare_with_baseline(results, baseline, threshold=0.2)
+    
+    tests = [
+        ("Documents are reproducible from the seed",
+         document == make_document(50) and document != make_document(50, seed=7)),
+        ("Documents have the requested sentences", len(split_document(document)) == 50),
+        ("CJK documents are reproducible", make_cjk_document(20) == make_cjk_document(20)),
+        ("Slowdowns beyond the threshold are regressions", regressions == ['slow']),
+    ]
+    return report_checks(tests, "Benchmark suite works", "Benchmark suite is broken")
+
+
+def test_token_streams():
+    """Test that interned token streams count like the token lists they replace"""
+    print("\n" + "="*60)
+    print("TEST: Token Streams")
+    print("="*60)
+    
+    from collections import Counter
+    import numpy as np
+    from utils.languages import split_sentences
+    from utils.tokenizers import word_tokenizer
+    from utils.tokens import TokenStream, build_token_stream
+    
+    text = "The cat sat on the mat. The dog chased the cat! A bird watched the dog and the cat."
+    stream = TokenStream.from_text(text)
+    sentences = [[token.lower() for token in word_tokenizer()(sentence)] for sentence in split_sentences(text)]
+    expected = Counter(token for sentence in sentences for token in sentence)
+    
+    counts = stream.counts()
+    words = stream.vocabulary.words
+    weights = np.array([1.0 if word == 'cat' else 0.0 for word in words])
+    sums, lengths = stream.sentence_sums(weights)
+    terms, term_sentences = stream.term_sentences([stream.vocabulary.index['dog'], stream.vocabulary.index['cat']])
+    alphabetic = stream.vocabulary.mask(str.isalpha)
+    
+    tests = [
+        ("Each word is interned once", len(words) == len(set(words)) == len(expected)),
+        ("Counts match a Counter over the tokens", {words[i]: int(c) for i, c in enumerate(counts)} == expected),
+        ("Masks drop punctuation", int(stream.counts(alphabetic)[stream.vocabulary.index['.']]) == 0),
+        ("Sentence sums follow sentence boundaries",
+         list(sums) == [1.0, 1.0, 1.0] and list(lengths) == [len(sentence) for sentence in sentences]),
+        ("Term sentences list each sentence once per term",
+         sorted(zip(terms.tolist(), term_sentences.tolist())) == [(0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]),
+        ("Most common words break ties by first appearance",
+         stream.most_common(counts, 2) == [('the', 6), ('cat', 3)]),
+        ("Streams are reused for repeated text", build_token_stream(text) is build_token_stream(text)),
+    ]
+    return report_checks(tests, "Token streams are consistent", "Token streams are inconsistent")
+
+
+def test_job_cancellation():
+    """Test that cancelled jobs always reach a finished state"""
+    print("\n" + "="*60)
+    print("TEST: Job Cancellation")
+    print("="*60)
+    
+    import threading
+    import time
+    from utils.jobs import Job, JobManager
+    from utils.pipeline import AnalysisCancelled
+    
+    def wait_for_cancel(cancel_event=None):
+        while not cancel_event.wait(0.01):
+            pass
+        raise AnalysisCancelled("cancelled")
+    
+    def wait_finished(manager, job_id, timeout=5):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            status = manager.status(job_id)['status']
+            if status in JobManager.FINISHED:
+                return status
+            time.sleep(0.01)
+        return manager.status(job_id)['status']
+    
+    manager = JobManager(max_workers=1)
+    release = threading.Event()
+    blocker = manager.submit(lambda cancel_event=None: release.wait(5))
+    queued = manager.submit(lambda cancel_event=None: 'done')
+    queued_cancelled = manager.cancel(queued)
+    release.set()
+    
+    running = manager.submit(wait_for_cancel)
+    while manager.status(running)['status'] == 'queued':
+        time.sleep(0.01)
+    running_cancelled = manager.cancel(running)
+    
+    # A job past its last cancellation check when cancel() is called
+    finishing = threading.Event()
+    past_checks = manager.submit(lambda cancel_event=None: finishing.wait(5) and 'done')
+    while manager.status(past_checks)['status'] == 'queued':
+        time.sleep(0.01)
+    late_cancelled = manager.cancel(past_checks)
+    finishing.set()
+    
+    # A job the worker picked up just after its cancel event was set
+    picked_up = Job('picked-up')
+    picked_up.cancel_event.set()
+    manager._run(picked_up, lambda cancel_event=None: 'done', (), {})
+    manager.shutdown()
+    
+    tests = [
+        ("Queued job is cancelled", queued_cancelled and manager.status(queued)['status'] == 'cancelled'),
+        ("Running job stops at its next check", running_cancelled and wait_finished(manager, running) == 'cancelled'),
+        ("Job cancelled past its last check is not reported completed",
+         late_cancelled and wait_finished(manager, past_checks) == 'cancelled' and manager.result(past_checks) is None),
+        ("Job picked up after cancel finishes as cancelled",
+         picked_up.status == 'cancelled' and picked_up.finished_at is not None),
+        ("Other jobs complete", wait_finished(manager, blocker) == 'completed'),
+        ("Finished jobs cannot be cancelled", not manager.cancel(blocker)),
+    ]
+    return report_checks(tests, "Cancelled jobs finish", "Job cancellation is broken")
+
+
+def test_precomputed_language_stages():
+    """Test that analyze() uses detection and translation results computed elsewhere"""
+    print("\n" + "="*60)
+    print("TEST: Precomputed Language Stages")
+    print("="*60)
+    
+    from utils.pipeline import AnalysisPipeline
+    
+    class RecordingTranslator:
+        def __init__(self):
+            self.calls = []
+        
+        def detect_language(self, text):
+            self.calls.append('detect')
+            return {'success': True, 'language_code': 'fr', 'language_name': 'French', 'confidence': 1.0}
+        
+        def translate_text(self, text, target_language='en', source_language='auto'):
+            self.calls.append('translate')
+            return {'success': True, 'original_text': text, 'source_language': 'fr',
+                    'target_language': target_language,
+                    'translated_text': "The service was excellent. The food was good."}
+    
+    options = ["Translation", "Sentiment Analysis"]
+    network = RecordingTranslator()
+    language_results = AnalysisPipeline(translator=network).detect_and_translate(
+        "Le service était excellent. La nourriture était bonne.", 'en', options
+    )
+    
+    workers = RecordingTranslator()
+    result = AnalysisPipeline(translator=workers).analyze(
+        "Le service était excellent. La nourriture était bonne.",
+        target_language='en', options=options, language_results=language_results
+    )
+    
+    tests = [
+        ("Network stages detect and translate", network.calls == ['detect', 'translate']),
+        ("analyze() does not call the translator", workers.calls == []),
+        ("Translated text is analyzed", result.get('analysis_language') == 'en'
+         and result.get('sentiment', {}).get('sentiment') == 'Positive'),
+    ]
+    return report_checks(tests, "Language stages can run outside analyze()", "Precomputed language stages are ignored")
+
+
+def test_api_batching():
+    """Test that micro-batches are spread over the workers instead of queueing on one"""
+    print("\n" + "="*60)
+    print("TEST: API Batching")
+    print("="*60)
+    
+    import asyncio
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from api import MicroBatcher
+    
+    def handler(payloads):
+        # Stands in for one worker analyzing its slice one text at a time
+        time.sleep(0.05 * len(payloads))
+        return [{'text': payload['text']} for payload in payloads]
+    
+    async def run(max_batch_size):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            batcher = MicroBatcher(executor, max_batch_size, 0.01, workers=4, handler=handler)
+            batcher.start()
+            started = time.perf_counter()
+            results = await asyncio.gather(*[batcher.submit({'text': str(i)}) for i in range(8)])
+            elapsed = time.perf_counter() - started
+            await batcher.stop()
+        return results, elapsed
+    
+    batched, batched_seconds = asyncio.run(run(8))
+    separate, separate_seconds = asyncio.run(run(1))
+    print(f"  8 requests: {batched_seconds:.3f}s batched, {separate_seconds:.3f}s separately")
+    
+    tests = [
+        ("Every request gets its own result", [result['text'] for result in batched] == [str(i) for i in range(8)]),
+        ("A batch is not slower than separate submissions", batched_seconds <= separate_seconds * 1.25 + 0.02),
+        ("A batch uses all workers", batched_seconds < 0.05 * 8 / 2),
+    ]
+    return report_checks(tests, "API batches run in parallel", "API batches run serially")
+
+
+def test_feed_polling():
+    """Test feed parsing hardening and seen-item bookkeeping"""
+    print("\n" + "="*60)
+    print("TEST: Feed Polling")
+    print("="*60)
+    
+    import tempfile
+    from utils.feeds import FeedPoller, parse_feed
+    
+    rss = b"""<?xml version="1.0"?>
+    <rss version="2.0"><channel>
+      <item><guid>a</guid><title>First</title><link>https://example.com/a</link></item>
+      <item><guid>b</guid><title>Second</title><link>https://example.com/b</link></item>
+    </channel></rss>"""
+    entity_bomb = b"""<?xml version="1.0"?>
+    <!DOCTYPE rss [<!ENTITY a "aaaaaaaaaa"><!ENTITY b "&a;&a;&a;&a;&a;&a;&a;&a;&a;&a;">]>
+    <rss><channel><item><guid>&b;</guid></item></channel></rss>"""
+    
+    try:
+        parse_feed(entity_bomb)
+        entities_rejected = False
+    except Exception:
+        entities_rejected = True
+    
+    class StaticPoller(FeedPoller):
+        def poll_feed(self, url):
+            items = [item for item in parse_feed(rss) if item['guid'] not in self.seen]
+            for item in items:
+                item['feed_url'] = url
+            return {'success': True, 'url': url, 'not_modified': False, 'items': items,
+                    'state': {'etag': 'v1', 'last_modified': None, 'checked_at': 0}}
+    
+    accepted = []
+    attempts = []
+    
+    def on_new(item):
+        attempts.append(item['guid'])
+        if attempts == ['a', 'b']:
+            raise RuntimeError("queue unavailable")
+        accepted.append(item['guid'])
+    
+    with tempfile.TemporaryDirectory() as state_dir:
+        poller = StaticPoller(["https://example.com/rss.xml"], state_dir=state_dir, on_new=on_new)
+        first = poller.poll_all()
+        state_after_failure = dict(poller._state)
+        second = poller.poll_all()
+        third = poller.poll_all()
+    
+    tests = [
+        ("Feed items are parsed", [item['guid'] for item in parse_feed(rss)] == ['a', 'b']),
+        ("XML entity declarations are rejected", entities_rejected),
+        ("Failed item is reported, not marked seen",
+         [item['guid'] for item in first['new_items']] == ['a'] and len(first['failed_items']) == 1),
+        ("Feed state is not saved while items failed", state_after_failure == {}),
+        ("Failed item is offered again", [item['guid'] for item in second['new_items']] == ['b']),
+        ("Accepted items are not repeated", third['new_items'] == [] and accepted == ['a', 'b']),
+    ]
+    return report_checks(tests, "Feed polling works", "Feed polling is broken")
+
+
+def test_corpus_files():
+    """Test that packed corpus files round-trip documents"""
+    print("\n" + "="*60)
+    print("TEST: Corpus Files")
+    print("="*60)
+    
+    import json
+    import tempfile
+    from utils.corpus import CorpusReader, convert_json_dump, write_corpus
+    
+    texts = ["First article.", "", "Zweiter Artikel über Größen.", "第三篇文章。", "Last one."]
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        path = os.path.join(corpus_dir, 'articles.corpus')
+        written = write_corpus(path, iter(texts))
+        with CorpusReader(path) as reader:
+            documents = list(reader)
+            size = len(reader)
+            last = reader[-1]
+            raw = bytes(reader.get_bytes(3))
+            shards = [list(reader.shard(worker, 3)) for worker in range(3)]
+        
+        dump_path = os.path.join(corpus_dir, 'articles.jsonl')
+        with open(dump_path, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps({'text': text}) + '\n' for text in texts)
+        converted_path = os.path.join(corpus_dir, 'converted.corpus')
+        convert_json_dump(dump_path, converted_path)
+        with CorpusReader(converted_path) as reader:
+            converted = list(reader)
+        
+        rejected = False
+        with open(os.path.join(corpus_dir, 'bad.corpus'), 'wb') as bad:
+            bad.write(b'not a corpus file' * 4)
+        try:
+            CorpusReader(os.path.join(corpus_dir, 'bad.corpus'))
+        except ValueError:
+            rejected = True
+    
+    tests = [
+        ("Documents round-trip, including empty and non-ASCII ones",
+         written == size == len(texts) and documents == texts),
+        ("Negative indices count from the end", last == texts[-1]),
+        ("Raw bytes are the UTF-8 encoding", raw == texts[3].encode('utf-8')),
+        ("Shards cover every document once", sum(shards, []) == list(range(len(texts)))),
+        ("JSON Lines dumps convert to the same documents", converted == texts),
+        ("Other files are rejected", rejected),
+    ]
+    return report_checks(tests, "Corpus files work", "Corpus files are broken")
+
+
+def test_results_export():
+    """Test that exported Parquet and Arrow files hold the flattened results"""
+    print("\n" + "="*60)
+    print("TEST: Results Export")
+    print("="*60)
+    
+    import tempfile
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from utils.exporter import export_results
+    
+    results = [
+        {
+            'title': f"Article {i}",
+            'url': f"https://example.com/{i}",
+            'detected_language': {'language_code': 'en', 'confidence': 0.99},
+            'sentiment': {'sentiment': 'Positive', 'polarity': 0.5, 'subjectivity': 0.4},
+            'keywords': [('market', 3), ('stocks', i)],
+            'statistics': {'word_count': 100 + i, 'sentence_count': 5},
+            'sentence_sentiments': [{'polarity': 0.25}, {'polarity': -0.5}]
+        }
+        for i in range(5)
+    ]
+    # Stages that did not run become nulls
+    results.append({'title': "Bare article"})
+    
+    with tempfile.TemporaryDirectory() as export_dir:
+        parquet_path = os.path.join(export_dir, 'results.parquet')
+        written = export_results(parquet_path, results, row_group_size=2)
+        parquet = pq.ParquetFile(parquet_path)
+        row_groups = parquet.num_row_groups
+        table = parquet.read()
+        
+        arrow_path = os.path.join(export_dir, 'results.arrow')
+        export_results(arrow_path, results, file_format='arrow')
+        with pa.memory_map(arrow_path) as source:
+            arrow_table = pa.ipc.open_file(source).read_all()
+    
+    rows = table.to_pylist()
+    tests = [
+        ("Every result is written", written == table.num_rows == len(results)),
+        ("Rows are grouped by row_group_size", row_groups == 3),
+        ("Nested keywords and sentence polarities are kept",
+         rows[2]['keywords'] == [{'term': 'market', 'count': 3}, {'term': 'stocks', 'count': 2}]
+         and rows[2]['sentence_polarity'] == [0.25, -0.5]),
+        ("Missing stages are null", rows[-1]['polarity'] is None and rows[-1]['keywords'] is None),
+        ("Arrow files hold the same rows", arrow_table.to_pylist() == rows),
+    ]
+    return report_checks(tests, "Results export works", "Results export is broken")
+
+
+def test_html_extraction():
+    """Test article extraction from HTML"""
+    print("\n" + "="*60)
+    print("TEST: HTML Extraction")
+    print("="*60)
+    
+    from utils.article_fetcher import ArticleFetcher, parse_article_html
+    
+    page = """<?xml version="1.0" encoding="utf-8"?>
+    <html><head><title>Fallback title</title>
+    <meta property="og:title" content="Rivers Rise After Storm">
+    <meta name="author" content="Ana Ruiz">
+    <meta property="article:published_time" content="2024-03-01T08:00:00">
+    <script>var tracking = 1;</script></head>
+    <body><nav><p>Home</p><p>World</p></nav>
+    <div class="story"><p>Heavy rain swelled the rivers overnight.</p>
+    <p>Officials opened the flood gates at dawn.</p></div>
+    <footer><p>Copyright</p></footer></body></html>"""
+    
+    article = parse_article_html(page.encode('utf-8'), 'https://example.com/news')
+    text = ArticleFetcher().extract_text_from_html(page)
+    
+    tests = [
+        ("Title comes from og:title", article['title'] == "Rivers Rise After Storm"),
+        ("Author is read from meta tags", article['authors'] == ["Ana Ruiz"]),
+        ("Publish date is parsed", article['publish_date'] is not None and article['publish_date'].year == 2024),
+        ("Body is the main paragraph container",
+         article['text'] == "Heavy rain swelled the rivers overnight.\n\nOfficials opened the flood gates at dawn."),
+        ("str pages with an XML declaration are extracted", "flood gates" in text),
+        ("Scripts are removed", "tracking" not in text),
+    ]
+    return report_checks(tests, "HTML extraction works", "HTML extraction is broken")
+
+
+def test_page_encoding():
+    """Test that downloaded pages are decoded with the charset they were served with"""
+    print("\n" + "="*60)
+    print("TEST: Page Encoding")
+    print("="*60)
+    
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from utils.article_fetcher import ArticleFetcher
+    
+    body = "<html><body><div><p>Le Café de Flore sert des crêpes à São Paulo.</p></div></body></html>"
+    pages = {
+        '/utf8': ('text/html', body.encode('utf-8')),
+        '/latin1': ('text/html; charset=ISO-8859-1', body.encode('latin-1')),
+        '/meta': ('text/html', body.replace('<html>', '<html><head><meta charset="windows-1252"></head>')
+                  .encode('cp1252')),
+    }
+    
+    class PageHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            content_type, content = pages[self.path]
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = HTTPServer(('127.0.0.1', 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        fetcher = ArticleFetcher()
+        base = f"http://127.0.0.1:{server.server_port}"
+        texts = {path: fetcher.fetch_from_url(base + path).get('text') for path in pages}
+    finally:
+        server.shutdown()
+        server.server_close()
+    
+    expected = "Le Café de Flore sert des crêpes à São Paulo."
+    tests = [
+        ("UTF-8 pages without a charset are decoded as UTF-8", texts['/utf8'] == expected),
+        ("The Content-Type charset is used", texts['/latin1'] == expected),
+        ("A <meta charset> is used without a header charset", texts['/meta'] == expected),
+    ]
+    return report_checks(tests, "Pages are decoded correctly", "Pages are decoded incorrectly")
+
+
+def test_bulk_fetching():
+    """Test that bulk fetching returns one result per URL, even when parsing breaks"""
+    print("\n" + "="*60)
+    print("TEST: Bulk Fetching")
+    print("="*60)
+    
+    import queue
+    from concurrent.futures.process import BrokenProcessPool
+    from utils.bulk_fetcher import BulkFetcher, _DONE
+    
+    class PageFetcher:
+        def download(self, url):
+            if url.endswith('missing'):
+                raise IOError("404 Not Found")
+            return f"<html><body><div><p>Article at {url} with enough text.</p></div></body></html>".encode()
+    
+    urls = [f"https://example.com/{i}" for i in range(6)] + ["https://example.com/missing"]
+    fetched = list(BulkFetcher(fetcher=PageFetcher(), parse_workers=2, queue_size=2).fetch_many(urls))
+    
+    class BrokenPool:
+        def submit(self, *args, **kwargs):
+            raise BrokenProcessPool("A worker process terminated abruptly")
+    
+    parse_queue = queue.Queue()
+    for url in urls[:3]:
+        parse_queue.put((url, b"<p>text</p>"))
+    parse_queue.put(_DONE)
+    results = queue.Queue()
+    BulkFetcher(fetcher=PageFetcher(), parse_workers=1)._dispatch(BrokenPool(), parse_queue, results)
+    failures = [results.get_nowait() for _ in range(results.qsize())]
+    
+    tests = [
+        ("Every URL gets a result", sorted(r['url'] for r in fetched) == sorted(urls)),
+        ("Pages are parsed", sum(1 for r in fetched if r['success'] and 'Article at' in r['text']) == 6),
+        ("Download errors are reported", [r['url'] for r in fetched if not r['success']] == [urls[-1]]),
+        ("A broken pool fails every queued page",
+         len(failures) == 3 and not any(r['success'] for r in failures)),
+    ]
+    return report_checks(tests, "Bulk fetching works", "Bulk fetching is broken")
+
+
+def test_incremental_analysis():
+    """Test that incremental re-analysis matches the full analysis"""
+    print("\n" + "="*60)
+    print("TEST: Incremental Analysis")
+    print("="*60)
+    
+    from utils.analyzer import ContentAnalyzer
+    from utils.incremental import IncrementalAnalyzer
+    from textblob import TextBlob
+    
+    full = ContentAnalyzer()
+    incremental = IncrementalAnalyzer()
+    english = "The food was not good. Great service though. The price was awful. We will come back."
+    spanish = "El servicio fue excelente. La comida no era mala. El precio fue terrible."
+    # TextBlob carries the negation into the next sentence
+    carried = "We were not. Happy now. Terrible food. Really! Nice staff."
+    
+    incremental.analyze_sentiment(english)
+    misses = incremental.misses
+    edited = english.replace("We will come back.", "We may come back.")
+    edited_sentiment = incremental.analyze_sentiment(edited)
+    
+    tests = [
+        ("Only the edited sentence is re-scored", incremental.misses - misses == 1),
+        ("English sentiment matches exactly", edited_sentiment == full.analyze_sentiment(edited)),
+        ("Negations across sentences match exactly",
+         incremental.analyze_sentiment(carried) == full.analyze_sentiment(carried)
+         and full.analyze_sentiment(carried)['polarity'] == TextBlob(carried).sentiment.polarity),
+        ("Lexicon-language polarity matches exactly",
+         incremental.analyze_sentiment(spanish, 'es')['polarity'] == full.analyze_sentiment(spanish, 'es')['polarity']),
+        ("Keywords match", incremental.extract_keywords(edited) == full.extract_keywords(edited)),
+        ("Statistics match", incremental.get_text_statistics(edited) == full.get_text_statistics(edited)),
+    ]
+    return report_checks(tests, "Incremental analysis matches", "Incremental analysis diverges")
+
+
+def test_partial_results():
+    """Test that background analyses expose the results of finished stages"""
+    print("\n" + "="*60)
+    print("TEST: Partial Results")
+    print("="*60)
+    
+    import time
+    from utils.jobs import JobManager
+    from utils.pipeline import AnalysisPipeline
+    
+    class EnglishTranslator:
+        def detect_language(self, text):
+            return {'success': True, 'language_code': 'en', 'language_name': 'English', 'confidence': 1.0}
+    
+    snapshots = []
+    pipeline = AnalysisPipeline(translator=EnglishTranslator())
+    pipeline.analyze(
+        "The launch went well. Engineers were pleased with the results.",
+        options=["Sentiment Analysis", "Keywords"],
+        on_stage=lambda stage, results: snapshots.append((stage, set(results)))
+    )
+    
+    manager = JobManager(max_workers=1)
+    job_id = manager.submit(
+        pipeline.analyze, "Markets rallied today. Investors cheered the news.",
+        options=["Keywords"], report_progress=True
+    )
+    while manager.status(job_id)['status'] not in JobManager.FINISHED:
+        time.sleep(0.01)
+    partial = manager.partial(job_id)
+    manager.shutdown()
+    
+    stages = [stage for stage, _ in snapshots]
+    tests = [
+        ("Stages are reported in order",
+         stages == ['detect', 'sentiment', 'keywords', 'sentence_sentiment', 'aspects']),
+        ("Each snapshot holds its stage's result",
+         'sentiment' in dict(snapshots)['sentiment'] and 'keywords' in dict(snapshots)['keywords']),
+        ("Jobs record partial results", partial['stages'] == ['detect', 'keywords']
+         and 'keywords' in partial['results']),
+    ]
+    return report_checks(tests, "Partial results are reported", "Partial results are missing")
+
+
+def test_sentiment_charting():
+    """Test that long sentiment series are downsampled without losing peaks"""
+    print("\n" + "="*60)
+    print("TEST: Sentiment Charting")
+    print("="*60)
+    
+    import numpy as np
+    from utils.charting import downsample_minmax, rolling_mean, sentiment_series
+    
+    rng = np.random.default_rng(0)
+    polarity = rng.uniform(-0.3, 0.3, 100000)
+    polarity[12345], polarity[67890] = 1.0, -1.0
+    sentences = [{'polarity': value} for value in polarity]
+    
+    indices, values, means, starts = downsample_minmax(polarity, 1000)
+    series = sentiment_series(sentences, max_points=1000)
+    zoomed = sentiment_series(sentences, start=12000, end=12500, max_points=1000)
+    short = sentiment_series(sentences[:10], max_points=1000)
+    
+    naive = [np.mean(polarity[max(0, i - 4):i + 1]) for i in range(len(polarity[:50]))]
+    
+    tests = [
+        ("Output stays within max_points", len(indices) <= 1000 and series['decimated']),
+        ("Peaks survive downsampling", 1.0 in values and -1.0 in values),
+        ("Points are in sentence order", bool(np.all(np.diff(indices) > 0))),
+        ("Bucket means average their sentences",
+         np.isclose(means[0], polarity[starts[0]:starts[1]].mean())),
+        ("Zoomed ranges keep sentence numbers and every point",
+         not zoomed['decimated'] and list(zoomed['index']) == list(range(12000, 12500))),
+        ("Short series are not decimated", not short['decimated'] and len(short['polarity']) == 10),
+        ("Rolling mean matches a windowed mean", np.allclose(rolling_mean(polarity[:50], 5), naive)),
+    ]
+    return report_checks(tests, "Sentiment charting works", "Sentiment charting is broken")
+
+
+def test_batch_aggregates():
+    """Test the per-article, per-source and keyword aggregates of a batch"""
+    print("\n" + "="*60)
+    print("TEST: Batch Aggregates")
+    print("="*60)
+    
+    from utils.aggregate import (
+        keyword_frame, keyword_trends, results_frame, sentiment_distribution, source_statistics
+    )
+    
+    def result(url, sentiment, polarity, words, keywords):
+        return {
+            'url': url,
+            'sentiment': {'sentiment': sentiment, 'polarity': polarity, 'subjectivity': 0.5},
+            'statistics': {'word_count': words, 'reading_time_minutes': words / 200},
+            'keywords': keywords
+        }
+    
+    results = [
+        result('https://news.example.com/a', 'Positive', 0.4, 300, [('budget', 3), ('vote', 1)]),
+        result('https://news.example.com/b', 'Negative', -0.2, 500, [('budget', 2)]),
+        result('https://other.example.org/c', 'Positive', 0.6, 200, [('storm', 4)]),
+        {'source': 'text'}
+    ]
+    articles = results_frame(results)
+    keywords = keyword_frame(results, articles)
+    sources = source_statistics(articles)
+    distribution = sentiment_distribution(articles)
+    trends = keyword_trends(keywords)
+    
+    tests = [
+        ("One row per article with its source",
+         list(articles['source']) == ['news.example.com', 'news.example.com', 'other.example.org', 'text']),
+        ("Untitled articles get a numbered title", articles['title'].iloc[3] == "Article 4"),
+        ("Sources are summarized",
+         sources.loc['news.example.com', 'articles'] == 2
+         and abs(sources.loc['news.example.com', 'mean_polarity'] - 0.1) < 1e-9
+         and sources.loc['news.example.com', 'total_words'] == 800),
+        ("Sentiment is counted per source",
+         distribution.loc['news.example.com', 'Negative'] == 1 and distribution.loc['other.example.org', 'Positive'] == 1),
+        ("Keyword rows carry their source", len(keywords) == 4 and set(keywords['source']) == {'news.example.com', 'other.example.org'}),
+        ("Keywords in more articles trend first",
+         trends.index[0] == 'budget' and trends.loc['budget', 'articles'] == 2 and trends.loc['budget', 'total'] == 5),
+    ]
+    return report_checks(tests, "Batch aggregates are correct", "Batch aggregates are incorrect")
+
+
+def test_text_store():
+    """Test text store eviction, spilling and spill cleanup"""
+    print("\n" + "="*60)
+    print("TEST: Text Store")
+    print("="*60)
+    
+    import tempfile
+    import time
+    from utils.text_store import TextStore
+    
+    with tempfile.TemporaryDirectory() as spill_dir:
+        store = TextStore(max_bytes=100, spill_dir=spill_dir, spill_max_bytes=250, spill_ttl=3600)
+        refs = [store.put(f"{i} " + "x" * 58) for i in range(8)]
+        memory_within_budget = store.size <= 100
+        spilled_within_budget = store.spill_size <= 250
+        oldest_lost = store.get(refs[0]) is None
+        newest = store.get(refs[-1])
+        evicted_but_kept = store.get(refs[-3])
+        span = store.get(refs[-1], 0, 4)
+        duplicate = store.put("7 " + "x" * 58) == refs[-1]
+        
+        # Texts unused for longer than the TTL are removed when a store starts
+        expired = os.path.join(spill_dir, 'ab', 'ab' + '0' * 62)
+        os.makedirs(os.path.dirname(expired), exist_ok=True)
+        with open(expired, 'wb') as f:
+            f.write(b'old')
+        os.utime(expired, (time.time() - 7200, time.time() - 7200))
+        TextStore(max_bytes=100, spill_dir=spill_dir, spill_max_bytes=250, spill_ttl=3600)
+        expired_removed = not os.path.exists(expired)
+        
+        contained = refs[-3] in store
+        store.close()
+        closed_clean = not any(files for _, _, files in os.walk(spill_dir))
+    
+    tests = [
+        ("Memory stays within its budget", memory_within_budget),
+        ("Spill directory stays within its budget", spilled_within_budget),
+        ("Least recently used spilled text is deleted first", oldest_lost),
+        ("Evicted texts are loaded back from disk", evicted_but_kept == "5 " + "x" * 58),
+        ("Newest text is available", newest == "7 " + "x" * 58 and span == "7 xx"),
+        ("Identical texts share a reference", duplicate),
+        ("Expired spill files are removed at startup", expired_removed),
+        ("Stored texts are found", contained),
+        ("close() removes the store's spill files", closed_clean),
+    ]
+    return report_checks(tests, "Text store works", "Text store is broken")
+
+
+def test_native_languages():
+    """Test language normalization and native lexicon sentiment"""
+    print("\n" + "="*60)
+    print("TEST: Native Languages")
+    print("="*60)
+    
+    from utils.languages import Lexicon, lexicon_for, normalize_language, sentiment_assessments
+    
+    spanish = lexicon_for('es')
+    positive, _, positive_words = sentiment_assessments("El servicio fue excelente. La comida es buena.", 'es')
+    negated, _, _ = sentiment_assessments("El servicio no fue bueno.", 'es')
+    neutral = sentiment_assessments("La reunión empieza a las diez.", 'es')
+    
+    lexicon = Lexicon({'good': (0.8, 0.6)}, {'not'})
+    
+    tests = [
+        ("Language codes are normalized",
+         [normalize_language(code) for code in ('zh-CN', 'zh-TW', 'es-MX', 'EN', None)]
+         == ['zh-cn', 'zh-cn', 'es', 'en', 'en']),
+        ("Lexicons are found for bundled languages", spanish is not None and lexicon_for('en') is None),
+        ("Spanish is scored without translation", positive > 0.5 and len(positive_words) == 2),
+        ("Negations flip the next sentiment word", negated < 0),
+        ("Text without sentiment words is neutral", neutral == (0.0, 0.0, [])),
+        ("Negations only reach a few words",
+         lexicon.assess(['not', 'a', 'really', 'good']) == [(-0.4, 0.6)]
+         and lexicon.assess(['not', 'a', 'b', 'c', 'good']) == [(0.8, 0.6)]),
+    ]
+    return report_checks(tests, "Native language analysis works", "Native language analysis is broken")
+
+
+def test_lexicon_coverage():
+    """Test that text the native lexicon barely covers is translated or marked approximate"""
+    print("\n" + "="*60)
+    print("TEST: Lexicon Coverage")
+    print("="*60)
+    
+    import config
+    from utils.analyzer import ContentAnalyzer
+    from utils.incremental import IncrementalAnalyzer
+    from utils.languages import sentiment_coverage
+    from utils.pipeline import AnalysisPipeline
+    
+    german = ("Die Bundesregierung hat am Mittwoch ein neues Klimaschutzgesetz beschlossen. "
+              "Die Opposition sprach von einem schweren Fehler, während Wirtschaftsverbände "
+              "die Entlastungen begrüßten.")
+    spanish = "El servicio fue excelente. La comida es buena y el precio es justo."
+    
+    class GermanTranslator:
+        def __init__(self):
+            self.targets = []
+        
+        def detect_language(self, text):
+            return {'success': True, 'language_code': 'de', 'language_name': 'German', 'confidence': 1.0}
+        
+        def translate_text(self, text, target_language='en', source_language='auto'):
+            self.targets.append(target_language)
+            return {'success': True, 'original_text': text, 'source_language': 'de',
+                    'target_language': target_language,
+                    'translated_text': "The government made a terrible mistake. Businesses welcomed the relief."}
+    
+    translator = GermanTranslator()
+    translated = AnalysisPipeline(translator=translator).analyze(german, options=["Sentiment Analysis"])
+    
+    saved = config.TRANSLATION
+    config.TRANSLATION = 'off'
+    try:
+        native = AnalysisPipeline(translator=GermanTranslator()).analyze(german, options=["Sentiment Analysis"])
+    finally:
+        config.TRANSLATION = saved
+    
+    spanish_sentiment = ContentAnalyzer().analyze_sentiment(spanish, 'es')
+    incremental = IncrementalAnalyzer().analyze_sentiment(spanish, 'es')
+    
+    tests = [
+        ("Seed lexicons barely cover German news", sentiment_coverage(german, 'de') < config.LEXICON_MIN_COVERAGE),
+        ("CJK text has no native lexicon", sentiment_coverage("今天天气很好，我们去公园散步。", 'zh-cn') == 0.0),
+        ("Low coverage text is translated to English first",
+         translator.targets == ['en'] and translated['translation']['reason'] == 'lexicon_coverage'
+         and translated['analysis_language'] == 'en' and translated['sentiment']['sentiment'] == 'Negative'),
+        ("Without translation the result is marked approximate",
+         native['sentiment']['approximate'] and native['approximate'] and 'translation' not in native),
+        ("Covered text is analyzed natively",
+         not spanish_sentiment['approximate'] and spanish_sentiment['lexicon_coverage'] > 0.1),
+        ("Incremental analysis reports the same coverage",
+         incremental['lexicon_coverage'] == spanish_sentiment['lexicon_coverage']),
+    ]
+    return report_checks(tests, "Lexicon coverage is enforced", "Low coverage lexicons are trusted")
+
+
+def test_cjk_tokenization():
+    """Test script detection and CJK sentence and word splitting"""
+    print("\n" + "="*60)
+    print("TEST: CJK Tokenization")
+    print("="*60)
+    
+    import config
+    from utils.tokenizers import (
+        cjk_script, detect_script, split_cjk_sentences, tokenize_chinese, tokenize_japanese, tokenize_korean
+    )
+    
+    segmenter = config.CHINESE_SEGMENTER
+    config.CHINESE_SEGMENTER = 'bigram'
+    try:
+        bigrams = tokenize_chinese("北京天气，很好。")
+    finally:
+        config.CHINESE_SEGMENTER = segmenter
+    
+    tests = [
+        ("Scripts are detected from text",
+         [detect_script(text) for text in ("北京是中国的首都。", "東京はとても大きい都市です。", "서울은 한국의 수도입니다.", "Hello world.")]
+         == ['zh', 'ja', 'ko', None]),
+        ("Language codes take precedence over detection", cjk_script('ja', "漢字") == 'ja'),
+        ("CJK sentences split on full-width punctuation",
+         split_cjk_sentences("今天很好。你好吗？是的！") == ["今天很好。", "你好吗？", "是的！"]),
+        ("Chinese falls back to Han bigrams", bigrams == ['北京', '京天', '天气', '，', '很好', '。']),
+        ("Japanese splits into runs of one script",
+         tokenize_japanese("東京タワーに行きました") == ['東京', 'タワー', 'に', '行', 'きました']),
+        ("Korean splits on spaces and detaches punctuation",
+         tokenize_korean("서울은 한국의 수도입니다.") == ['서울은', '한국의', '수도입니다', '.']),
+    ]
+    return report_checks(tests, "CJK tokenization works", "CJK tokenization is broken")
+
+
+def test_fast_tokenizer():
+    """Test that the regex tokenizer reproduces NLTK word_tokenize"""
+    print("\n" + "="*60)
+    print("TEST: Fast Tokenizer")
+    print("="*60)
+    
+    from benchmarks import AGREEMENT_SENTENCES, make_document, split_document
+    from utils.tokenizers import fast_tokenize, fast_tokenize_with_offsets, tokenizer_agreement, treebank_tokenize
+    
+    sentences = AGREEMENT_SENTENCES + split_document(make_document(200))
+    agreement = tokenizer_agreement(sentences)
+    
+    def offsets_point_at_tokens(sentence):
+        tokens, offsets = fast_tokenize_with_offsets(sentence)
+        return all(
+            token in ('``', "''") or sentence.startswith(token, offset)
+            for token, offset in zip(tokens, offsets)
+        )
+    
+    tests = [
+        ("Tokens agree with NLTK on every sentence", agreement['sentences'] == 1.0),
+        ("Contractions and quotes split like NLTK",
+         fast_tokenize('"I can\'t go," she said.') == treebank_tokenize('"I can\'t go," she said.')),
+        ("Offsets point at their tokens", all(offsets_point_at_tokens(sentence) for sentence in sentences)),
+        ("Empty sentences have no tokens", fast_tokenize("") == []),
+    ]
+    return report_checks(tests, "Fast tokenizer matches NLTK", "Fast tokenizer differs from NLTK")
+
+
+def test_resource_preloading():
+    """Test that resources load once and failures are reported, not raised"""
+    print("\n" + "="*60)
+    print("TEST: Resource Preloading")
+    print("="*60)
+    
+    from utils.resources import ResourceManager
+    
+    loads = []
+    
+    def load_counted():
+        loads.append(1)
+        return 'counted'
+    
+    def load_broken():
+        raise ImportError("broken is not installed")
+    
+    manager = ResourceManager(names=['lexicons', 'counted', 'broken', 'missing'], transformer_models=[])
+    manager.LOADERS = dict(ResourceManager.LOADERS, counted=load_counted, broken=load_broken)
+    first = {name: dict(status) for name, status in manager.preload().items()}
+    manager.preload()
+    report = manager.report()
+    
+    tests = [
+        ("Lexicons are loaded with their sizes",
+         first['lexicons']['loaded'] and first['lexicons']['detail'].get('es', 0) > 0),
+        ("Load time and memory are recorded",
+         first['counted']['seconds'] >= 0 and 'rss_delta_bytes' in first['counted']),
+        ("Loaded resources are not loaded again", len(loads) == 1),
+        ("Failing loaders are reported",
+         not first['broken']['loaded'] and 'not installed' in first['broken']['error']),
+        ("Unknown resources are reported", not first['missing']['loaded']),
+        ("Reports include process memory", report['memory']['rss_bytes'] > 0 and report['resources']['counted']['loaded']),
+    ]
+    return report_checks(tests, "Resource preloading works", "Resource preloading is broken")
+
+
+def test_pipeline_profiles():
+    """Test profile resolution, document truncation and the abstractive summary guard"""
+    print("\n" + "="*60)
+    print("TEST: Pipeline Profiles")
+    print("="*60)
+    
+    import tempfile
+    import config
+    from utils.pipeline import truncate_text
+    from utils.resources import resource_manager
+    from utils.summarizer import TextSummarizer
+    
+    with tempfile.NamedTemporaryFile('w', suffix='.toml', delete=False) as f:
+        f.write('profile = "newsroom"\n\n[profiles.newsroom]\nextends = "fast"\njob_workers = 12\n')
+    try:
+        file_name, file_profile = config._load_profile("", f.name)
+        override_name, _ = config._load_profile("thorough", f.name)
+    finally:
+        os.remove(f.name)
+    
+    try:
+        config._load_profile("unknown", "")
+        unknown_rejected = False
+    except ValueError:
+        unknown_rejected = True
+    
+    text = "one two three four five six seven eight nine ten"
+    head = truncate_text(text, 20, 'head')
+    tail = truncate_text(text, 20, 'tail')
+    head_tail = truncate_text(text, 20, 'head_tail')
+    on_boundary = truncate_text(text, 18, 'head')
+    
+    loaded_before = set(resource_manager.status)
+    summary = TextSummarizer().abstractive_summarize("Bonjour tout le monde.", language='fr')
+    
+    tests = [
+        ("Default profile is balanced", config._load_profile("", "") == ("balanced", config.PIPELINE_PROFILES["balanced"])),
+        ("Profile files can extend presets",
+         file_name == "newsroom" and file_profile["job_workers"] == 12 and file_profile["tokenizer"] == "fast"),
+        ("Explicit profile name wins over the file", override_name == "thorough"),
+        ("Unknown profiles are rejected", unknown_rejected),
+        ("Short texts are not truncated", truncate_text(text, 0) == text and truncate_text(text, 100) == text),
+        ("Head truncation keeps whole words", head == "one two three four" and len(head) <= 20),
+        ("Tail truncation keeps whole words", tail == "seven eight nine ten" and len(tail) <= 20),
+        ("A cut on a word boundary keeps the last word", on_boundary == "one two three four"),
+        ("Head and tail fit the budget", len(head_tail) <= 20 and head_tail.startswith("one") and head_tail.endswith("ten")),
+        ("Non-English text is rejected without loading the model",
+         not summary['success'] and set(resource_manager.status) == loaded_before),
+    ]
+    return report_checks(tests, "Pipeline profiles work", "Pipeline profiles are broken")
+
+
+def test_input_guards():
+    """Test that huge inputs are rejected or analyzed from a sentence sample"""
+    print("\n" + "="*60)
+    print("TEST: Input Guards")
+    print("="*60)
+    
+    import config
+    from benchmarks import OfflineTranslator, make_document
+    from utils.pipeline import AnalysisPipeline, InputTooLarge, sample_sentences
+    
+    stratified = sample_sentences(1000, 10)
+    pipeline = AnalysisPipeline(translator=OfflineTranslator())
+    document = make_document(400)
+    
+    saved = config.MAX_ANALYSIS_SENTENCES, config.MAX_DOCUMENT_CHARS, config.MAX_INPUT_CHARS
+    config.MAX_ANALYSIS_SENTENCES, config.MAX_DOCUMENT_CHARS = 50, 0
+    try:
+        sampled = pipeline.analyze(document, options=["Sentiment Analysis"])
+        config.MAX_ANALYSIS_SENTENCES = 0
+        full = pipeline.analyze(document, options=["Sentiment Analysis"])
+        config.MAX_INPUT_CHARS = 1000
+        try:
+            pipeline.analyze(document, options=["Sentiment Analysis"])
+            rejected = False
+        except InputTooLarge:
+            rejected = True
+    finally:
+        config.MAX_ANALYSIS_SENTENCES, config.MAX_DOCUMENT_CHARS, config.MAX_INPUT_CHARS = saved
+    
+    tests = [
+        ("Documents within budget are not sampled", sample_sentences(10, 10) is None and sample_sentences(10, 0) is None),
+        ("Stratified samples spread over the document",
+         len(stratified) == 10 and stratified[0] < 100 and stratified[-1] >= 900 and len(set(stratified)) == 10),
+        ("Head and tail samples keep one end",
+         list(sample_sentences(100, 3, 'head')) == [0, 1, 2] and list(sample_sentences(100, 3, 'tail')) == [97, 98, 99]),
+        ("Sampled analyses are marked approximate",
+         sampled['approximate'] and sampled['sampling']['sampled_sentences'] == 50),
+        ("Sampled sentiment is close to the full analysis",
+         not full['approximate'] and abs(sampled['sentiment']['polarity'] - full['sentiment']['polarity']) < 0.1),
+        ("Inputs over MAX_INPUT_CHARS are rejected", rejected),
+    ]
+    return report_checks(tests, "Input guards work", "Input guards are broken")
+
+
+def test_streaming_statistics():
+    """Test that streaming statistics are chunk-invariant and match the full analysis"""
+    print("\n" + "="*60)
+    print("TEST: Streaming Statistics")
+    print("="*60)
+    
+    import tempfile
+    from utils.analyzer import ContentAnalyzer
+    from utils.corpus import CorpusReader, write_corpus
+    from utils.streaming_stats import HyperLogLog, StreamingStatistics, chunk_text
+    from utils.tokenizers import cjk_script
+    
+    english = "The committee met on Monday. It approved the budget! Members voted 7 to 2.\n" * 40
+    chinese = "今天天气很好，我们去公园散步。公园里有很多人在跑步！\n北京是中国的首都。" * 40
+    
+    def streamed(text, chunk_size, script=None):
+        return StreamingStatistics(script=script).consume(chunk_text(text, chunk_size)).result()
+    
+    english_runs = [streamed(english, size) for size in (5, 97, 1 << 20)]
+    chinese_runs = [streamed(chinese, size, cjk_script('zh-cn', chinese)) for size in (5, 97, 1 << 20)]
+    full_chinese = ContentAnalyzer().get_text_statistics(chinese, 'zh-cn')
+    
+    sketch, other = HyperLogLog(), HyperLogLog()
+    sketch.update(f"word{i}" for i in range(60000))
+    other.update(f"word{i}" for i in range(40000, 100000))
+    sketch.merge(other)
+    
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        path = os.path.join(corpus_dir, 'corpus.bin')
+        write_corpus(path, [english, chinese])
+        with CorpusReader(path) as reader:
+            corpus = reader.statistics(chunk_size=64).result()
+    
+    tests = [
+        ("English counts do not depend on chunk size",
+         all(run == english_runs[0] for run in english_runs) and english_runs[0]['sentence_count'] == 120),
+        ("Chinese counts do not depend on chunk size", all(run == chinese_runs[0] for run in chinese_runs)),
+        ("Chinese words match the full analysis",
+         chinese_runs[0]['word_count'] == full_chinese['word_count']
+         and chinese_runs[0]['sentence_count'] == full_chinese['sentence_count']),
+        ("Merged HyperLogLog estimates the union", abs(sketch.count() - 100000) < 3000),
+        ("Corpus statistics detect the script per document",
+         corpus['word_count'] == english_runs[0]['word_count'] + chinese_runs[0]['word_count']),
+    ]
+    return report_checks(tests, "Streaming statistics are consistent", "Streaming statistics are inconsistent")
+
+
+def test_topic_clustering():
+    """Test that topic clusters separate distinct topics and have distinct labels"""
+    print("\n" + "="*60)
+    print("TEST: Topic Clustering")
+    print("="*60)
+    
+    import numpy as np
+    from utils.clustering import TopicClusterer, cluster_results
+    
+    sports = [[('football', 5), ('league', 3), ('goal', 2), ('player', 2)],
+              [('football', 4), ('player', 3), ('coach', 2)],
+              [('league', 4), ('goal', 3), ('coach', 1)]]
+    markets = [[('stocks', 5), ('market', 3), ('investors', 2)],
+               [('market', 4), ('shares', 3), ('investors', 2)],
+               [('stocks', 3), ('shares', 2), ('market', 2)]]
+    labels = TopicClusterer(n_clusters=2).fit(sports + markets, epochs=5).predict(sports + markets)
+    
+    # Two clusters sharing their top terms must still get different labels
+    twins = TopicClusterer(n_clusters=2)
+    twins.feature_words = {0: 'budget'}
+    twins.centroids = np.zeros((2, twins.n_features))
+    twins.centroids[:, 0] = 1.0
+    
+    pair, pair_clusterer = cluster_results([{'keywords': sports[0]}, {'keywords': markets[0]}], 2)
+    
+    tests = [
+        ("Articles on one topic share a cluster",
+         len(set(labels[:3])) == 1 and len(set(labels[3:])) == 1),
+        ("Different topics get different clusters", labels[0] != labels[3]),
+        ("Labels are unique per cluster", twins.label(0) != twins.label(1)),
+        ("Two articles can be clustered into two topics",
+         sorted(pair) == [0, 1] and pair_clusterer.label(pair[0]) != pair_clusterer.label(pair[1])),
+    ]
+    return report_checks(tests, "Topic clustering works", "Topic clustering is broken")
+
+
+def test_entity_extraction():
+    """Test the heuristic entity extractor, its language gate and its cache"""
+    print("\n" + "="*60)
+    print("TEST: Entity Extraction")
+    print("="*60)
+    
+    from utils.entities import EntityExtractor
+    
+    text = ("Chief Executive Tim Cook spoke in Cupertino on Monday. "
+            "Analysts at Goldman Sachs Group praised the results. Cook thanked the staff.")
+    extractor = EntityExtractor(model_name='')
+    english = extractor.extract_entities(text)
+    misses = extractor.misses
+    again = extractor.extract_entities(text)
+    found = {entity['entity']: entity for entity in english.get('entities', [])}
+    
+    german = extractor.extract_entities("Der Hund lief gestern mit Anna durch den Park in Berlin.", language='de')
+    chinese = extractor.extract_entities("苹果公司的首席执行官蒂姆·库克在北京发表讲话。", language='zh-cn')
+    accented = {
+        entity['entity'] for entity in EntityExtractor(model_name='').extract_entities(
+            "Álvaro Morata habló con Éric Abidal en el Banco de España.", language='es'
+        ).get('entities', [])
+    }
+    
+    class FakeTokenizer:
+        def __init__(self, is_fast):
+            self.is_fast = is_fast
+            self.model_max_length = 512
+    
+    class FakeModel:
+        def __init__(self, is_fast):
+            self.tokenizer = FakeTokenizer(is_fast)
+            self.calls = []
+        
+        def __call__(self, sentences, **kwargs):
+            self.calls.append(kwargs)
+            return [[{'word': 'Acme', 'entity_group': 'ORG', 'score': 0.9}] for _ in sentences]
+    
+    fast, slow = FakeModel(True), FakeModel(False)
+    long_sentence = "Acme " + "and more words " * 300
+    predicted = extractor._predict(fast, [long_sentence])
+    extractor._predict(slow, [long_sentence])
+    
+    tests = [
+        ("English people, places and organizations are found",
+         found.get('Tim Cook', {}).get('type') == 'PER' and found.get('Cupertino', {}).get('type') == 'LOC'
+         and found.get('Goldman Sachs Group', {}).get('type') == 'ORG'),
+        ("Surnames are linked to the full name", found.get('Tim Cook', {}).get('count') == 2),
+        ("Weekdays are not entities", 'Monday' not in found),
+        ("German text is not guessed from capitalization",
+         german['success'] and german['method'] == 'unsupported' and not german['entities']),
+        ("CJK text is not guessed from capitalization",
+         chinese['success'] and chinese['method'] == 'unsupported' and not chinese['entities']),
+        ("Repeated sentences come from the cache",
+         again['entities'] == english['entities'] and extractor.misses == misses and extractor.hits == misses),
+        ("Names with accented initials are found",
+         {'Álvaro Morata', 'Éric Abidal', 'Banco de España'} <= accented),
+        ("Long sentences are chunked for fast tokenizers",
+         fast.calls[0].get('stride') and predicted == [[('Acme', 'ORG', False)]]),
+        ("Slow tokenizers are left to the pipeline's truncation", 'stride' not in slow.calls[0]),
+    ]
+    return report_checks(tests, "Entity extraction works", "Entity extraction is broken")
+
+
+def test_aspect_sentiments():
+    """Test that keyword and entity sentiment averages their sentences' scores"""
+    print("\n" + "="*60)
+    print("TEST: Aspect Sentiments")
+    print("="*60)
+    
+    from utils.aspects import aspect_sentiments
+    
+    text = ("The battery is great and the battery lasts. The screen is awful. "
+            "Acme makes the screen and the battery.")
+    polarities = [0.8, -0.6, 0.1]
+    keywords = [('battery', 3), ('screen', 2), ('missing', 1)]
+    entities = [{'entity': 'Acme', 'type': 'ORG', 'count': 1, 'sentences': [2]}]
+    
+    result = aspect_sentiments(text, polarities, keywords, entities)
+    rows = {row['term']: row for row in result.get('keywords', []) + result.get('entities', [])}
+    mismatch = aspect_sentiments(text, polarities[:2], keywords)
+    
+    tests = [
+        ("Keywords average the sentences mentioning them",
+         rows['battery']['mentions'] == 2 and abs(rows['battery']['polarity'] - 0.45) < 1e-9
+         and rows['battery']['sentiment'] == 'Positive'),
+        ("Positive and negative sentences are counted",
+         rows['screen']['positive'] == 0 and rows['screen']['negative'] == 1),
+        ("Entities use the sentences they carry",
+         rows['Acme']['type'] == 'ORG' and rows['Acme']['polarity'] == 0.1 and rows['Acme']['mentions'] == 1),
+        ("Keywords not in the text are left out", 'missing' not in rows),
+        ("Polarities must match the sentences", not mismatch['success']),
+    ]
+    return report_checks(tests, "Aspect sentiments are correct", "Aspect sentiments are incorrect")
+
+
 def run_all_tests():
     """Run all tests and report results"""
     print("\n" + "="*60)
@@ -270,7 +1600,36 @@ def run_all_tests():
         test_documentation,
         test_requirements,
         test_gitignore,
-        test_config_files
+        test_config_files,
+        test_profiling,
+        test_overlapping_memory_profiles,
+        test_benchmark_suite,
+        test_token_streams,
+        test_job_cancellation,
+        test_precomputed_language_stages,
+        test_api_batching,
+        test_feed_polling,
+        test_corpus_files,
+        test_results_export,
+        test_html_extraction,
+        test_page_encoding,
+        test_bulk_fetching,
+        test_incremental_analysis,
+        test_partial_results,
+        test_sentiment_charting,
+        test_batch_aggregates,
+        test_text_store,
+        test_native_languages,
+        test_lexicon_coverage,
+        test_cjk_tokenization,
+        test_fast_tokenizer,
+        test_resource_preloading,
+        test_pipeline_profiles,
+        test_input_guards,
+        test_streaming_statistics,
+        test_topic_clustering,
+        test_entity_extraction,
+        test_aspect_sentiments
     ]
     
     results = []
@@ -1,7 +1,20 @@
 """Utils package initialization"""
 from utils.article_fetcher import ArticleFetcher
+from utils.bulk_fetcher import BulkFetcher
 from utils.translator import Translator
 from utils.analyzer import ContentAnalyzer
 from utils.summarizer import TextSummarizer
+from utils.incremental import IncrementalAnalyzer
+from utils.entities import EntityExtractor
+from utils.text_store import TextStore
+from utils.resources import ResourceManager
+from utils.pipeline import AnalysisPipeline, AnalysisCancelled, InputTooLarge
+from utils.jobs import JobManager
+from utils.feeds import FeedPoller
+from utils.profiler import RequestProfiler, metrics
 
-__all__ = ['ArticleFetcher', 'Translator', 'ContentAnalyzer', 'TextSummarizer']
+__all__ = [
+    'ArticleFetcher', 'BulkFetcher', 'Translator', 'ContentAnalyzer', 'TextSummarizer',
+    'IncrementalAnalyzer', 'EntityExtractor', 'TextStore', 'ResourceManager', 'AnalysisPipeline', 'AnalysisCancelled', 'InputTooLarge', 'JobManager', 'FeedPoller',
+    'RequestProfiler', 'metrics'
+]
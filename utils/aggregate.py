@@ -0,0 +1,109 @@
+"""
+Aggregate Module
+Vectorized summaries over many analysis results
+"""
+from urllib.parse import urlparse
+import pandas as pd
+
+
+def results_frame(results):
+    """
+    One row per analyzed article
+
+    Args:
+        results (list): Results of AnalysisPipeline.analyze
+
+    Returns:
+        pandas.DataFrame: Article-level metrics
+    """
+    rows = []
+    for doc_id, result in enumerate(results):
+        url = result.get('url')
+        sentiment = result.get('sentiment', {})
+        statistics = result.get('statistics', {})
+        rows.append({
+            'doc_id': doc_id,
+            'title': result.get('title') or f"Article {doc_id + 1}",
+            'source': urlparse(url).netloc if url else result.get('source', 'text'),
+            'language': result.get('detected_language', {}).get('language_name'),
+            'sentiment': sentiment.get('sentiment'),
+            'polarity': sentiment.get('polarity'),
+            'subjectivity': sentiment.get('subjectivity'),
+            'word_count': statistics.get('word_count'),
+            'reading_time_minutes': statistics.get('reading_time_minutes')
+        })
+    return pd.DataFrame(rows, columns=[
+        'doc_id', 'title', 'source', 'language', 'sentiment', 'polarity',
+        'subjectivity', 'word_count', 'reading_time_minutes'
+    ])
+
+
+def keyword_frame(results, articles):
+    """
+    One row per (article, keyword)
+
+    Args:
+        results (list): Results of AnalysisPipeline.analyze
+        articles (pandas.DataFrame): Output of results_frame
+
+    Returns:
+        pandas.DataFrame: doc_id, source, keyword and count columns
+    """
+    rows = [
+        (doc_id, keyword, count)
+        for doc_id, result in enumerate(results)
+        for keyword, count in result.get('keywords') or []
+    ]
+    keywords = pd.DataFrame(rows, columns=['doc_id', 'keyword', 'count'])
+    return keywords.merge(articles[['doc_id', 'source']], on='doc_id', how='left')
+
+
+def sentiment_distribution(articles):
+    """Number of articles per sentiment label and source"""
+    return pd.crosstab(articles['source'], articles['sentiment'])
+
+
+def source_statistics(articles):
+    """Per-source article counts and mean metrics"""
+    return articles.groupby('source').agg(
+        articles=('doc_id', 'count'),
+        mean_polarity=('polarity', 'mean'),
+        mean_subjectivity=('subjectivity', 'mean'),
+        total_words=('word_count', 'sum'),
+        mean_reading_time=('reading_time_minutes', 'mean')
+    ).sort_values('articles', ascending=False)
+
+
+def keyword_trends(keywords, top_n=20):
+    """
+    Most frequent keywords across the batch
+
+    Args:
+        keywords (pandas.DataFrame): Output of keyword_frame
+        top_n (int): Number of keywords to return
+
+    Returns:
+        pandas.DataFrame: Total count and number of articles per keyword
+    """
+    return keywords.groupby('keyword').agg(
+        total=('count', 'sum'),
+        articles=('doc_id', 'nunique')
+    ).sort_values(['articles', 'total'], ascending=False).head(top_n)
+
+
+def topic_summary(articles):
+    """
+    Per-topic article counts, sentiment and sources
+
+    Args:
+        articles (pandas.DataFrame): Output of results_frame with a 'topic' column
+
+    Returns:
+        pandas.DataFrame: Topics ordered by number of articles
+    """
+    return articles.groupby('topic').agg(
+        articles=('doc_id', 'count'),
+        mean_polarity=('polarity', 'mean'),
+        sources=('source', 'nunique'),
+        total_words=('word_count', 'sum')
+    ).sort_values('articles', ascending=False)
@@ -4,8 +4,8 @@ Handles sentiment analysis and content analysis
 """
 from textblob import TextBlob
 import nltk
-from collections import Counter
 import re
+from utils.profiler import timed
 import config
 
 # Ensure NLTK data is available
@@ -20,7 +20,12 @@ except LookupError:
     nltk.download('stopwords', quiet=True)
 
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
+from utils.tokens import build_token_stream
+from utils.languages import (
+    is_english, normalize_language, stopwords_for, lexicon_for, sentiment_assessments, sentiment_coverage
+)
+from utils.tokenizers import cjk_script, min_word_length
+from utils.streaming_stats import StreamingStatistics, chunk_text
 
 
 class ContentAnalyzer:
@@ -32,92 +37,124 @@ class ContentAnalyzer:
         except:
             self.stop_words = set()
     
-    def analyze_sentiment(self, text):
+    @timed('analyzer.analyze_sentiment')
+    def analyze_sentiment(self, text, language='en'):
         """
         Analyze sentiment of text
         
         Args:
             text (str): Text to analyze
+            language (str): Language code; non-English text is scored with
+                the language's lexicon when one is available
             
         Returns:
-            dict: Sentiment analysis results
+            dict: Sentiment analysis results; non-English results include the
+            'lexicon_coverage' and are 'approximate' below LEXICON_MIN_COVERAGE
         """
         try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
-            subjectivity = blob.sentiment.subjectivity
-            
-            # Determine sentiment category
-            if polarity > config.SENTIMENT_THRESHOLD_POSITIVE:
-                sentiment = "Positive"
-            elif polarity < config.SENTIMENT_THRESHOLD_NEGATIVE:
-                sentiment = "Negative"
-            else:
-                sentiment = "Neutral"
-            
-            return {
-                'success': True,
-                'sentiment': sentiment,
-                'polarity': polarity,
-                'subjectivity': subjectivity,
-                'polarity_percentage': (polarity + 1) * 50,
-                'subjectivity_percentage': subjectivity * 100
-            }
+            coverage = None if is_english(language) else sentiment_coverage(text, language)
+            polarity, subjectivity, _ = sentiment_assessments(text, language)
+            return self.sentiment_result(polarity, subjectivity, coverage)
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e)
             }
     
-    def extract_keywords(self, text, top_n=10):
+    @staticmethod
+    def sentiment_result(polarity, subjectivity, coverage=None):
+        """
+        Build a sentiment result from polarity and subjectivity scores
+        
+        Args:
+            polarity (float): Polarity in [-1, 1]
+            subjectivity (float): Subjectivity in [0, 1]
+            coverage (float): Lexicon coverage of non-English text, see
+                languages.sentiment_coverage
+            
+        Returns:
+            dict: Sentiment analysis results
+        """
+        # Determine sentiment category
+        if polarity > config.SENTIMENT_THRESHOLD_POSITIVE:
+            sentiment = "Positive"
+        elif polarity < config.SENTIMENT_THRESHOLD_NEGATIVE:
+            sentiment = "Negative"
+        else:
+            sentiment = "Neutral"
+        
+        result = {
+            'success': True,
+            'sentiment': sentiment,
+            'polarity': polarity,
+            'subjectivity': subjectivity,
+            'polarity_percentage': (polarity + 1) * 50,
+            'subjectivity_percentage': subjectivity * 100
+        }
+        if coverage is not None:
+            result['lexicon_coverage'] = coverage
+            result['approximate'] = coverage < config.LEXICON_MIN_COVERAGE
+        return result
+    
+    @timed('analyzer.extract_keywords')
+    def extract_keywords(self, text, top_n=10, language='en'):
         """
         Extract top keywords from text
         
         Args:
             text (str): Text to analyze
             top_n (int): Number of top keywords to return
+            language (str): Language code selecting the stopword list
             
         Returns:
             list: Top keywords with frequencies
         """
         try:
-            # Tokenize and clean
-            words = word_tokenize(text.lower())
+            stream = build_token_stream(text, language)
+            stop_words = self.stop_words if is_english(language) else stopwords_for(language)
+            min_length = min_word_length(stream.script, 4)
             
-            # Filter words
-            words = [
-                word for word in words 
-                if word.isalnum() 
-                and len(word) > 3 
-                and word not in self.stop_words
-            ]
+            # Filter words once per vocabulary entry rather than per token
+            keep = stream.vocabulary.mask(
+                lambda word: word.isalnum()
+                and len(word) >= min_length
+                and word not in stop_words
+            )
             
             # Count frequencies
-            word_freq = Counter(words)
+            word_freq = stream.counts(keep)
             
-            return word_freq.most_common(top_n)
+            return stream.most_common(word_freq, top_n)
         except Exception as e:
             return []
     
-    def get_text_statistics(self, text):
+    @timed('analyzer.get_text_statistics')
+    def get_text_statistics(self, text, language='en'):
         """
         Get basic statistics about the text
         
         Args:
             text (str): Text to analyze
+            language (str): Language code used for sentence splitting
             
         Returns:
-            dict: Text statistics
+            dict: Text statistics, approximate for texts longer than
+            config.STREAMING_STATS_MIN_CHARS
         """
         try:
-            sentences = sent_tokenize(text)
-            words = word_tokenize(text)
+            if len(text) > config.STREAMING_STATS_MIN_CHARS:
+                script = cjk_script(normalize_language(language), text)
+                return StreamingStatistics(script=script).consume(chunk_text(text)).result()
+            
+            stream = build_token_stream(text, language)
             
             # Count words (excluding punctuation)
-            word_count = len([w for w in words if w.isalnum()])
+            alnum = stream.vocabulary.mask(str.isalnum)
+            word_count = int(stream.counts(alnum).sum())
             
             # Average sentence length
-            avg_sentence_length = word_count / len(sentences) if sentences else 0
+            sentence_count = stream.num_sentences
+            avg_sentence_length = word_count / sentence_count if sentence_count else 0
             
             # Reading time (assuming 200 words per minute)
             reading_time = word_count / 200
@@ -125,7 +162,7 @@ class ContentAnalyzer:
             return {
                 'success': True,
                 'word_count': word_count,
-                'sentence_count': len(sentences),
+                'sentence_count': sentence_count,
                 'character_count': len(text),
                 'avg_sentence_length': round(avg_sentence_length, 1),
                 'reading_time_minutes': round(reading_time, 1)
@@ -136,25 +173,30 @@ class ContentAnalyzer:
                 'error': str(e)
             }
     
-    def analyze_sentence_sentiments(self, text):
+    @timed('analyzer.analyze_sentence_sentiments')
+    def analyze_sentence_sentiments(self, text, language='en'):
         """
         Analyze sentiment for each sentence
         
         Args:
             text (str): Text to analyze
+            language (str): Language code
             
         Returns:
             list: Sentiment scores for each sentence
         """
         try:
-            sentences = sent_tokenize(text)
             sentiments = []
+            native = lexicon_for(language) is not None
             
-            for sentence in sentences:
-                blob = TextBlob(sentence)
+            for sentence in build_token_stream(text, language).sentences:
+                if native:
+                    polarity = sentiment_assessments(sentence, language)[0]
+                else:
+                    polarity = TextBlob(sentence).sentiment.polarity
                 sentiments.append({
                     'sentence': sentence[:100] + '...' if len(sentence) > 100 else sentence,
-                    'polarity': blob.sentiment.polarity
+                    'polarity': polarity
                 })
             
             return sentiments
@@ -2,11 +2,181 @@
 Article Fetcher Module
 Handles fetching and parsing articles from URLs
 """
+from datetime import datetime
+import re
+from urllib.parse import urljoin
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
+import lxml.html
+from lxml import etree
 from newspaper import Article
+from utils.profiler import timed
 import config
 
+# Elements that never hold article body text
+BOILERPLATE_TAGS = ('script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form', 'iframe')
+
+_WHITESPACE = re.compile(r'\s+')
+_XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+_META_CHARSET = re.compile(rb'<meta[^>]+charset', re.IGNORECASE)
+
+# Bytes searched for a <meta charset> declaration, as browsers do
+META_CHARSET_SCAN_BYTES = 1024
+
+
+def _meta_content(tree, *keys):
+    """Return the first non-empty <meta> content matching a name or property"""
+    for key in keys:
+        for attribute in ('property', 'name', 'itemprop'):
+            values = tree.xpath(f'//meta[@{attribute}="{key}"]/@content')
+            for value in values:
+                if value.strip():
+                    return value.strip()
+    return ''
+
+
+def _parse_date(value):
+    """Parse an ISO 8601 date string, returning None when it is not one"""
+    try:
+        return datetime.fromisoformat(value.strip())
+    except (ValueError, AttributeError):
+        return None
+
+
+def _parse_html(html):
+    """Parse HTML with lxml, accepting str pages that carry an XML declaration"""
+    if isinstance(html, str):
+        html = _XML_DECLARATION.sub('', html, count=1)
+    return lxml.html.fromstring(html)
+
+
+def decode_page(content, content_type=''):
+    """
+    Decode a downloaded page with the charset it was served with
+
+    The Content-Type header wins. Without it, pages declaring a
+    <meta charset> are left as bytes for lxml to decode; lxml would guess
+    Latin-1 for the others, so they are decoded as UTF-8 when valid and
+    with the detected encoding otherwise.
+
+    Args:
+        content (bytes): Raw page content
+        content_type (str): Content-Type response header
+
+    Returns:
+        str or bytes: Decoded page, or bytes lxml can decode itself
+    """
+    charset = requests.utils.get_encoding_from_headers({'content-type': content_type})
+    if charset and 'charset' in content_type.lower():
+        try:
+            return content.decode(charset, errors='replace')
+        except LookupError:
+            pass
+    if _META_CHARSET.search(content[:META_CHARSET_SCAN_BYTES]):
+        return content
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        encoding = chardet.detect(content)['encoding'] or 'utf-8'
+        return content.decode(encoding, errors='replace')
+
+
+def _clean_text(text):
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def parse_article_html(html, url=''):
+    """
+    Extract article fields from HTML with a single lxml parse
+
+    Args:
+        html (str or bytes): Page HTML
+        url (str): Page URL, used to resolve relative image links
+
+    Returns:
+        dict: title, text, authors, publish_date and top_image
+    """
+    tree = _parse_html(html)
+
+    # Metadata
+    title = _meta_content(tree, 'og:title', 'twitter:title')
+    if not title:
+        title = _clean_text(tree.findtext('.//title') or '')
+    if not title:
+        headings = tree.xpath('//h1')
+        title = _clean_text(headings[0].text_content()) if headings else ''
+
+    authors = []
+    for author in (
+        tree.xpath('//meta[@name="author" or @property="article:author"]/@content')
+        + [element.text_content() for element in tree.xpath('//*[@rel="author" or @itemprop="author"]')]
+    ):
+        author = _clean_text(author)
+        if author and not author.startswith('http') and author not in authors:
+            authors.append(author)
+
+    publish_date = _parse_date(
+        _meta_content(tree, 'article:published_time', 'datePublished', 'pubdate', 'date')
+        or next(iter(tree.xpath('//time/@datetime')), '')
+    )
+
+    top_image = _meta_content(tree, 'og:image', 'twitter:image')
+    if top_image and url:
+        top_image = urljoin(url, top_image)
+
+    # Body: the container whose direct paragraphs hold the most text
+    etree.strip_elements(tree, *BOILERPLATE_TAGS, with_tail=False)
+
+    best_paragraphs = []
+    best_length = 0
+    containers = dict.fromkeys(paragraph.getparent() for paragraph in tree.iter('p'))
+    for container in containers:
+        if container is None:
+            continue
+        paragraphs = [_clean_text(p.text_content()) for p in container.iterchildren('p')]
+        paragraphs = [p for p in paragraphs if p]
+        length = sum(len(p) for p in paragraphs)
+        if length > best_length:
+            best_paragraphs, best_length = paragraphs, length
+
+    return {
+        'title': title,
+        'text': '\n\n'.join(best_paragraphs),
+        'authors': authors,
+        'publish_date': publish_date,
+        'top_image': top_image
+    }
+
+
+def extract_article(html, url=''):
+    """
+    Extract an article from downloaded HTML, falling back to newspaper
+
+    Args:
+        html (str or bytes): Page HTML
+        url (str): Page URL
+
+    Returns:
+        dict: title, text, authors, publish_date and top_image
+    """
+    article = parse_article_html(html, url)
+
+    if not article['text']:
+        # Fall back to newspaper's heuristics, reusing the downloaded page
+        fallback = Article(url)
+        fallback.download(input_html=html)
+        fallback.parse()
+        article = {
+            'title': fallback.title,
+            'text': fallback.text,
+            'authors': fallback.authors,
+            'publish_date': fallback.publish_date,
+            'top_image': fallback.top_image
+        }
+
+    return article
+
 
 class ArticleFetcher:
     """Fetch and parse articles from URLs"""
@@ -15,7 +185,45 @@ class ArticleFetcher:
         self.headers = {
             'User-Agent': config.USER_AGENT
         }
+        
+        # Pooled, keep-alive connections shared by all fetches
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=config.FETCH_POOL_SIZE, pool_maxsize=config.FETCH_POOL_SIZE)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
+    def download(self, url):
+        """
+        Download a page with the pooled session
+        
+        Args:
+            url (str): Page URL
+            
+        Returns:
+            str or bytes: Page decoded by decode_page()
+            
+        Raises:
+            ValueError: If the page is larger than config.MAX_DOWNLOAD_BYTES
+        """
+        with self.session.get(url, timeout=config.REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            
+            length = response.headers.get('Content-Length')
+            if length and length.isdigit() and int(length) > config.MAX_DOWNLOAD_BYTES:
+                raise ValueError(f"Page is {int(length):,} bytes, the limit is {config.MAX_DOWNLOAD_BYTES:,}")
+            
+            # The header can be missing or wrong, so count while reading
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                size += len(chunk)
+                if size > config.MAX_DOWNLOAD_BYTES:
+                    raise ValueError(f"Page is larger than the limit of {config.MAX_DOWNLOAD_BYTES:,} bytes")
+                chunks.append(chunk)
+            return decode_page(b''.join(chunks), response.headers.get('Content-Type', ''))
+    
+    @timed('fetcher.fetch_from_url')
     def fetch_from_url(self, url):
         """
         Fetch article content from URL
@@ -27,19 +235,8 @@ class ArticleFetcher:
             dict: Article data including title, text, authors, publish_date
         """
         try:
-            article = Article(url)
-            article.download()
-            article.parse()
-            
-            return {
-                'success': True,
-                'title': article.title,
-                'text': article.text,
-                'authors': article.authors,
-                'publish_date': article.publish_date,
-                'top_image': article.top_image,
-                'url': url
-            }
+            article = extract_article(self.download(url), url)
+            return {'success': True, **article, 'url': url}
         except Exception as e:
             return {
                 'success': False,
@@ -47,6 +244,7 @@ class ArticleFetcher:
                 'message': 'Failed to fetch article. Please check the URL or try pasting the text directly.'
             }
     
+    @timed('fetcher.extract_text_from_html')
     def extract_text_from_html(self, html_content):
         """
         Extract text from HTML content
@@ -58,14 +256,16 @@ class ArticleFetcher:
             str: Extracted text
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            if not html_content or not html_content.strip():
+                return ''
+            
+            tree = _parse_html(html_content)
             
             # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.extract()
+            etree.strip_elements(tree, 'script', 'style', with_tail=False)
             
             # Get text
-            text = soup.get_text()
+            text = tree.text_content()
             
             # Clean up whitespace
             lines = (line.strip() for line in text.splitlines())
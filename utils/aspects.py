@@ -0,0 +1,102 @@
+"""
+Aspects Module
+Sentiment towards keywords and entities from existing sentence scores
+"""
+import numpy as np
+from utils.tokens import build_token_stream
+import config
+
+
+def _label(polarity):
+    """Sentiment category of a polarity, as in ContentAnalyzer.sentiment_result"""
+    if polarity > config.SENTIMENT_THRESHOLD_POSITIVE:
+        return "Positive"
+    if polarity < config.SENTIMENT_THRESHOLD_NEGATIVE:
+        return "Negative"
+    return "Neutral"
+
+
+def aspect_sentiments(text, polarities, keywords=None, entities=None, language='en'):
+    """
+    Average sentence polarity around each keyword and entity
+
+    Sentences are not scored again: keywords are located through the
+    document's token stream and entities through the sentence numbers they
+    carry, then all term/sentence pairs are aggregated in one pass.
+
+    Args:
+        text (str): Text the sentence polarities were computed on
+        polarities (list): Polarity of each sentence of text, e.g. from
+            ContentAnalyzer.analyze_sentence_sentiments
+        keywords (list): (keyword, count) tuples from extract_keywords
+        entities (list): Entity dicts from EntityExtractor.extract_entities
+        language (str): Language code used for sentence splitting
+
+    Returns:
+        dict: 'keywords' and 'entities' as dicts with 'term', 'type',
+        'mentions' (sentences mentioning the term), mean 'polarity',
+        'sentiment' and the number of 'positive'/'negative' sentences
+    """
+    try:
+        polarities = np.asarray(polarities, dtype=np.float64)
+        keywords = keywords or []
+        entities = entities or []
+
+        # Keywords are single tokens of the stream the keywords came from
+        stream = build_token_stream(text, language)
+        if stream.num_sentences != len(polarities):
+            raise ValueError("Sentence polarities do not match the text's sentences")
+        token_ids = [stream.vocabulary.index.get(keyword, -1) for keyword, _ in keywords]
+        found = [i for i, token_id in enumerate(token_ids) if token_id >= 0]
+        keyword_terms, keyword_sentences = stream.term_sentences([token_ids[i] for i in found])
+        keyword_terms = np.asarray(found, dtype=np.int64)[keyword_terms]
+
+        # Entities already list the sentences that mention them
+        entity_sentences = [entity['sentences'] for entity in entities]
+        entity_terms = np.repeat(
+            np.arange(len(keywords), len(keywords) + len(entities)),
+            [len(sentences) for sentences in entity_sentences]
+        )
+
+        terms = np.concatenate([keyword_terms, entity_terms]).astype(np.int64)
+        sentences = np.concatenate([
+            keyword_sentences, np.fromiter(
+                (index for sentences in entity_sentences for index in sentences),
+                dtype=np.int64, count=len(entity_terms)
+            )
+        ]).astype(np.int64)
+
+        num_terms = len(keywords) + len(entities)
+        scores = polarities[sentences]
+        mentions = np.bincount(terms, minlength=num_terms)
+        totals = np.bincount(terms, weights=scores, minlength=num_terms)
+        positive = np.bincount(terms, weights=scores > config.SENTIMENT_THRESHOLD_POSITIVE, minlength=num_terms)
+        negative = np.bincount(terms, weights=scores < config.SENTIMENT_THRESHOLD_NEGATIVE, minlength=num_terms)
+        means = np.divide(totals, mentions, out=np.zeros(num_terms), where=mentions > 0)
+
+        names = [keyword for keyword, _ in keywords] + [entity['entity'] for entity in entities]
+        types = ['keyword'] * len(keywords) + [entity['type'] for entity in entities]
+        rows = [
+            {
+                'term': names[i],
+                'type': types[i],
+                'mentions': int(mentions[i]),
+                'polarity': round(float(means[i]), 4),
+                'sentiment': _label(means[i]),
+                'positive': int(positive[i]),
+                'negative': int(negative[i])
+            }
+            for i in range(num_terms)
+            if mentions[i]
+        ]
+
+        return {
+            'success': True,
+            'keywords': [row for row in rows if row['type'] == 'keyword'],
+            'entities': [row for row in rows if row['type'] != 'keyword']
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
@@ -0,0 +1,156 @@
+"""
+Bulk Fetcher Module
+Downloads many articles concurrently and parses them in a process pool
+"""
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from utils.article_fetcher import ArticleFetcher, extract_article
+import config
+
+_DONE = object()
+
+
+class BulkFetcher:
+    """
+    Fetch many URLs with download concurrency that adapts to parse throughput
+
+    Downloaded pages wait in a bounded queue for the parse process pool. When
+    the queue fills up, downloaders block and the download concurrency limit is
+    halved; when it drains, the limit grows again one step at a time. Memory is
+    bounded by the queue size plus the pages being parsed.
+    """
+
+    def __init__(self, fetcher=None, parse_workers=None, max_downloads=None, queue_size=None):
+        self.fetcher = fetcher or ArticleFetcher()
+        self.parse_workers = parse_workers or config.BULK_PARSE_WORKERS or os.cpu_count() or 1
+        self.max_downloads = max_downloads or config.BULK_MAX_DOWNLOADS
+        self.queue_size = queue_size or config.BULK_QUEUE_SIZE
+        self.download_limit = min(self.parse_workers, self.max_downloads)
+
+        self._condition = threading.Condition()
+        self._active_downloads = 0
+
+    def _adapt(self, parse_queue):
+        """Adjust the download limit from the parse queue fill level"""
+        fill = parse_queue.qsize() / self.queue_size
+        if fill >= 0.75:
+            self.download_limit = max(1, self.download_limit // 2)
+        elif fill <= 0.25:
+            self.download_limit = min(self.max_downloads, self.download_limit + 1)
+
+    def _download(self, url, parse_queue, results, stop):
+        """Download one page and hand it to the parse stage"""
+        with self._condition:
+            while self._active_downloads >= self.download_limit and not stop.is_set():
+                self._condition.wait()
+            self._active_downloads += 1
+
+        try:
+            if stop.is_set():
+                return
+            html = self.fetcher.download(url)
+
+            # Wait while the parse stage is behind
+            while not stop.is_set():
+                try:
+                    parse_queue.put((url, html), timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+        except Exception as e:
+            results.put(self._failure(url, e))
+        finally:
+            with self._condition:
+                self._active_downloads -= 1
+                self._adapt(parse_queue)
+                self._condition.notify_all()
+
+    def _dispatch(self, pool, parse_queue, results):
+        """Feed downloaded pages to the process pool"""
+        in_flight = threading.Semaphore(self.parse_workers * 2)
+        broken = None
+
+        while True:
+            item = parse_queue.get()
+            if item is _DONE:
+                break
+
+            url, html = item
+            # Once the pool is unusable (e.g. a worker died), keep draining so
+            # every URL still gets a result and downloaders are not blocked
+            if broken is not None:
+                results.put(self._failure(url, broken))
+                continue
+
+            in_flight.acquire()
+            try:
+                future = pool.submit(extract_article, html, url)
+            except Exception as e:
+                in_flight.release()
+                broken = e
+                results.put(self._failure(url, e))
+                continue
+
+            def collect(future, url=url):
+                in_flight.release()
+                try:
+                    results.put({'success': True, **future.result(), 'url': url})
+                except Exception as e:
+                    results.put(self._failure(url, e))
+
+            future.add_done_callback(collect)
+
+    @staticmethod
+    def _failure(url, error):
+        return {
+            'success': False,
+            'url': url,
+            'error': str(error),
+            'message': 'Failed to fetch article. Please check the URL or try pasting the text directly.'
+        }
+
+    def fetch_many(self, urls):
+        """
+        Fetch and parse many articles
+
+        Args:
+            urls (iterable): Article URLs
+
+        Yields:
+            dict: Article data in the format of ArticleFetcher.fetch_from_url,
+            in completion order
+        """
+        urls = list(urls)
+        parse_queue = queue.Queue(maxsize=self.queue_size)
+        results = queue.Queue()
+        stop = threading.Event()
+
+        downloads = ThreadPoolExecutor(max_workers=self.max_downloads, thread_name_prefix='bulk-download')
+        pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        dispatcher = threading.Thread(target=self._dispatch, args=(pool, parse_queue, results), daemon=True)
+        dispatcher.start()
+
+        try:
+            for url in urls:
+                downloads.submit(self._download, url, parse_queue, results, stop)
+
+            for _ in urls:
+                yield results.get()
+        finally:
+            stop.set()
+            with self._condition:
+                self._condition.notify_all()
+
+            downloads.shutdown(wait=True, cancel_futures=True)
+
+            # Drop pages nobody will read, then stop the dispatcher
+            while True:
+                try:
+                    parse_queue.get_nowait()
+                except queue.Empty:
+                    break
+            parse_queue.put(_DONE)
+            dispatcher.join()
+            pool.shutdown(wait=True, cancel_futures=True)
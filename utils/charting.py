@@ -0,0 +1,101 @@
+"""
+Charting Module
+Server-side aggregation of long per-sentence series for plotting
+"""
+import numpy as np
+import config
+
+
+def rolling_mean(values, window):
+    """
+    Trailing rolling mean computed with a cumulative sum
+
+    Args:
+        values (numpy.ndarray): Series values
+        window (int): Window size
+
+    Returns:
+        numpy.ndarray: Mean of the last `window` values at each position
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if window <= 1 or values.size == 0:
+        return values
+    cumulative = np.cumsum(np.concatenate(([0.0], values)))
+    counts = np.minimum(np.arange(1, values.size + 1), window)
+    starts = np.arange(1, values.size + 1) - counts
+    return (cumulative[1:] - cumulative[starts]) / counts
+
+
+def downsample_minmax(values, max_points):
+    """
+    Reduce a series to at most max_points while keeping its peaks
+
+    Each bucket contributes its minimum and maximum, in index order, so
+    spikes stay visible however long the series is.
+
+    Args:
+        values (numpy.ndarray): Series values
+        max_points (int): Maximum number of output points
+
+    Returns:
+        tuple: (indices, values, bucket means, bucket starts) arrays
+    """
+    values = np.asarray(values, dtype=np.float64)
+    size = values.size
+    if size <= max_points:
+        indices = np.arange(size)
+        return indices, values, values, indices
+
+    num_buckets = max(1, max_points // 2)
+    edges = np.linspace(0, size, num_buckets + 1).astype(np.int64)
+    starts = edges[:-1]
+
+    # Index of the min and max inside every bucket
+    min_index = np.empty(num_buckets, dtype=np.int64)
+    max_index = np.empty(num_buckets, dtype=np.int64)
+    for bucket, (start, end) in enumerate(zip(starts, edges[1:])):
+        chunk = values[start:end]
+        min_index[bucket] = start + np.argmin(chunk)
+        max_index[bucket] = start + np.argmax(chunk)
+
+    indices = np.sort(np.concatenate((min_index, max_index)))
+    indices = indices[np.concatenate(([True], np.diff(indices) > 0))]
+    means = np.add.reduceat(values, starts) / np.diff(edges)
+    return indices, values[indices], means, starts
+
+
+def sentiment_series(sentence_sentiments, start=0, end=None, max_points=None):
+    """
+    Prepare the sentiment-flow chart data for a range of sentences
+
+    Args:
+        sentence_sentiments (list): Output of ContentAnalyzer.analyze_sentence_sentiments
+        start (int): First sentence of the range
+        end (int): End of the range (exclusive), defaults to the last sentence
+        max_points (int): Maximum points to send to the browser
+
+    Returns:
+        dict: 'index'/'polarity' points, 'mean_index'/'mean' bucket averages
+        and whether the series was 'decimated'
+    """
+    max_points = max_points or config.CHART_MAX_POINTS
+    polarity = np.fromiter(
+        (item['polarity'] for item in sentence_sentiments),
+        dtype=np.float64,
+        count=len(sentence_sentiments)
+    )
+    end = len(polarity) if end is None else min(end, len(polarity))
+    window = polarity[start:end]
+
+    indices, values, means, starts = downsample_minmax(window, max_points)
+    decimated = len(window) > max_points
+    if not decimated:
+        means = rolling_mean(window, max(1, len(window) // 20))
+
+    return {
+        'index': indices + start,
+        'polarity': values,
+        'mean_index': starts + start,
+        'mean': means,
+        'decimated': decimated
+    }
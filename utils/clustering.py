@@ -0,0 +1,283 @@
+"""
+Clustering Module
+Topic clusters of many articles from hashed TF-IDF vectors and mini-batch k-means
+"""
+import zlib
+from collections import Counter
+from itertools import islice
+import numpy as np
+from utils.languages import normalize_language, split_sentences, stopwords_for
+from utils.tokenizers import cjk_script, min_word_length, word_tokenizer
+import config
+
+
+def content_terms(text, language='en'):
+    """
+    Content words of a document, filtered like ContentAnalyzer.extract_keywords
+
+    Args:
+        text (str): Document text
+        language (str): Language code
+
+    Returns:
+        list: Lower-cased content words in document order
+    """
+    code = normalize_language(language)
+    script = cjk_script(code, text)
+    tokenize = word_tokenizer(script)
+    stop_words = stopwords_for(code)
+    min_length = min_word_length(script, 4)
+    return [
+        word
+        for sentence in split_sentences(text, code)
+        for word in (token.lower() for token in tokenize(sentence))
+        if word.isalnum() and len(word) >= min_length and word not in stop_words
+    ]
+
+
+def _term_counts(document):
+    """Counter of a term list or of (term, count) pairs such as extracted keywords"""
+    if document and isinstance(document[0], (tuple, list)):
+        return Counter(dict(document))
+    return Counter(document)
+
+
+class TopicClusterer:
+    """
+    Online spherical k-means over hashed TF-IDF vectors
+
+    Terms are hashed into a fixed number of features, so no vocabulary has
+    to be built or kept. Document frequencies and centroids are updated one
+    mini-batch at a time, which keeps memory bounded by n_clusters x
+    n_features however many documents are clustered. Documents can be
+    term lists (see content_terms) or (term, count) keyword pairs.
+    """
+
+    def __init__(self, n_clusters=None, n_features=None, batch_size=None, seed=0):
+        self.n_clusters = n_clusters or config.CLUSTER_COUNT
+        self.n_features = n_features or config.CLUSTER_FEATURES
+        self.batch_size = batch_size or config.CLUSTER_BATCH_SIZE
+        self.rng = np.random.default_rng(seed)
+
+        self.document_frequency = np.zeros(self.n_features, dtype=np.int64)
+        self.num_documents = 0
+        self.centroids = None
+        self.cluster_sizes = np.zeros(self.n_clusters, dtype=np.int64)
+        # A word per hashed feature, to name clusters by their top features
+        self.feature_words = {}
+
+    def _feature(self, term):
+        return zlib.crc32(term.encode('utf-8')) % self.n_features
+
+    def _vectorize(self, documents, update_frequencies=False):
+        """
+        Hash documents into L2-normalized TF-IDF rows
+
+        Returns:
+            tuple: CSR arrays (indptr, indices, data)
+        """
+        rows = []
+        for document in documents:
+            features = Counter()
+            for term, count in _term_counts(document).items():
+                feature = self._feature(term)
+                features[feature] += count
+                self.feature_words.setdefault(feature, term)
+            rows.append(features)
+
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in rows], out=indptr[1:])
+        indices = np.fromiter((f for row in rows for f in row), dtype=np.int64, count=indptr[-1])
+        counts = np.fromiter((c for row in rows for c in row.values()), dtype=np.float64, count=indptr[-1])
+
+        if update_frequencies:
+            np.add.at(self.document_frequency, indices, 1)
+            self.num_documents += len(rows)
+
+        # Sublinear term frequency times smoothed inverse document frequency
+        idf = np.log((1 + self.num_documents) / (1 + self.document_frequency[indices])) + 1
+        data = (1 + np.log(counts)) * idf
+
+        lengths = np.diff(indptr)
+        nonempty = lengths > 0
+        norms = np.ones(len(rows))
+        if len(data):
+            norms[nonempty] = np.sqrt(np.add.reduceat(data ** 2, indptr[:-1][nonempty]))
+        data /= np.repeat(norms, lengths)
+        return indptr, indices, data
+
+    @staticmethod
+    def _similarities(indptr, indices, data, centroids):
+        """Dot products of sparse rows with dense centroids, shape (rows, clusters)"""
+        rows = len(indptr) - 1
+        result = np.zeros((rows, len(centroids)))
+        if not len(data):
+            return result
+        contributions = centroids[:, indices] * data
+        nonempty = np.diff(indptr) > 0
+        result[nonempty] = np.add.reduceat(contributions, indptr[:-1][nonempty], axis=1).T
+        return result
+
+    def _initialize(self, indptr, indices, data):
+        """Choose initial centroids among the rows with greedy k-means++ seeding"""
+        nonempty = np.flatnonzero(np.diff(indptr) > 0)
+        if not len(nonempty):
+            return
+
+        def dense(row):
+            centroid = np.zeros(self.n_features)
+            centroid[indices[indptr[row]:indptr[row + 1]]] = data[indptr[row]:indptr[row + 1]]
+            return centroid
+
+        def distances(rows):
+            # Squared distance of unit vectors is 2 - 2 * cosine
+            centroids = np.stack([dense(row) for row in rows])
+            similarity = self._similarities(indptr, indices, data, centroids)[nonempty]
+            return np.maximum(2 - 2 * similarity, 0).T
+
+        # Like scikit-learn, try a few candidates per centroid and keep the
+        # one that reduces the total distance the most
+        trials = 2 + int(np.log(self.n_clusters))
+        chosen = [self.rng.choice(nonempty)]
+        closest = distances(chosen)[0]
+        while len(chosen) < self.n_clusters:
+            weights = closest if closest.sum() > 0 else np.ones(len(nonempty))
+            size = min(trials, int(np.count_nonzero(weights)))
+            candidates = self.rng.choice(nonempty, size=size, replace=False, p=weights / weights.sum())
+            potentials = np.minimum(closest, distances(candidates))
+            best = potentials.sum(axis=1).argmin()
+            chosen.append(candidates[best])
+            closest = potentials[best]
+
+        self.centroids = np.stack([dense(row) for row in chosen])
+
+    def partial_fit(self, documents):
+        """
+        Update the clusters with one mini-batch of documents
+
+        Args:
+            documents (list): Term lists or (term, count) pairs
+
+        Returns:
+            numpy.ndarray: Cluster of each document, -1 for documents without terms
+        """
+        indptr, indices, data = self._vectorize(documents, update_frequencies=True)
+        if self.centroids is None:
+            self._initialize(indptr, indices, data)
+            if self.centroids is None:
+                return np.full(len(documents), -1)
+
+        labels = self._assign(indptr, indices, data)
+        assigned = labels >= 0
+        if not assigned.any():
+            return labels
+
+        # Each centroid moves to the running mean of its documents
+        batch_sizes = np.bincount(labels[assigned], minlength=self.n_clusters)
+        totals = self.cluster_sizes + batch_sizes
+        touched = batch_sizes > 0
+        self.centroids[touched] *= (self.cluster_sizes[touched] / totals[touched])[:, None]
+
+        row_labels = np.repeat(labels, np.diff(indptr))
+        keep = row_labels >= 0
+        np.add.at(
+            self.centroids,
+            (row_labels[keep], indices[keep]),
+            data[keep] / totals[row_labels[keep]]
+        )
+        self.cluster_sizes = totals
+        return labels
+
+    def fit(self, documents, epochs=1):
+        """
+        Cluster documents in mini-batches
+
+        Args:
+            documents (iterable): Term lists or keyword pairs; must be
+                re-iterable (e.g. a list) when epochs > 1
+            epochs (int): Passes over the documents
+
+        Returns:
+            TopicClusterer: self, for chaining
+        """
+        for _ in range(epochs):
+            iterator = iter(documents)
+            while True:
+                batch = list(islice(iterator, self.batch_size))
+                if not batch:
+                    break
+                self.partial_fit(batch)
+        return self
+
+    def _assign(self, indptr, indices, data):
+        """Closest centroid by cosine similarity, -1 for empty rows"""
+        norms = np.linalg.norm(self.centroids, axis=1)
+        similarities = self._similarities(indptr, indices, data, self.centroids)
+        similarities /= np.where(norms > 0, norms, 1.0)
+        labels = similarities.argmax(axis=1)
+        labels[np.diff(indptr) == 0] = -1
+        return labels
+
+    def predict(self, documents):
+        """
+        Cluster of each document
+
+        Args:
+            documents (list): Term lists or (term, count) pairs
+
+        Returns:
+            numpy.ndarray: Cluster numbers, -1 for documents without terms
+        """
+        if self.centroids is None:
+            return np.full(len(documents), -1)
+        return self._assign(*self._vectorize(documents))
+
+    def top_terms(self, cluster, top_n=5):
+        """
+        Highest weighted terms of a cluster
+
+        Args:
+            cluster (int): Cluster number
+            top_n (int): Number of terms
+
+        Returns:
+            list: (term, weight) tuples
+        """
+        weights = self.centroids[cluster]
+        order = np.argsort(-weights, kind='stable')[:top_n]
+        return [
+            (self.feature_words[feature], float(weights[feature]))
+            for feature in order
+            if weights[feature] > 0 and feature in self.feature_words
+        ]
+
+    def label(self, cluster, top_n=3):
+        """
+        Short cluster name from its top terms
+
+        The cluster number is part of the name, so clusters sharing their top
+        terms are not merged when grouping by label.
+        """
+        if cluster < 0:
+            return 'Unclustered'
+        terms = ', '.join(term for term, _ in self.top_terms(cluster, top_n))
+        return f"Topic {cluster + 1}: {terms}" if terms else f"Topic {cluster + 1}"
+
+
+def cluster_results(results, n_clusters=None, epochs=5):
+    """
+    Group analyzed articles into topics by their extracted keywords
+
+    Args:
+        results (list): Results of AnalysisPipeline.analyze with 'keywords'
+        n_clusters (int): Number of topics, defaults to config.CLUSTER_COUNT
+            (at most one per article with keywords)
+        epochs (int): Passes over the articles
+
+    Returns:
+        tuple: (cluster of each article, -1 without keywords; TopicClusterer)
+    """
+    documents = [result.get('keywords') or [] for result in results]
+    n_clusters = min(n_clusters or config.CLUSTER_COUNT, max(sum(1 for d in documents if d), 1))
+    clusterer = TopicClusterer(n_clusters=n_clusters).fit(documents, epochs=epochs)
+    return clusterer.predict(documents), clusterer
@@ -0,0 +1,190 @@
+"""
+Corpus Module
+Packed, memory-mapped corpus files for large offline batch runs
+
+File layout (all integers little-endian uint64):
+    MAGIC | UTF-8 document blob | offsets[count + 1] | count | index_position | MAGIC
+"""
+import codecs
+import json
+import mmap
+import os
+import struct
+from array import array
+import numpy as np
+from utils.streaming_stats import StreamingStatistics
+from utils.tokenizers import detect_script
+
+MAGIC = b'AGCORP01'
+_TRAILER = struct.Struct('<QQ8s')
+
+
+def write_corpus(path, texts):
+    """
+    Write documents to a packed corpus file
+
+    Documents are streamed to disk, so only their offsets are kept in memory.
+
+    Args:
+        path (str): Output file path
+        texts (iterable): Document texts
+
+    Returns:
+        int: Number of documents written
+    """
+    offsets = array('Q', [0])
+    tmp_path = path + '.tmp'
+
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        position = 0
+        for text in texts:
+            data = text.encode('utf-8')
+            f.write(data)
+            position += len(data)
+            offsets.append(position)
+
+        index_position = len(MAGIC) + position
+        f.write(np.asarray(offsets, dtype='<u8').tobytes())
+        f.write(_TRAILER.pack(len(offsets) - 1, index_position, MAGIC))
+
+    os.replace(tmp_path, path)
+    return len(offsets) - 1
+
+
+def convert_json_dump(json_path, corpus_path, text_field='text'):
+    """
+    Convert a JSON array or JSON Lines dump of articles into a corpus file
+
+    Args:
+        json_path (str): Input .json (array of objects) or .jsonl file
+        corpus_path (str): Output corpus path
+        text_field (str): Field holding the article text
+
+    Returns:
+        int: Number of documents written
+    """
+    def documents():
+        with open(json_path, encoding='utf-8') as f:
+            if json_path.endswith('.jsonl'):
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)[text_field]
+            else:
+                for record in json.load(f):
+                    yield record[text_field]
+
+    return write_corpus(corpus_path, documents())
+
+
+class CorpusReader:
+    """Zero-copy, random access reader for packed corpus files"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        count, index_position, magic = _TRAILER.unpack_from(self._mmap, len(self._mmap) - _TRAILER.size)
+        if magic != MAGIC or self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Not a corpus file: {path}")
+
+        self._blob_start = len(MAGIC)
+        self.offsets = np.frombuffer(self._mmap, dtype='<u8', count=count + 1, offset=index_position)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def get_bytes(self, index):
+        """
+        Get the UTF-8 bytes of a document without copying
+
+        Args:
+            index (int): Document number
+
+        Returns:
+            memoryview: View into the mapped file
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        start = self._blob_start + int(self.offsets[index])
+        end = self._blob_start + int(self.offsets[index + 1])
+        return memoryview(self._mmap)[start:end]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        return str(self.get_bytes(index), 'utf-8')
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def shard(self, worker_index, num_workers):
+        """
+        Get the document range handled by one of several workers
+
+        Args:
+            worker_index (int): Worker number, starting at 0
+            num_workers (int): Total number of workers
+
+        Returns:
+            range: Document numbers for this worker
+        """
+        size = len(self)
+        return range(size * worker_index // num_workers, size * (worker_index + 1) // num_workers)
+
+    def statistics(self, indices=None, chunk_size=1 << 20):
+        """
+        Corpus-wide statistics in constant memory
+
+        Documents are decoded and counted in chunks, so even very large
+        documents are never held as a whole. Statistics of shards computed by
+        different workers combine with StreamingStatistics.merge().
+
+        Args:
+            indices (iterable): Document numbers, defaults to all documents
+            chunk_size (int): Bytes decoded at a time
+
+        Returns:
+            StreamingStatistics: Counts and vocabulary sketch of the documents
+        """
+        stats = StreamingStatistics()
+        for index in range(len(self)) if indices is None else indices:
+            data = self.get_bytes(index)
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            for start in range(0, len(data), chunk_size):
+                chunk = decoder.decode(data[start:start + chunk_size])
+                if not start:
+                    # CJK documents are tokenized by script
+                    stats.script = detect_script(chunk)
+                stats.update(chunk)
+            stats.update(decoder.decode(b'', final=True))
+            stats.end_document()
+            data.release()
+        return stats
+
+    def close(self):
+        """Unmap the file"""
+        self.offsets = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views handed out by get_bytes are still alive
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def __getstate__(self):
+        # Worker processes reopen the file and share it through the page cache
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
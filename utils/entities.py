@@ -0,0 +1,345 @@
+"""
+Entities Module
+Named-entity extraction with a transformers model or a capitalization heuristic
+"""
+import hashlib
+import re
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from utils.tokens import build_token_stream
+from utils.languages import normalize_language, stopwords_for
+from utils.tokenizers import cjk_script
+from utils.resources import resource_manager
+from utils.profiler import timed
+import config
+
+# Model predictions below this confidence are dropped
+MIN_ENTITY_SCORE = 0.5
+# Tokens shared by consecutive chunks of sentences longer than the model input
+NER_STRIDE = 32
+
+# Word starts with a letter of any script; runs of capitalized words,
+# optionally joined by lower-case connectors, are entity candidates
+_WORD_START = re.compile(r"(?<![\w'])(?:[^\W\d_]|&)")
+_CAPITALIZED_REST = re.compile(r"[\w&.'-]*")
+_LOWER_REST = re.compile(r"\w*")
+_CONNECTORS = {'of', 'de', 'del', 'la', 'van', 'von', 'der', 'for', 'and', '&'}
+_POSSESSIVE = re.compile(r"(?:['\u2019]s|[.'-])+$")
+
+_TITLES = {
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'sir', 'president', 'minister', 'senator', 'judge',
+    'governor', 'chancellor', 'ceo', 'chairman', 'chairwoman', 'mayor', 'king', 'queen',
+    'chief', 'executive', 'secretary', 'general', 'director', 'spokesman', 'spokeswoman'
+}
+_ORG_WORDS = {
+    'inc', 'corp', 'corporation', 'ltd', 'llc', 'plc', 'co', 'company', 'group', 'bank',
+    'university', 'institute', 'agency', 'ministry', 'council', 'party', 'association',
+    'foundation', 'committee', 'commission', 'department', 'court', 'union', 'fund', 'times'
+}
+_LOC_WORDS = {
+    'city', 'county', 'state', 'river', 'mountain', 'mountains', 'island', 'islands',
+    'street', 'valley', 'lake', 'sea', 'ocean', 'province', 'republic', 'kingdom'
+}
+_LOC_CUES = {'in', 'at', 'from', 'near', 'across', 'to', 'into'}
+# Latin-script languages that capitalize proper nouns but not common nouns,
+# the only ones the capitalization heuristic can work on
+HEURISTIC_LANGUAGES = {'en', 'es', 'fr', 'it', 'pt'}
+
+# Capitalized like names but not entities
+_CALENDAR_WORDS = {
+    'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
+    'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august',
+    'september', 'october', 'november', 'december'
+}
+
+
+def _candidates(sentence):
+    """
+    Runs of capitalized words in one sentence
+
+    A single lower-case connector may join two capitalized words, as in
+    "Bank of England" or "Banco de España".
+
+    Returns:
+        list: (start, text) tuples
+    """
+    # (start, end) of each word; lower-case words end at the first non-word
+    # character, so a capitalized word after a hyphen or dot starts anew
+    words = []
+    match = _WORD_START.search(sentence)
+    while match:
+        rest = _CAPITALIZED_REST if match.group().isupper() else _LOWER_REST
+        end = rest.match(sentence, match.end()).end()
+        words.append((match.start(), end))
+        match = _WORD_START.search(sentence, end)
+
+    def capitalized(index):
+        return index < len(words) and sentence[words[index][0]].isupper()
+
+    def adjacent(index):
+        # Only whitespace between a word and the next one
+        return index + 1 < len(words) and not sentence[words[index][1]:words[index + 1][0]].strip()
+
+    candidates = []
+    index = 0
+    while index < len(words):
+        if not capitalized(index):
+            index += 1
+            continue
+        first = index
+        while True:
+            if adjacent(index) and capitalized(index + 1):
+                index += 1
+            elif (adjacent(index) and sentence[slice(*words[index + 1])] in _CONNECTORS
+                  and adjacent(index + 1) and capitalized(index + 2)):
+                index += 2
+            else:
+                break
+        start = words[first][0]
+        candidates.append((start, sentence[start:words[index][1]]))
+        index += 1
+    return candidates
+
+
+def _heuristic_entities(sentence):
+    """
+    Entity candidates of one sentence from capitalization
+
+    Returns:
+        list: (text, type, at_sentence_start) tuples
+    """
+    entities = []
+    for start, candidate in _candidates(sentence):
+        text = _POSSESSIVE.sub('', candidate)
+        words = text.split()
+        if words and words[0].lower() in ('the', 'a', 'an'):
+            words = words[1:]
+        if not words:
+            continue
+
+        before = sentence[:start].split()
+        previous = before[-1].lower().rstrip('.,') if before else ''
+        at_start = not before or before[-1][-1] in '.!?:"\u201c'
+
+        if len(words) == 1 and words[0].lower() in _CALENDAR_WORDS:
+            continue
+
+        # Leading titles mark a person and are not part of the name
+        titles = 0
+        while titles < len(words) - 1 and words[titles].lower().rstrip('.') in _TITLES:
+            titles += 1
+        if titles:
+            entity_type = 'PER'
+            words = words[titles:]
+            at_start = False
+        elif words[-1].lower().rstrip('.') in _ORG_WORDS or (text.isupper() and len(text) > 1):
+            entity_type = 'ORG'
+        elif words[-1].lower() in _LOC_WORDS or previous in _LOC_CUES:
+            entity_type = 'LOC'
+        elif previous.rstrip('.') in _TITLES:
+            entity_type = 'PER'
+        else:
+            entity_type = 'MISC'
+
+        entities.append((' '.join(words), entity_type, at_start))
+    return entities
+
+
+class EntityExtractor:
+    """
+    Extract people, organizations and places from article text
+
+    Sentences go through the configured transformers NER model in batches,
+    using the model instance shared by the process's ResourceManager. When
+    the model is unavailable a capitalization heuristic is used instead, for
+    HEURISTIC_LANGUAGES only: German capitalizes every noun and CJK scripts
+    have no case, so other languages get no entities.
+    Per-sentence entities are cached by sentence hash, so re-analyzing an
+    edited article only processes the changed sentences.
+    """
+
+    def __init__(self, model_name=None, batch_size=None, cache_size=None):
+        self.model_name = model_name if model_name is not None else config.NER_MODEL
+        self.batch_size = batch_size or config.NER_BATCH_SIZE
+        self.cache_size = cache_size or config.NER_CACHE_SIZE
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _model(self):
+        """Shared NER pipeline, or None to fall back to the heuristic"""
+        if not self.model_name:
+            return None
+        return resource_manager.transformer('ner', self.model_name)
+
+    def _predict(self, model, sentences):
+        """Entities of sentences, one list per sentence"""
+        if model is None:
+            return [_heuristic_entities(sentence) for sentence in sentences]
+
+        kwargs = {'aggregation_strategy': 'simple', 'batch_size': self.batch_size}
+        # Fast tokenizers let the pipeline tag sentences longer than the model
+        # input in overlapping chunks; with slow ones it truncates them
+        tokenizer = model.tokenizer
+        if tokenizer.is_fast and tokenizer.model_max_length > 2 * NER_STRIDE:
+            kwargs['stride'] = NER_STRIDE
+        predictions = model(sentences, **kwargs)
+        if sentences and isinstance(predictions[0], dict):
+            predictions = [predictions]
+        return [
+            [
+                (entity['word'].strip(), entity['entity_group'], False)
+                for entity in sentence_entities
+                if entity['score'] >= MIN_ENTITY_SCORE and entity['word'].strip()
+            ]
+            for sentence_entities in predictions
+        ]
+
+    def _sentence_entities(self, sentences, method, model):
+        """Entities of each sentence, computing only uncached sentences in batches"""
+        keys = [
+            hashlib.sha1(f"{method}\0{sentence}".encode('utf-8')).digest()
+            for sentence in sentences
+        ]
+
+        with self._lock:
+            cached = [self._cache.get(key) for key in keys]
+            for key, entities in zip(keys, cached):
+                if entities is not None:
+                    self._cache.move_to_end(key)
+            missing = [index for index, entities in enumerate(cached) if entities is None]
+            self.hits += len(cached) - len(missing)
+            self.misses += len(missing)
+
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            predictions = self._predict(model, [sentences[index] for index in batch])
+            with self._lock:
+                for index, entities in zip(batch, predictions):
+                    cached[index] = entities
+                    self._cache[keys[index]] = entities
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return cached
+
+    @timed('entities.extract_entities')
+    def extract_entities(self, text, top_n=15, language='en'):
+        """
+        Extract named entities with their frequencies
+
+        Args:
+            text (str): Text to analyze
+            top_n (int): Number of most frequent entities to return
+            language (str): Language code used for sentence splitting
+
+        Returns:
+            dict: 'entities' as dicts with 'entity', 'type', 'count' and the
+            'sentences' mentioning them, plus entity counts 'by_type'; the
+            'method' is 'unsupported' with no entities when there is no model
+            and the heuristic does not apply to the language
+        """
+        try:
+            model = self._model()
+            if model is None and not self.heuristic_supported(text, language):
+                return {
+                    'success': True,
+                    'method': 'unsupported',
+                    'entities': [],
+                    'by_type': {}
+                }
+            method = f"transformers:{self.model_name}" if model is not None else 'heuristic'
+            sentences = build_token_stream(text, language).sentences
+            mentions = self._sentence_entities(sentences, method, model)
+
+            if model is None:
+                mentions = self._resolve_heuristic(mentions, language)
+
+            types = defaultdict(Counter)
+            sentence_index = defaultdict(list)
+            for index, sentence_mentions in enumerate(mentions):
+                for entity, entity_type, _ in sentence_mentions:
+                    types[entity][entity_type] += 1
+                    if not sentence_index[entity] or sentence_index[entity][-1] != index:
+                        sentence_index[entity].append(index)
+
+            counts = Counter({entity: sum(by_type.values()) for entity, by_type in types.items()})
+            entities = [
+                {
+                    'entity': entity,
+                    'type': types[entity].most_common(1)[0][0],
+                    'count': count,
+                    'sentences': sentence_index[entity]
+                }
+                for entity, count in counts.most_common()
+            ]
+
+            return {
+                'success': True,
+                'method': 'transformers' if model is not None else 'heuristic',
+                'entities': entities[:top_n],
+                'by_type': dict(Counter(entity['type'] for entity in entities))
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    @staticmethod
+    def heuristic_supported(text, language='en'):
+        """
+        Whether the capitalization heuristic applies to text
+
+        Args:
+            text (str): Text to analyze
+            language (str): Language code of the text
+
+        Returns:
+            bool: True for HEURISTIC_LANGUAGES text not written in a CJK script
+        """
+        code = normalize_language(language)
+        return code in HEURISTIC_LANGUAGES and cjk_script(code, text) is None
+
+    @staticmethod
+    def _resolve_heuristic(mentions, language):
+        """
+        Clean up heuristic mentions across the whole document
+
+        Capitalized words at the start of a sentence only count when the same
+        word also appears capitalized mid-sentence, a surname alone is linked
+        to the full name of a person, and every mention of an entity takes
+        its most specific type.
+        """
+        stop_words = stopwords_for(language)
+        mid_sentence = {
+            entity for sentence in mentions for entity, _, at_start in sentence if not at_start
+        }
+
+        known_types = defaultdict(Counter)
+        for sentence in mentions:
+            for entity, entity_type, _ in sentence:
+                if entity_type != 'MISC':
+                    known_types[entity][entity_type] += 1
+
+        surnames = {}
+        for entity, by_type in known_types.items():
+            words = entity.split()
+            if len(words) > 1 and by_type.most_common(1)[0][0] == 'PER':
+                surnames.setdefault(words[-1], entity)
+
+        resolved = []
+        for sentence in mentions:
+            kept = []
+            for entity, entity_type, at_start in sentence:
+                if entity.lower() in stop_words:
+                    continue
+                entity = surnames.get(entity, entity)
+                if at_start and ' ' not in entity and entity not in mid_sentence:
+                    continue
+                if entity in known_types:
+                    entity_type = known_types[entity].most_common(1)[0][0]
+                kept.append((entity, entity_type, at_start))
+            resolved.append(kept)
+        return resolved
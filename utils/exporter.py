@@ -0,0 +1,165 @@
+"""
+Exporter Module
+Streams analysis results to columnar Parquet or Arrow files
+"""
+import config
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+def results_schema():
+    """Fixed Arrow schema for exported analysis results"""
+    return pa.schema([
+        ('title', pa.string()),
+        ('url', pa.string()),
+        ('language', pa.string()),
+        ('language_confidence', pa.float64()),
+        ('sentiment', pa.string()),
+        ('polarity', pa.float64()),
+        ('subjectivity', pa.float64()),
+        ('summary', pa.string()),
+        ('keywords', pa.list_(pa.struct([('term', pa.string()), ('count', pa.int32())]))),
+        ('word_count', pa.int64()),
+        ('sentence_count', pa.int64()),
+        ('character_count', pa.int64()),
+        ('avg_sentence_length', pa.float64()),
+        ('reading_time_minutes', pa.float64()),
+        ('sentence_polarity', pa.list_(pa.float32())),
+        ('total_seconds', pa.float64())
+    ])
+
+
+def flatten_result(result):
+    """
+    Flatten a nested analysis result into one export row
+
+    Args:
+        result (dict): Result of AnalysisPipeline.analyze
+
+    Returns:
+        dict: Column values, None for stages that did not run
+    """
+    language = result.get('detected_language', {})
+    sentiment = result.get('sentiment', {})
+    statistics = result.get('statistics', {})
+    keywords = result.get('keywords')
+    sentence_sentiments = result.get('sentence_sentiments')
+
+    return {
+        'title': result.get('title'),
+        'url': result.get('url'),
+        'language': language.get('language_code'),
+        'language_confidence': language.get('confidence'),
+        'sentiment': sentiment.get('sentiment'),
+        'polarity': sentiment.get('polarity'),
+        'subjectivity': sentiment.get('subjectivity'),
+        'summary': result.get('summary', {}).get('summary'),
+        'keywords': (
+            [{'term': term, 'count': count} for term, count in keywords]
+            if keywords is not None else None
+        ),
+        'word_count': statistics.get('word_count'),
+        'sentence_count': statistics.get('sentence_count'),
+        'character_count': statistics.get('character_count'),
+        'avg_sentence_length': statistics.get('avg_sentence_length'),
+        'reading_time_minutes': statistics.get('reading_time_minutes'),
+        'sentence_polarity': (
+            [item['polarity'] for item in sentence_sentiments]
+            if sentence_sentiments is not None else None
+        ),
+        'total_seconds': result.get('performance', {}).get('total_seconds')
+    }
+
+
+class ResultsExporter:
+    """Write analysis results to Parquet or Arrow IPC in bounded row groups"""
+
+    FORMATS = ('parquet', 'arrow')
+
+    def __init__(self, path, file_format='parquet', row_group_size=None):
+        if pa is None:
+            raise ImportError("pyarrow is required for exporting results. Install it with: pip install pyarrow")
+        if file_format not in self.FORMATS:
+            raise ValueError(f"Unsupported format '{file_format}', expected one of {self.FORMATS}")
+
+        self.path = path
+        self.file_format = file_format
+        self.row_group_size = row_group_size or config.EXPORT_ROW_GROUP_SIZE
+        self.schema = results_schema()
+        self.rows_written = 0
+        self._columns = {name: [] for name in self.schema.names}
+        self._buffered = 0
+
+        if file_format == 'parquet':
+            self._writer = pq.ParquetWriter(path, self.schema, compression='zstd')
+        else:
+            self._writer = pa.ipc.new_file(path, self.schema)
+
+    def write(self, result):
+        """
+        Buffer one result, flushing a row group when it is full
+
+        Args:
+            result (dict): Result of AnalysisPipeline.analyze
+        """
+        for name, value in flatten_result(result).items():
+            self._columns[name].append(value)
+        self._buffered += 1
+
+        if self._buffered >= self.row_group_size:
+            self.flush()
+
+    def write_many(self, results):
+        """Write an iterable of results"""
+        for result in results:
+            self.write(result)
+
+    def flush(self):
+        """Write buffered results as one row group"""
+        if not self._buffered:
+            return
+
+        batch = pa.RecordBatch.from_pydict(self._columns, schema=self.schema)
+        if self.file_format == 'parquet':
+            self._writer.write_batch(batch, row_group_size=self._buffered)
+        else:
+            self._writer.write_batch(batch)
+
+        self.rows_written += self._buffered
+        self._columns = {name: [] for name in self.schema.names}
+        self._buffered = 0
+
+    def close(self):
+        """Flush remaining results and finalize the file"""
+        self.flush()
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def export_results(path, results, file_format='parquet', row_group_size=None):
+    """
+    Export an iterable of analysis results to a file
+
+    Args:
+        path (str): Output file path
+        results (iterable): Analysis results
+        file_format (str): 'parquet' or 'arrow'
+        row_group_size (int): Results per row group
+
+    Returns:
+        int: Number of results written
+    """
+    with ResultsExporter(path, file_format, row_group_size) as exporter:
+        exporter.write_many(results)
+    return exporter.rows_written
@@ -0,0 +1,291 @@
+"""
+Feeds Module
+Handles incremental polling of RSS/Atom feeds
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import defusedxml.ElementTree as ET
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from utils.profiler import timed
+import config
+
+
+class SeenStore:
+    """Persistent set of seen item IDs stored as sorted 64-bit hashes"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending = set()
+        if os.path.exists(path):
+            self._hashes = np.fromfile(path, dtype='<u8')
+        else:
+            self._hashes = np.empty(0, dtype='<u8')
+
+    @staticmethod
+    def _hash(guid):
+        digest = hashlib.blake2b(guid.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'little')
+
+    def __len__(self):
+        return len(self._hashes) + len(self._pending)
+
+    def _contains(self, value):
+        if value in self._pending:
+            return True
+        position = np.searchsorted(self._hashes, value)
+        return position < len(self._hashes) and self._hashes[position] == value
+
+    def __contains__(self, guid):
+        value = np.uint64(self._hash(guid))
+        with self._lock:
+            return self._contains(value)
+
+    def add(self, guid):
+        """
+        Mark an item as seen
+
+        Args:
+            guid (str): Item GUID
+
+        Returns:
+            bool: True if the item was not seen before
+        """
+        value = np.uint64(self._hash(guid))
+        with self._lock:
+            if self._contains(value):
+                return False
+            self._pending.add(value)
+            return True
+
+    def flush(self):
+        """Merge new hashes and write the store atomically"""
+        with self._lock:
+            if not self._pending:
+                return
+            pending = np.fromiter(self._pending, dtype='<u8', count=len(self._pending))
+            self._hashes = np.union1d(self._hashes, pending)
+            self._pending.clear()
+
+            tmp_path = self.path + '.tmp'
+            self._hashes.tofile(tmp_path)
+            os.replace(tmp_path, self.path)
+
+
+def _local_name(tag):
+    """Strip the XML namespace from a tag"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _child_text(element, name):
+    for child in element:
+        if _local_name(child.tag) == name:
+            return (child.text or '').strip()
+    return ''
+
+
+def parse_feed(content):
+    """
+    Parse an RSS 0.9x/1.0/2.0 or Atom document
+
+    Args:
+        content (bytes): Feed XML
+
+    Returns:
+        list: Items with guid, title, link, published and summary
+    """
+    root = ET.fromstring(content)
+    items = []
+
+    for element in root.iter():
+        name = _local_name(element.tag)
+        if name not in ('item', 'entry'):
+            continue
+
+        link = _child_text(element, 'link')
+        if name == 'entry':
+            for child in element:
+                if _local_name(child.tag) == 'link' and child.get('rel', 'alternate') == 'alternate':
+                    link = child.get('href', link)
+                    break
+
+        guid = _child_text(element, 'guid') or _child_text(element, 'id') or link
+        if not guid:
+            continue
+
+        items.append({
+            'guid': guid,
+            'title': _child_text(element, 'title'),
+            'link': link,
+            'published': (
+                _child_text(element, 'pubDate')
+                or _child_text(element, 'published')
+                or _child_text(element, 'updated')
+                or _child_text(element, 'date')
+            ),
+            'summary': (
+                _child_text(element, 'description')
+                or _child_text(element, 'summary')
+            )
+        })
+
+    return items
+
+
+class FeedPoller:
+    """Poll many feeds and report only items not seen before"""
+
+    def __init__(self, feed_urls, state_dir=None, on_new=None, max_workers=None):
+        self.feed_urls = list(feed_urls)
+        self.state_dir = state_dir or config.FEED_STATE_DIR
+        self.on_new = on_new
+        self.max_workers = max_workers or config.FEED_POLL_WORKERS
+
+        os.makedirs(self.state_dir, exist_ok=True)
+        self.seen = SeenStore(os.path.join(self.state_dir, 'seen.u64'))
+        self._state_path = os.path.join(self.state_dir, 'feeds.json')
+        self._state = {}
+        if os.path.exists(self._state_path):
+            with open(self._state_path) as f:
+                self._state = json.load(f)
+
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = config.USER_AGENT
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    @timed('feeds.poll_feed')
+    def poll_feed(self, url):
+        """
+        Fetch one feed with a conditional GET
+
+        Args:
+            url (str): Feed URL
+
+        Items are not marked as seen here, see poll_all().
+
+        Returns:
+            dict: Poll result with unseen items and the feed's new 'state',
+            or not_modified
+        """
+        try:
+            state = self._state.get(url, {})
+            headers = {}
+            if state.get('etag'):
+                headers['If-None-Match'] = state['etag']
+            if state.get('last_modified'):
+                headers['If-Modified-Since'] = state['last_modified']
+
+            response = self.session.get(url, headers=headers, timeout=config.REQUEST_TIMEOUT)
+            if response.status_code == 304:
+                return {'success': True, 'url': url, 'not_modified': True, 'items': []}
+            response.raise_for_status()
+
+            new_items = []
+            for item in parse_feed(response.content):
+                if item['guid'] not in self.seen:
+                    item['feed_url'] = url
+                    new_items.append(item)
+
+            return {
+                'success': True,
+                'url': url,
+                'not_modified': False,
+                'items': new_items,
+                'state': {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'checked_at': time.time()
+                }
+            }
+        except Exception as e:
+            return {'success': False, 'url': url, 'error': str(e), 'items': []}
+
+    def poll_all(self):
+        """
+        Poll every feed once and hand new items to on_new
+
+        Items are marked as seen only once on_new accepted them. When on_new
+        fails for an item, its feed's conditional GET state is not saved
+        either, so the item is offered again on the next poll.
+
+        Returns:
+            dict: Poll summary with new items, per-feed errors and the items
+            on_new failed for
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self.poll_feed, self.feed_urls))
+
+        new_items = []
+        failed_items = []
+        for result in results:
+            delivered = True
+            for item in result['items']:
+                # The same item can appear in several feeds
+                if item['guid'] in self.seen:
+                    continue
+                if self.on_new:
+                    try:
+                        self.on_new(item)
+                    except Exception as e:
+                        failed_items.append({'guid': item['guid'], 'feed_url': result['url'], 'error': str(e)})
+                        delivered = False
+                        continue
+                self.seen.add(item['guid'])
+                new_items.append(item)
+
+            if result.get('state') and delivered:
+                self._state[result['url']] = result['state']
+
+        self.seen.flush()
+        tmp_path = self._state_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self._state, f)
+        os.replace(tmp_path, self._state_path)
+
+        return {
+            'feeds': len(results),
+            'not_modified': sum(1 for result in results if result.get('not_modified')),
+            'new_items': new_items,
+            'failed_items': failed_items,
+            'errors': {result['url']: result['error'] for result in results if not result['success']}
+        }
+
+    def run(self, interval=None, stop_event=None):
+        """
+        Poll all feeds repeatedly until stop_event is set
+
+        Args:
+            interval (float): Seconds between poll cycles
+            stop_event (threading.Event): Event that ends the loop
+        """
+        interval = interval or config.FEED_POLL_INTERVAL
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            self.poll_all()
+            stop_event.wait(interval)
+
+
+def enqueue_analysis(jobs, pipeline, **analysis_options):
+    """
+    Build an on_new callback that queues new feed items for analysis
+
+    Args:
+        jobs (JobManager): Background job manager
+        pipeline (AnalysisPipeline): Pipeline used to fetch and analyze
+        **analysis_options: Extra arguments for AnalysisPipeline.analyze
+
+    Returns:
+        callable: Callback taking a feed item
+    """
+    def on_new(item):
+        if item['link']:
+            item['job_id'] = jobs.submit(pipeline.analyze_url, item['link'], **analysis_options)
+    return on_new
@@ -0,0 +1,242 @@
+"""
+Incremental Analysis Module
+Re-analyzes edited text by recomputing only sentences that changed
+"""
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from utils.analyzer import ContentAnalyzer
+from utils.languages import (
+    coverage_counts, coverage_ratio, is_english, lexicon_for, normalize_language, pattern_scores,
+    pattern_words, stopwords_for, split_sentences, sentiment_assessments
+)
+from utils.tokenizers import cjk_script, word_tokenizer, min_word_length
+from utils.profiler import timed
+import config
+
+
+class SentenceFeatures:
+    """Cached analysis features of one sentence"""
+
+    __slots__ = (
+        'polarity', 'subjectivity', 'words', 'polarity_sum', 'subjectivity_sum',
+        'assessments', 'word_count', 'alnum_counts', 'lexicon_scored', 'content_words'
+    )
+
+    def __init__(self, sentence, language='en', script=None):
+        if lexicon_for(language) is None:
+            # TextBlob carries negations and intensifiers into the next
+            # sentence, so the document is re-scored from the cached words
+            self.words = pattern_words(sentence)
+            self.polarity, self.subjectivity, assessments = pattern_scores(self.words)
+        else:
+            self.words = None
+            self.polarity, self.subjectivity, assessments = sentiment_assessments(sentence, language)
+
+        # Lexicon polarity is the mean over all assessments, so keep the sums
+        self.polarity_sum = sum(assessment[0] for assessment in assessments)
+        self.subjectivity_sum = sum(assessment[1] for assessment in assessments)
+        self.assessments = len(assessments)
+        self.lexicon_scored, self.content_words = (
+            (0, 0) if is_english(language) else coverage_counts(sentence, language)
+        )
+
+        tokens = [token.lower() for token in word_tokenizer(script)(sentence)]
+        self.alnum_counts = Counter(token for token in tokens if token.isalnum())
+        self.word_count = sum(self.alnum_counts.values())
+
+
+class IncrementalAnalyzer:
+    """
+    Drop-in replacement for ContentAnalyzer and TextSummarizer on edited text
+
+    Per-sentence features are cached by sentence hash, so after an edit only
+    new or changed sentences are tokenized and scored; document results are
+    rebuilt from the cached features.
+
+    Keywords, statistics, sentiment and summaries match ContentAnalyzer.
+    English sentiment is re-scored from the cached words of all sentences,
+    which skips tokenization but keeps negations that reach across a
+    sentence boundary.
+    """
+
+    def __init__(self, analyzer=None, cache_size=None):
+        self.stop_words = (analyzer or ContentAnalyzer()).stop_words
+        self.cache_size = cache_size or config.INCREMENTAL_CACHE_SIZE
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_text = None
+        self._last_features = None
+
+    def _sentence_features(self, sentence, language, script):
+        key = hashlib.sha1(f"{language}\0{script}\0{sentence}".encode('utf-8')).digest()
+        features = self._cache.get(key)
+        if features is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return features
+
+        self.misses += 1
+        features = SentenceFeatures(sentence, language, script)
+        self._cache[key] = features
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return features
+
+    def _features(self, text, language='en'):
+        """Return (sentences, features, script) for text, reusing cached sentences"""
+        with self._lock:
+            if (text, language) != self._last_text:
+                script = cjk_script(normalize_language(language), text)
+                sentences = split_sentences(text, language)
+                self._last_features = (
+                    sentences,
+                    [self._sentence_features(s, language, script) for s in sentences],
+                    script
+                )
+                self._last_text = (text, language)
+            return self._last_features
+
+    @timed('incremental.analyze_sentiment')
+    def analyze_sentiment(self, text, language='en'):
+        """
+        Document sentiment, see ContentAnalyzer.analyze_sentiment
+
+        English is re-scored from the cached words of all sentences; lexicon
+        polarity is the mean over the assessments of all sentences.
+        """
+        try:
+            _, features, _ = self._features(text, language)
+            if lexicon_for(language) is None:
+                polarity, subjectivity, _ = pattern_scores(word for f in features for word in f.words)
+            else:
+                assessments = sum(f.assessments for f in features) or 1
+                polarity = sum(f.polarity_sum for f in features) / assessments
+                subjectivity = sum(f.subjectivity_sum for f in features) / assessments
+            coverage = None
+            if not is_english(language):
+                coverage = coverage_ratio(
+                    sum(f.lexicon_scored for f in features), sum(f.content_words for f in features)
+                )
+            return ContentAnalyzer.sentiment_result(polarity, subjectivity, coverage)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    @timed('incremental.extract_keywords')
+    def extract_keywords(self, text, top_n=10, language='en'):
+        """Top keywords, see ContentAnalyzer.extract_keywords"""
+        try:
+            _, features, script = self._features(text, language)
+            word_freq = Counter()
+            for f in features:
+                word_freq.update(f.alnum_counts)
+
+            stop_words = self.stop_words if is_english(language) else stopwords_for(language)
+            keywords = Counter({
+                word: count for word, count in word_freq.items()
+                if len(word) >= min_word_length(script, 4) and word not in stop_words
+            })
+            return keywords.most_common(top_n)
+        except Exception as e:
+            return []
+
+    @timed('incremental.get_text_statistics')
+    def get_text_statistics(self, text, language='en'):
+        """Text statistics, see ContentAnalyzer.get_text_statistics"""
+        try:
+            sentences, features, _ = self._features(text, language)
+            word_count = sum(f.word_count for f in features)
+            avg_sentence_length = word_count / len(sentences) if sentences else 0
+            reading_time = word_count / 200
+
+            return {
+                'success': True,
+                'word_count': word_count,
+                'sentence_count': len(sentences),
+                'character_count': len(text),
+                'avg_sentence_length': round(avg_sentence_length, 1),
+                'reading_time_minutes': round(reading_time, 1)
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    @timed('incremental.analyze_sentence_sentiments')
+    def analyze_sentence_sentiments(self, text, language='en'):
+        """Per-sentence polarity, see ContentAnalyzer.analyze_sentence_sentiments"""
+        try:
+            sentences, features, _ = self._features(text, language)
+            return [
+                {
+                    'sentence': sentence[:100] + '...' if len(sentence) > 100 else sentence,
+                    'polarity': f.polarity
+                }
+                for sentence, f in zip(sentences, features)
+            ]
+        except Exception as e:
+            return []
+
+    def _select_sentences(self, features, num_sentences, script=None):
+        """Indices of the top scoring sentences in original order"""
+        min_length = min_word_length(script, 3)
+        word_freq = Counter()
+        for f in features:
+            word_freq.update({word: count for word, count in f.alnum_counts.items() if len(word) >= min_length})
+        max_freq = max(word_freq.values()) if word_freq else 1
+
+        scores = []
+        for f in features:
+            score = sum(count * word_freq.get(word, 0) for word, count in f.alnum_counts.items())
+            scores.append(score / max_freq / f.word_count if f.word_count else 0)
+
+        ranked = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
+        return sorted(ranked[:num_sentences])
+
+    @timed('incremental.extractive_summarize')
+    def extractive_summarize(self, text, num_sentences=3, language='en'):
+        """Extractive summary, see TextSummarizer.extractive_summarize"""
+        try:
+            sentences, features, script = self._features(text, language)
+
+            if len(sentences) <= num_sentences:
+                return {
+                    'success': True,
+                    'summary': text,
+                    'method': 'extractive',
+                    'original_sentences': len(sentences),
+                    'summary_sentences': len(sentences)
+                }
+
+            summary = ' '.join(sentences[i] for i in self._select_sentences(features, num_sentences, script))
+
+            return {
+                'success': True,
+                'summary': summary,
+                'method': 'extractive',
+                'original_sentences': len(sentences),
+                'summary_sentences': num_sentences
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'message': 'Summarization failed. Please try with different text.'
+            }
+
+    @timed('incremental.bullet_point_summary')
+    def bullet_point_summary(self, text, num_points=5, language='en'):
+        """Bullet points, see TextSummarizer.bullet_point_summary"""
+        try:
+            sentences, features, script = self._features(text, language)
+            if len(sentences) > num_points:
+                sentences = [sentences[i] for i in self._select_sentences(features, num_points, script)]
+            return ['• ' + sentence.strip() for sentence in sentences]
+        except Exception as e:
+            return []
@@ -0,0 +1,195 @@
+"""
+Jobs Module
+Runs long analyses on a background worker pool
+"""
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from utils.pipeline import AnalysisCancelled
+import config
+
+
+class Job:
+    """State of a single background job"""
+
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self.status = 'queued'
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        self.cancel_event = threading.Event()
+        self.future = None
+        self.stages = []
+        self.partial = {}
+
+    def record_stage(self, stage, results):
+        """Keep a snapshot of the results after a finished stage"""
+        self.partial = dict(results)
+        self.stages = self.stages + [stage]
+
+    def to_dict(self):
+        """Return the job status without the result payload"""
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'submitted_at': self.submitted_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'error': self.error
+        }
+
+
+class JobManager:
+    """Submit, poll, cancel and collect background analyses"""
+
+    FINISHED = ('completed', 'failed', 'cancelled')
+
+    def __init__(self, max_workers=None, result_ttl=None):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or config.JOB_WORKERS,
+            thread_name_prefix='analysis-job'
+        )
+        self.result_ttl = result_ttl if result_ttl is not None else config.JOB_RESULT_TTL
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args, report_progress=False, **kwargs):
+        """
+        Queue a function to run in the background
+
+        The function is called with an extra ``cancel_event`` keyword argument
+        that it should check between steps to support cancellation.
+
+        Args:
+            func (callable): Function to run, e.g. AnalysisPipeline.analyze
+            report_progress (bool): Also pass an ``on_stage`` callback that
+                records partial results, see partial()
+
+        Returns:
+            str: Job ID
+        """
+        self._expire_finished()
+
+        job = Job(uuid.uuid4().hex)
+        if report_progress:
+            kwargs['on_stage'] = job.record_stage
+        with self._lock:
+            self._jobs[job.job_id] = job
+            job.future = self.executor.submit(self._run, job, func, args, kwargs)
+        return job.job_id
+
+    def _run(self, job, func, args, kwargs):
+        """Execute a job on a worker thread"""
+        with self._lock:
+            # Cancelled after the worker took the job, too late for future.cancel()
+            if job.cancel_event.is_set():
+                job.status = 'cancelled'
+                job.finished_at = time.time()
+                return
+
+            job.status = 'running'
+            job.started_at = time.time()
+        try:
+            result = func(*args, cancel_event=job.cancel_event, **kwargs)
+            status, error = 'completed', None
+        except AnalysisCancelled:
+            result, status, error = None, 'cancelled', None
+        except Exception as e:
+            result, status, error = None, 'failed', str(e)
+
+        with self._lock:
+            # cancel() reported success, so a job that ran to the end after
+            # its last cancellation check is still recorded as cancelled
+            if job.cancel_event.is_set() and status == 'completed':
+                result, status = None, 'cancelled'
+            job.result, job.status, job.error = result, status, error
+            job.finished_at = time.time()
+
+    def status(self, job_id):
+        """
+        Get the status of a job
+
+        Args:
+            job_id (str): Job ID
+
+        Returns:
+            dict: Job status, or None for unknown jobs
+        """
+        job = self._jobs.get(job_id)
+        return job.to_dict() if job else None
+
+    def result(self, job_id):
+        """
+        Get the result of a completed job
+
+        Args:
+            job_id (str): Job ID
+
+        Returns:
+            Result of the job function, or None if not completed
+        """
+        job = self._jobs.get(job_id)
+        if job and job.status == 'completed':
+            return job.result
+        return None
+
+    def partial(self, job_id):
+        """
+        Get the results of the stages finished so far
+
+        Args:
+            job_id (str): Job ID
+
+        Returns:
+            dict: 'stages' finished and the partial 'results', or None
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        return {'stages': job.stages, 'results': job.partial}
+
+    def cancel(self, job_id):
+        """
+        Cancel a queued or running job
+
+        Args:
+            job_id (str): Job ID
+
+        Returns:
+            bool: True if the job will not complete; a running job that
+            finishes anyway is recorded as cancelled and its result dropped
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in self.FINISHED:
+                return False
+
+            job.cancel_event.set()
+            if job.future.cancel():
+                job.status = 'cancelled'
+                job.finished_at = time.time()
+        return True
+
+    def forget(self, job_id):
+        """Drop a job and its result"""
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def _expire_finished(self):
+        """Drop finished jobs older than the result TTL"""
+        cutoff = time.time() - self.result_ttl
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.status in self.FINISHED and job.finished_at and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    def shutdown(self, wait=True):
+        """Stop the worker pool"""
+        self.executor.shutdown(wait=wait, cancel_futures=True)
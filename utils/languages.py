@@ -0,0 +1,329 @@
+"""
+Languages Module
+Per-language stopwords, sentence splitting and sentiment lexicons
+"""
+import os
+import re
+from functools import lru_cache
+from textblob.en import sentiment as pattern_sentiment
+from nltk.tokenize import sent_tokenize
+from utils.tokenizers import cjk_script, split_cjk_sentences, word_tokenizer
+import config
+
+# Lexicons and stopword lists shipped with the package
+LEXICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lexicons')
+
+# NLTK corpus names for the supported languages
+NLTK_LANGUAGES = {
+    'en': 'english',
+    'es': 'spanish',
+    'fr': 'french',
+    'de': 'german',
+    'it': 'italian',
+    'pt': 'portuguese',
+    'zh-cn': 'chinese',
+    'ar': 'arabic',
+    'ru': 'russian'
+}
+
+# Languages with a Punkt sentence model in NLTK
+PUNKT_LANGUAGES = {'en', 'es', 'fr', 'de', 'it', 'pt', 'ru'}
+
+# Sentence ends for languages without a Punkt model
+_SENTENCE_END = re.compile(r'(?<=[.!?؟।])\s+|(?<=[。！？])\s*')
+
+# Tokens after a negation word that it still applies to
+NEGATION_WINDOW = 3
+
+
+def normalize_language(language):
+    """
+    Map a detected language code onto a SUPPORTED_LANGUAGES key
+
+    Args:
+        language (str): Language code, e.g. 'es' or 'zh-CN'
+
+    Returns:
+        str: Normalized code, 'en' when unknown
+    """
+    if not language:
+        return 'en'
+    language = language.lower()
+    if language in config.SUPPORTED_LANGUAGES:
+        return language
+    base = language.split('-')[0]
+    return 'zh-cn' if base == 'zh' else base
+
+
+def is_english(language):
+    """Whether text in this language is analyzed with the English models"""
+    return normalize_language(language) == 'en'
+
+
+def _resource_paths(*parts):
+    """Paths of a resource in the package and in the configured lexicon directory"""
+    directories = [LEXICON_DIR] + ([config.LEXICON_DIR] if config.LEXICON_DIR else [])
+    return [
+        path for path in (os.path.join(directory, *parts) for directory in directories)
+        if os.path.exists(path)
+    ]
+
+
+@lru_cache(maxsize=None)
+def stopwords_for(language):
+    """
+    Stopwords of a language: NLTK's list plus any stopword files
+
+    Args:
+        language (str): Language code
+
+    Returns:
+        frozenset: Lower-cased stopwords, empty if none are available
+    """
+    code = normalize_language(language)
+    words = set()
+
+    name = NLTK_LANGUAGES.get(code)
+    if name:
+        try:
+            from nltk.corpus import stopwords
+            words.update(stopwords.words(name))
+        except (LookupError, OSError):
+            pass
+
+    for path in _resource_paths('stopwords', f'{code}.txt'):
+        with open(path, encoding='utf-8') as f:
+            words.update(line.strip().lower() for line in f if line.strip() and not line.startswith('#'))
+
+    return frozenset(words)
+
+
+def split_sentences(text, language='en'):
+    """
+    Split text into sentences with the language's Punkt model
+
+    CJK text is split on CJK sentence punctuation, other languages without
+    a Punkt model on sentence-final punctuation.
+
+    Args:
+        text (str): Text to split
+        language (str): Language code
+
+    Returns:
+        list: Sentences
+    """
+    code = normalize_language(language)
+    if cjk_script(code, text):
+        return split_cjk_sentences(text)
+    if code == 'en':
+        return sent_tokenize(text)
+    if code in PUNKT_LANGUAGES:
+        try:
+            return sent_tokenize(text, language=NLTK_LANGUAGES[code])
+        except LookupError:
+            pass
+    return [sentence.strip() for sentence in _SENTENCE_END.split(text) if sentence.strip()]
+
+
+class Lexicon:
+    """
+    Word-level sentiment scores for languages TextBlob does not cover
+
+    Lexicon files are tab-separated ``word  polarity  subjectivity`` rows.
+    Rows with ``negate`` in place of the scores mark negation words, which
+    flip and dampen the next scored word like TextBlob does for English.
+    """
+
+    def __init__(self, scores=None, negations=None):
+        self.scores = scores or {}
+        self.negations = negations or set()
+
+    def update(self, path):
+        """Add the entries of a lexicon file, overriding existing words"""
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip() or line.startswith('#'):
+                    continue
+                fields = line.rstrip('\n').split('\t')
+                word = fields[0].strip().lower()
+                if fields[1].strip() == 'negate':
+                    self.negations.add(word)
+                else:
+                    subjectivity = float(fields[2]) if len(fields) > 2 else 0.5
+                    self.scores[word] = (float(fields[1]), subjectivity)
+
+    def assess(self, tokens):
+        """
+        Score the sentiment words among tokens
+
+        Args:
+            tokens (list): Word tokens
+
+        Returns:
+            list: (polarity, subjectivity) of every scored word
+        """
+        assessments = []
+        negated = 0
+        for token in tokens:
+            word = token.lower()
+            if word in self.negations:
+                negated = NEGATION_WINDOW
+                continue
+
+            score = self.scores.get(word)
+            if score is not None:
+                polarity, subjectivity = score
+                if negated:
+                    polarity *= -0.5
+                    negated = 0
+                assessments.append((polarity, subjectivity))
+            elif negated:
+                negated -= 1
+        return assessments
+
+
+@lru_cache(maxsize=None)
+def lexicon_for(language):
+    """
+    Sentiment lexicon of a non-English language
+
+    Args:
+        language (str): Language code
+
+    Returns:
+        Lexicon: Merged package and configured lexicon, or None if there is none
+    """
+    code = normalize_language(language)
+    if code == 'en':
+        return None
+
+    paths = _resource_paths(f'{code}.tsv')
+    if not paths:
+        return None
+
+    lexicon = Lexicon()
+    for path in paths:
+        lexicon.update(path)
+    return lexicon
+
+
+def coverage_counts(text, language='en'):
+    """
+    Content words of text and how many of them the language's lexicon scores
+
+    Args:
+        text (str): Text to inspect
+        language (str): Language code
+
+    Returns:
+        tuple: (scored words, content words); no words are scored for
+        languages without a lexicon
+    """
+    code = normalize_language(language)
+    lexicon = lexicon_for(code)
+    stop_words = stopwords_for(code)
+    negations = lexicon.negations if lexicon is not None else set()
+    scores = lexicon.scores if lexicon is not None else {}
+    tokenize = word_tokenizer(cjk_script(code, text))
+
+    scored = content = 0
+    for sentence in split_sentences(text, code):
+        for token in tokenize(sentence):
+            word = token.lower()
+            if word.isalpha() and word not in stop_words and word not in negations:
+                content += 1
+                scored += word in scores
+    return scored, content
+
+
+def coverage_ratio(scored, content):
+    """Lexicon coverage from coverage_counts(), 1.0 for text without content words"""
+    return scored / content if content else 1.0
+
+
+def sentiment_coverage(text, language='en'):
+    """
+    Share of the content words of text that native sentiment scoring knows
+
+    English is scored with TextBlob and always counts as covered. Seed
+    lexicons miss inflected forms and compounds, and languages without a
+    lexicon are not covered at all.
+
+    Args:
+        text (str): Text to inspect
+        language (str): Language code
+
+    Returns:
+        float: Coverage in [0, 1]
+    """
+    if is_english(language):
+        return 1.0
+    return coverage_ratio(*coverage_counts(text, language))
+
+
+def pattern_words(sentence):
+    """
+    Lowercased words of a sentence as TextBlob's English lexicon reads them
+
+    Args:
+        sentence (str): Sentence to tokenize
+
+    Returns:
+        list: Words in order, punctuation and emoticons included
+    """
+    return [word.lower() for word in " ".join(pattern_sentiment.tokenizer(sentence)).split()]
+
+
+def pattern_scores(words):
+    """
+    Score a word sequence with TextBlob's English lexicon
+
+    Negations, intensifiers and exclamation marks act across the whole
+    sequence, so scoring the concatenated words of all sentences gives the
+    same result as scoring the text at once.
+
+    Args:
+        words (iterable): Words from pattern_words
+
+    Returns:
+        tuple: (polarity, subjectivity, [(polarity, subjectivity), ...])
+    """
+    score = pattern_sentiment(list(words))
+    return score[0], score[1], [(assessment[1], assessment[2]) for assessment in score.assessments]
+
+
+def sentiment_assessments(text, language='en'):
+    """
+    Polarity, subjectivity and individual word assessments of text
+
+    English uses TextBlob's lexicon over the words of all sentences; other
+    languages use their lexicon when one is available and are scored
+    sentence by sentence, so their document scores are the mean over the
+    assessments of all sentences.
+
+    Args:
+        text (str): Text to score
+        language (str): Language code
+
+    Returns:
+        tuple: (polarity, subjectivity, [(polarity, subjectivity), ...])
+    """
+    lexicon = lexicon_for(language)
+    if lexicon is None:
+        return pattern_scores(
+            word
+            for sentence in split_sentences(text, language)
+            for word in pattern_words(sentence)
+        )
+
+    tokenize = word_tokenizer()
+    assessments = [
+        score
+        for sentence in split_sentences(text, language)
+        for score in lexicon.assess(tokenize(sentence))
+    ]
+    if not assessments:
+        return 0.0, 0.0, assessments
+    polarity = sum(score[0] for score in assessments) / len(assessments)
+    subjectivity = sum(score[1] for score in assessments) / len(assessments)
+    return polarity, subjectivity, assessments
@@ -0,0 +1,362 @@
+"""
+Pipeline Module
+Runs the full article analysis outside of the Streamlit UI
+"""
+import numpy as np
+from utils.article_fetcher import ArticleFetcher
+from utils.translator import Translator
+from utils.analyzer import ContentAnalyzer
+from utils.summarizer import TextSummarizer
+from utils.entities import EntityExtractor
+from utils.aspects import aspect_sentiments
+from utils.profiler import RequestProfiler
+from utils.languages import normalize_language, sentiment_coverage, split_sentences
+import config
+
+
+class AnalysisCancelled(Exception):
+    """Raised when an analysis is cancelled between stages"""
+
+
+class InputTooLarge(ValueError):
+    """Raised when a text exceeds the hard input size limit"""
+
+
+# Texts shorter than this many characters per allowed sentence are never
+# sampled, which saves splitting ordinary articles twice
+MIN_SAMPLED_SENTENCE_CHARS = 20
+
+
+def sample_sentences(count, max_sentences, strategy='stratified'):
+    """
+    Choose which sentences of an oversized document to analyze
+
+    Args:
+        count (int): Number of sentences in the document
+        max_sentences (int): Sentence budget, 0 for no limit
+        strategy (str): 'head', 'tail' or 'stratified' (one sentence from
+            each of max_sentences equal parts of the document)
+
+    Returns:
+        numpy.ndarray: Sorted sentence indices, or None if all sentences fit
+    """
+    if not max_sentences or count <= max_sentences:
+        return None
+    if strategy == 'head':
+        return np.arange(max_sentences)
+    if strategy == 'tail':
+        return np.arange(count - max_sentences, count)
+    # Middle sentence of each stratum, so repeated runs pick the same sample
+    return ((np.arange(max_sentences) + 0.5) * count / max_sentences).astype(np.int64)
+
+
+def truncate_text(text, max_chars, strategy='head'):
+    """
+    Shorten text to at most max_chars characters at word boundaries
+
+    Args:
+        text (str): Text to shorten
+        max_chars (int): Character budget, 0 for no limit
+        strategy (str): Keep the 'head', the 'tail' or both ends ('head_tail')
+
+    Returns:
+        str: The text itself when it fits, otherwise the kept part(s)
+    """
+    if not max_chars or len(text) <= max_chars:
+        return text
+
+    if strategy == 'tail':
+        tail = text[-max_chars:]
+        # Drop the partial first word unless the cut fell on a word boundary
+        if text[-max_chars - 1] == ' ' or ' ' not in tail:
+            return tail
+        return tail[tail.find(' ') + 1:]
+
+    if strategy == 'head_tail':
+        budget = max(max_chars - 2, 2)
+        head = truncate_text(text, budget // 2, 'head')
+        tail = truncate_text(text, budget - budget // 2, 'tail')
+        return f"{head}\n\n{tail}"
+
+    head = text[:max_chars]
+    if text[max_chars] == ' ' or ' ' not in head:
+        return head
+    return head[:head.rfind(' ')]
+
+
+class AnalysisPipeline:
+    """Run detection, translation and analysis stages on article text"""
+
+    def __init__(self, fetcher=None, translator=None, analyzer=None, summarizer=None,
+                 text_store=None, entity_extractor=None):
+        self.fetcher = fetcher or ArticleFetcher()
+        self.translator = translator or Translator()
+        self.analyzer = analyzer or ContentAnalyzer()
+        self.summarizer = summarizer or TextSummarizer()
+        self.entity_extractor = entity_extractor or EntityExtractor()
+        # With a TextStore, results reference the original and translated text
+        # as 'original_text_ref' / 'translated_text_ref' instead of copying it
+        self.text_store = text_store
+
+    @staticmethod
+    def _translation_target(options, target_language, language, text):
+        """
+        Language the translation stage translates text into, if it runs
+
+        Translation runs when it is requested for another language, and for
+        sentiment analysis of text whose native lexicon scores too few words
+        (see languages.sentiment_coverage), which is translated to English.
+
+        Returns:
+            tuple: (target language, 'requested' or 'lexicon_coverage'), or
+            (None, None) when text is analyzed in its own language
+        """
+        if config.TRANSLATION == 'off':
+            return None, None
+        if "Translation" in options and normalize_language(target_language) != language:
+            return target_language, 'requested'
+        if "Sentiment Analysis" in options and language != 'en' \
+                and sentiment_coverage(text, language) < config.LEXICON_MIN_COVERAGE:
+            return 'en', 'lexicon_coverage'
+        return None, None
+
+    def detect_and_translate(self, text, target_language='en', options=None):
+        """
+        Run the network-bound stages, language detection and translation
+
+        Callers can run this on an I/O thread and pass the result to
+        analyze(language_results=...), so CPU workers do not wait on the
+        translation service.
+
+        Args:
+            text (str): Article text
+            target_language (str): Language code to translate into
+            options (list): Analysis options, translation runs with "Translation"
+
+        Returns:
+            dict: 'detected_language' result and the 'translation_target'
+            (see _translation_target), plus the 'translation' result when the
+            text is translated
+        """
+        options = options or []
+        text = truncate_text(text, config.MAX_DOCUMENT_CHARS, config.TRUNCATION)
+        lang_result = self.translator.detect_language(text)
+        results = {'detected_language': lang_result}
+
+        language = normalize_language(lang_result['language_code']) if lang_result['success'] else 'en'
+        results['translation_target'] = self._translation_target(options, target_language, language, text)
+        translate_to, _ = results['translation_target']
+        if translate_to:
+            results['translation'] = self.translator.translate_text(text, translate_to)
+        return results
+
+    def analyze(self, text, title='', target_language='en', options=None,
+                num_sentences=3, cpu_profile=None, memory_profile=None, cancel_event=None,
+                analyzer=None, summarizer=None, on_stage=None, language_results=None):
+        """
+        Perform comprehensive article analysis
+
+        Args:
+            text (str): Article text
+            title (str): Article title
+            target_language (str): Language code to translate into
+            options (list): Analysis options to run
+            num_sentences (int): Number of sentences in summary
+            cpu_profile (bool): Capture a cProfile report (defaults to config)
+            memory_profile (bool): Capture tracemalloc peak (defaults to config)
+            cancel_event (threading.Event): Checked between stages to stop early
+            analyzer (ContentAnalyzer): Per-call analyzer, e.g. an IncrementalAnalyzer
+            summarizer (TextSummarizer): Per-call summarizer, e.g. an IncrementalAnalyzer
+            on_stage (callable): Called as on_stage(stage, results) after each stage
+            language_results (dict): Output of detect_and_translate() for this
+                text, used instead of calling the translator
+
+        Returns:
+            dict: Analysis results including a 'performance' breakdown
+        """
+        if options is None:
+            options = ["Sentiment Analysis", "Summarization", "Keywords"]
+        if cpu_profile is None:
+            cpu_profile = config.PROFILE_CPU
+        if memory_profile is None:
+            memory_profile = config.PROFILE_MEMORY
+        analyzer = analyzer or self.analyzer
+        summarizer = summarizer or self.summarizer
+
+        def finish_stage(stage):
+            if on_stage is not None:
+                on_stage(stage, results)
+            if cancel_event is not None and cancel_event.is_set():
+                raise AnalysisCancelled("Analysis was cancelled")
+
+        if len(text) > config.MAX_INPUT_CHARS:
+            raise InputTooLarge(
+                f"Text has {len(text):,} characters, the limit is {config.MAX_INPUT_CHARS:,}"
+            )
+
+        results = {'title': title, 'profile': config.PIPELINE_PROFILE}
+        if self.text_store is not None:
+            results['original_text_ref'] = self.text_store.put(text)
+        else:
+            results['original_text'] = text
+
+        # Oversized documents are cut down according to the profile
+        analyzed_text = truncate_text(text, config.MAX_DOCUMENT_CHARS, config.TRUNCATION)
+        if len(analyzed_text) < len(text):
+            results['truncated'] = {
+                'original_chars': len(text),
+                'analyzed_chars': len(analyzed_text),
+                'strategy': config.TRUNCATION
+            }
+            text = analyzed_text
+
+        with RequestProfiler(cpu_profile, memory_profile) as profiler:
+            # Language detection
+            language = 'en'
+            with profiler.stage('detect'):
+                if language_results is not None:
+                    lang_result = language_results['detected_language']
+                else:
+                    lang_result = self.translator.detect_language(text)
+            if lang_result['success']:
+                results['detected_language'] = lang_result
+                language = normalize_language(lang_result['language_code'])
+            finish_stage('detect')
+
+            # Text is analyzed in its own language unless translation is
+            # requested or the language's lexicon covers too little of it
+            analysis_text = text
+            if language_results is not None:
+                translate_to, reason = language_results.get('translation_target') or (None, None)
+            else:
+                translate_to, reason = self._translation_target(options, target_language, language, text)
+            if translate_to:
+                with profiler.stage('translate'):
+                    if language_results is not None:
+                        trans_result = language_results.get('translation') or {'success': False}
+                    else:
+                        trans_result = self.translator.translate_text(text, translate_to)
+                if trans_result['success']:
+                    analysis_text = trans_result['translated_text']
+                    language = normalize_language(translate_to)
+                    trans_result = dict(trans_result, reason=reason)
+                    if self.text_store is not None:
+                        trans_result = {
+                            key: value for key, value in trans_result.items()
+                            if key not in ('original_text', 'translated_text')
+                        }
+                        trans_result['translated_text_ref'] = self.text_store.put(analysis_text)
+                    results['translation'] = trans_result
+                finish_stage('translate')
+            results['analysis_language'] = language
+
+            # Sentiment and keywords of very long texts are estimated from a sample
+            sampled_text = analysis_text
+            if config.MAX_ANALYSIS_SENTENCES \
+                    and len(analysis_text) > config.MAX_ANALYSIS_SENTENCES * MIN_SAMPLED_SENTENCE_CHARS \
+                    and ("Sentiment Analysis" in options or "Keywords" in options or "Entities" in options):
+                with profiler.stage('sample'):
+                    sentences = split_sentences(analysis_text, language)
+                    sample = sample_sentences(len(sentences), config.MAX_ANALYSIS_SENTENCES, config.SENTENCE_SAMPLING)
+                    if sample is not None:
+                        sampled_text = ' '.join(sentences[i] for i in sample)
+                        results['sampling'] = {
+                            'sentences': len(sentences),
+                            'sampled_sentences': len(sample),
+                            'strategy': config.SENTENCE_SAMPLING
+                        }
+            results['approximate'] = 'truncated' in results or 'sampling' in results
+
+            # Sentiment Analysis
+            if "Sentiment Analysis" in options:
+                with profiler.stage('sentiment'):
+                    sentiment_result = analyzer.analyze_sentiment(sampled_text, language=language)
+                if sentiment_result['success']:
+                    results['sentiment'] = sentiment_result
+                    results['approximate'] = results['approximate'] or sentiment_result.get('approximate', False)
+                finish_stage('sentiment')
+
+            # Summarization
+            if "Summarization" in options:
+                with profiler.stage('summary'):
+                    summary_result = {'success': False}
+                    if config.SUMMARIZER == 'abstractive':
+                        summary_result = self.summarizer.abstractive_summarize(analysis_text, language=language)
+                    if not summary_result['success']:
+                        summary_result = summarizer.extractive_summarize(analysis_text, num_sentences, language=language)
+                    if summary_result['success']:
+                        results['summary'] = summary_result
+
+                        # Bullet points
+                        bullet_points = summarizer.bullet_point_summary(analysis_text, num_sentences, language=language)
+                        results['bullet_points'] = bullet_points
+                finish_stage('summary')
+
+            # Keywords
+            if "Keywords" in options:
+                with profiler.stage('keywords'):
+                    results['keywords'] = analyzer.extract_keywords(sampled_text, 15, language=language)
+                finish_stage('keywords')
+
+            # Named entities
+            if "Entities" in options:
+                with profiler.stage('entities'):
+                    entity_result = self.entity_extractor.extract_entities(sampled_text, 15, language=language)
+                if entity_result['success']:
+                    results['entities'] = entity_result
+                finish_stage('entities')
+
+            # Statistics
+            if "Statistics" in options:
+                with profiler.stage('statistics'):
+                    stats = analyzer.get_text_statistics(analysis_text, language=language)
+                if stats['success']:
+                    results['statistics'] = stats
+                    results['approximate'] = results['approximate'] or stats.get('approximate', False)
+                finish_stage('statistics')
+
+            # Sentence-level sentiment
+            if "Sentiment Analysis" in options:
+                with profiler.stage('sentence_sentiment'):
+                    results['sentence_sentiments'] = analyzer.analyze_sentence_sentiments(sampled_text, language=language)
+                finish_stage('sentence_sentiment')
+
+            # Sentiment towards keywords and entities, from the sentence scores
+            if results.get('sentence_sentiments') and (results.get('keywords') or 'entities' in results):
+                with profiler.stage('aspects'):
+                    aspect_result = aspect_sentiments(
+                        sampled_text,
+                        [item['polarity'] for item in results['sentence_sentiments']],
+                        keywords=results.get('keywords'),
+                        entities=results.get('entities', {}).get('entities'),
+                        language=language
+                    )
+                if aspect_result['success']:
+                    results['aspect_sentiments'] = aspect_result
+                finish_stage('aspects')
+
+        results['performance'] = profiler.report()
+        return results
+
+    def analyze_url(self, url, **kwargs):
+        """
+        Fetch an article and analyze it
+
+        Args:
+            url (str): Article URL
+            **kwargs: Extra arguments for analyze()
+
+        Returns:
+            dict: Analysis results with the article 'url'
+
+        Raises:
+            ValueError: If the article cannot be fetched
+        """
+        article = self.fetcher.fetch_from_url(url)
+        if not article['success']:
+            raise ValueError(article.get('message', 'Failed to fetch article'))
+
+        kwargs.setdefault('title', article['title'])
+        results = self.analyze(article['text'], **kwargs)
+        results['url'] = url
+        return results
@@ -0,0 +1,277 @@
+"""
+Profiler Module
+Handles per-stage timing, counters and optional profiling of the pipeline
+"""
+import cProfile
+import functools
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class MetricsRegistry:
+    """Process-wide counters and timers for instrumented calls"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def record(self, name, seconds, error=False):
+        """
+        Record one call of an instrumented operation
+
+        Args:
+            name (str): Operation name, e.g. 'analyzer.analyze_sentiment'
+            seconds (float): Wall-clock duration of the call
+            error (bool): Whether the call raised an exception
+        """
+        with self._lock:
+            metric = self._metrics.setdefault(name, {
+                'calls': 0,
+                'errors': 0,
+                'total_seconds': 0.0,
+                'max_seconds': 0.0
+            })
+            metric['calls'] += 1
+            metric['total_seconds'] += seconds
+            metric['max_seconds'] = max(metric['max_seconds'], seconds)
+            if error:
+                metric['errors'] += 1
+
+    def snapshot(self):
+        """Return a copy of all recorded metrics"""
+        with self._lock:
+            return {name: dict(metric) for name, metric in self._metrics.items()}
+
+    def reset(self):
+        """Clear all recorded metrics"""
+        with self._lock:
+            self._metrics.clear()
+
+    def to_json(self):
+        """Export metrics as a JSON string"""
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def to_prometheus(self, prefix='ageont'):
+        """
+        Export metrics in the Prometheus text exposition format
+
+        Args:
+            prefix (str): Metric name prefix
+
+        Returns:
+            str: Prometheus text format
+        """
+        snapshot = self.snapshot()
+        series = [
+            ('calls_total', 'counter', 'Number of calls per operation', 'calls'),
+            ('errors_total', 'counter', 'Number of failed calls per operation', 'errors'),
+            ('seconds_total', 'counter', 'Total time spent per operation', 'total_seconds'),
+            ('seconds_max', 'gauge', 'Slowest call per operation', 'max_seconds'),
+        ]
+
+        lines = []
+        for suffix, metric_type, help_text, key in series:
+            metric_name = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {metric_name} {help_text}")
+            lines.append(f"# TYPE {metric_name} {metric_type}")
+            for name in sorted(snapshot):
+                lines.append(f'{metric_name}{{operation="{name}"}} {snapshot[name][key]}')
+
+        return '\n'.join(lines) + '\n'
+
+
+metrics = MetricsRegistry()
+
+_active = threading.local()
+
+# tracemalloc is process-wide, so memory profilers share one tracing session:
+# it starts with the first active profiler and stops with the last one
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_owned = False
+_tracemalloc_entries = 0
+
+
+def _start_memory_tracing():
+    """
+    Join the shared tracemalloc session
+
+    Returns:
+        tuple: (entry number, whether other profilers were already tracing)
+    """
+    global _tracemalloc_users, _tracemalloc_owned, _tracemalloc_entries
+    with _tracemalloc_lock:
+        shared = _tracemalloc_users > 0
+        if not shared:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _tracemalloc_owned = True
+            tracemalloc.reset_peak()
+        _tracemalloc_users += 1
+        _tracemalloc_entries += 1
+        return _tracemalloc_entries, shared
+
+
+def _stop_memory_tracing(entry):
+    """
+    Leave the shared tracemalloc session
+
+    Args:
+        entry (int): Entry number returned by _start_memory_tracing
+
+    Returns:
+        tuple: (peak traced bytes, whether other profilers joined meanwhile)
+    """
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        _, peak = tracemalloc.get_traced_memory()
+        joined = _tracemalloc_entries > entry
+        _tracemalloc_users -= 1
+        if not _tracemalloc_users and _tracemalloc_owned:
+            tracemalloc.stop()
+            _tracemalloc_owned = False
+        return peak, joined
+
+
+class RequestProfiler:
+    """
+    Collect a timing breakdown for a single analysis request
+
+    The memory peak comes from tracemalloc, which traces the whole process:
+    it includes allocations of other threads, and when memory-profiled
+    requests overlap they share one peak, reported as 'memory_peak_shared'.
+    """
+
+    def __init__(self, cpu_profile=False, memory_profile=False):
+        self.cpu_profile = cpu_profile
+        self.memory_profile = memory_profile
+        self.stages = []
+        self.calls = {}
+        self.total_seconds = 0.0
+        self.cpu_report = None
+        self.memory_peak_bytes = None
+        self.memory_peak_shared = None
+        self._profile = None
+        self._started = None
+        self._previous = None
+        self._memory_entry = None
+        self._memory_shared = False
+
+    def __enter__(self):
+        self._previous = getattr(_active, 'profiler', None)
+        _active.profiler = self
+
+        if self.memory_profile:
+            self._memory_entry, self._memory_shared = _start_memory_tracing()
+
+        if self.cpu_profile:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.total_seconds = time.perf_counter() - self._started
+
+        if self._profile is not None:
+            self._profile.disable()
+            stream = io.StringIO()
+            stats = pstats.Stats(self._profile, stream=stream)
+            stats.sort_stats('cumulative').print_stats(25)
+            self.cpu_report = stream.getvalue()
+            self._profile = None
+
+        if self.memory_profile:
+            peak, joined = _stop_memory_tracing(self._memory_entry)
+            self.memory_peak_bytes = peak
+            self.memory_peak_shared = self._memory_shared or joined
+
+        _active.profiler = self._previous
+        return False
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time a pipeline stage
+
+        Args:
+            name (str): Stage name, e.g. 'translate'
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append({
+                'stage': name,
+                'seconds': time.perf_counter() - started
+            })
+
+    def record_call(self, name, seconds):
+        """Record an instrumented call made while this profiler is active"""
+        call = self.calls.setdefault(name, {'calls': 0, 'seconds': 0.0})
+        call['calls'] += 1
+        call['seconds'] += seconds
+
+    def report(self):
+        """
+        Build the timing breakdown attached to analysis results
+
+        Returns:
+            dict: Stage timings, per-call counters and optional profiles
+        """
+        report = {
+            'total_seconds': self.total_seconds,
+            'stages': list(self.stages),
+            'calls': {name: dict(call) for name, call in self.calls.items()}
+        }
+        if self.cpu_report is not None:
+            report['cpu_profile'] = self.cpu_report
+        if self.memory_peak_bytes is not None:
+            report['memory_peak_bytes'] = self.memory_peak_bytes
+            report['memory_peak_shared'] = self.memory_peak_shared
+        return report
+
+
+@contextmanager
+def timer(name):
+    """
+    Time a block of code and record it in the metrics registry
+
+    Args:
+        name (str): Operation name
+    """
+    started = time.perf_counter()
+    error = False
+    try:
+        yield
+    except BaseException:
+        error = True
+        raise
+    finally:
+        seconds = time.perf_counter() - started
+        metrics.record(name, seconds, error)
+        profiler = getattr(_active, 'profiler', None)
+        if profiler is not None:
+            profiler.record_call(name, seconds)
+
+
+def timed(name):
+    """
+    Decorator that wraps a function in a named timer
+
+    Args:
+        name (str): Operation name
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,194 @@
+"""
+Resources Module
+Preloads models and lexicons once per process and reports their memory footprint
+"""
+import gc
+import os
+import resource
+import threading
+import time
+import config
+
+
+def _load_punkt():
+    from utils.languages import NLTK_LANGUAGES, PUNKT_LANGUAGES, split_sentences
+    for code in PUNKT_LANGUAGES:
+        split_sentences("Warm up. The sentence model.", code)
+    return sorted(NLTK_LANGUAGES[code] for code in PUNKT_LANGUAGES)
+
+
+def _load_stopwords():
+    from utils.languages import stopwords_for
+    return {code: len(stopwords_for(code)) for code in config.SUPPORTED_LANGUAGES}
+
+
+def _load_textblob():
+    from textblob import TextBlob
+    # The pattern sentiment lexicon is parsed on first use
+    TextBlob("Warm up the good sentiment lexicon.").sentiment_assessments
+    return 'pattern'
+
+
+def _load_lexicons():
+    from utils.languages import lexicon_for
+    return {
+        code: len(lexicon.scores)
+        for code, lexicon in ((code, lexicon_for(code)) for code in config.SUPPORTED_LANGUAGES)
+        if lexicon is not None
+    }
+
+
+def _load_jieba():
+    from utils import tokenizers
+    if tokenizers.jieba is None:
+        raise ImportError("jieba is not installed")
+    tokenizers.jieba.initialize()
+    return 'jieba'
+
+
+def _load_tokenizers():
+    from utils.tokenizers import fast_tokenize, treebank_tokenize
+    treebank_tokenize("Warm up the tokenizer, don't you think?")
+    fast_tokenize("Warm up the tokenizer, don't you think?")
+    return ['treebank', 'fast']
+
+
+def _memory_usage():
+    """
+    Memory of this process, split into shared and private pages where available
+
+    Returns:
+        dict: 'rss_bytes' plus 'shared_bytes'/'private_bytes' on Linux
+    """
+    usage = {}
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            fields = dict(
+                (parts[0].rstrip(':'), int(parts[1]) * 1024)
+                for parts in (line.split() for line in f)
+                if len(parts) == 3 and parts[2] == 'kB'
+            )
+        usage['rss_bytes'] = fields['Rss']
+        usage['shared_bytes'] = fields['Shared_Clean'] + fields['Shared_Dirty']
+        usage['private_bytes'] = fields['Private_Clean'] + fields['Private_Dirty']
+    except (OSError, KeyError):
+        # Peak resident size, in kilobytes on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        usage['rss_bytes'] = peak if os.uname().sysname == 'Darwin' else peak * 1024
+    return usage
+
+
+class ResourceManager:
+    """
+    Load models and lexicons up front instead of on the first request
+
+    Resources are preloaded in the parent process before worker processes are
+    forked. freeze() then moves everything allocated so far out of the garbage
+    collector's reach, so collections in the workers do not write to those
+    objects and their pages stay shared copy-on-write.
+    """
+
+    LOADERS = {
+        'punkt': _load_punkt,
+        'stopwords': _load_stopwords,
+        'textblob': _load_textblob,
+        'lexicons': _load_lexicons,
+        'tokenizers': _load_tokenizers,
+        'jieba': _load_jieba
+    }
+
+    def __init__(self, names=None, transformer_models=None):
+        self.names = names if names is not None else config.PRELOAD_RESOURCES
+        if transformer_models is None:
+            transformer_models = list(config.TRANSFORMER_MODELS)
+            if config.SUMMARIZER == 'abstractive':
+                transformer_models.append(('summarization', config.SUMMARIZER_MODEL))
+        self.transformer_models = transformer_models
+        self.status = {}
+        self.frozen = False
+        self._transformers = {}
+        self._lock = threading.Lock()
+
+    def _load(self, name, loader):
+        """Run a loader and record its time and memory cost"""
+        before = _memory_usage()['rss_bytes']
+        started = time.perf_counter()
+        try:
+            detail = loader()
+            error = None
+        except Exception as e:
+            detail = None
+            error = str(e)
+        self.status[name] = {
+            'loaded': error is None,
+            'seconds': time.perf_counter() - started,
+            'rss_delta_bytes': _memory_usage()['rss_bytes'] - before,
+            'detail': detail,
+            'error': error
+        }
+        return self.status[name]
+
+    def preload(self):
+        """
+        Load all configured resources
+
+        Returns:
+            dict: Status of each resource
+        """
+        for name in self.names:
+            if name not in self.LOADERS:
+                self.status[name] = {'loaded': False, 'error': f"Unknown resource '{name}'"}
+            elif not self.status.get(name, {}).get('loaded'):
+                self._load(name, self.LOADERS[name])
+
+        for task, model in self.transformer_models:
+            self.transformer(task, model)
+
+        return self.status
+
+    def transformer(self, task, model=None):
+        """
+        Shared transformers pipeline, loaded on first use
+
+        Args:
+            task (str): Pipeline task, e.g. 'ner'
+            model (str): Model name, defaults to the task's default model
+
+        Returns:
+            transformers.Pipeline: Loaded pipeline, or None if it failed to load
+        """
+        key = f"{task}:{model}" if model else task
+        with self._lock:
+            if key not in self._transformers:
+                def load():
+                    from transformers import pipeline
+                    kwargs = {'model': model} if model else {}
+                    self._transformers[key] = pipeline(task, **kwargs)
+                    return model or 'default'
+
+                self._transformers[key] = None
+                self._load(f"transformers:{key}", load)
+            return self._transformers[key]
+
+    def freeze(self):
+        """Exclude everything loaded so far from garbage collection before forking"""
+        gc.collect()
+        gc.freeze()
+        self.frozen = True
+
+    def report(self):
+        """
+        Residency and memory footprint of this process
+
+        Returns:
+            dict: Process memory and the status of each resource
+        """
+        return {
+            'pid': os.getpid(),
+            'memory': _memory_usage(),
+            'frozen_objects': gc.get_freeze_count(),
+            'resources': dict(self.status)
+        }
+
+
+resource_manager = ResourceManager()
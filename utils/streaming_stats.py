@@ -0,0 +1,254 @@
+"""
+Streaming Statistics Module
+Constant-memory text statistics over chunked text and whole corpora
+"""
+import copy
+import hashlib
+import re
+from functools import lru_cache
+import numpy as np
+from utils.tokenizers import split_cjk_sentences, word_tokenizer
+
+# Words are runs of letters and digits between whitespace and punctuation, like
+# the alphanumeric tokens of word_tokenize: "3.5", "U.S." and "well-known" are
+# not words, and contractions count by their stem ("don't" -> "do")
+_WORD = re.compile(
+    r"(?<![^\s\"'(\[{<`\u201c\u2018\u3001\u3002\uff01\uff0c\uff1f])([^\W_]+?)(?:n't|'[^\W_]{1,2})?"
+    r"(?=[\s\"')\]}>\u201d\u2019!?;\u3001\u3002\uff01\uff0c\uff1f]|[.,:](?![^\W_])|$)"
+)
+_WORD_CHAR = re.compile(r'[^\W_]')
+
+# Sentence-final punctuation, followed by whitespace for Latin scripts
+_SENTENCE_END = re.compile('[.!?\u061f\u0964]+[\'")\\]\u201d\u2019]*(?=\\s)|[\u3002\uff01\uff1f]+')
+
+# Characters after which a chunk can be cut without splitting a word or sentence end
+_BOUNDARIES = (' ', '\n', '\t', '\u3002', '\uff01', '\uff1f')
+
+# CJK chunks are tokenized by sentence, so they are only cut at sentence ends
+_CJK_BOUNDARIES = ('\n', '\u3002', '\uff01', '\uff1f')
+
+# A chunk without any boundary is cut anyway once the carried tail gets this long
+MAX_CARRY_CHARS = 64 * 1024
+
+# HyperLogLog registers are 2**precision bytes; the relative error is 1.04 / sqrt(2**precision)
+HLL_PRECISION = 14
+
+
+@lru_cache(maxsize=1 << 16)
+def _hash(word):
+    """Stable 64-bit hash of a word, identical across processes"""
+    return int.from_bytes(hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class HyperLogLog:
+    """Cardinality estimate of a set of strings in 2**precision bytes"""
+
+    def __init__(self, precision=HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, words):
+        """
+        Add distinct words
+
+        Args:
+            words (iterable): Words to add, ideally already deduplicated
+        """
+        hashes = np.fromiter((_hash(word) for word in words), dtype=np.uint64)
+        if not hashes.size:
+            return
+
+        bits = 64 - self.precision
+        index = (hashes >> np.uint64(bits)).astype(np.intp)
+        rest = hashes & np.uint64((1 << bits) - 1)
+        # The remaining bits fit a float64 exactly, so frexp gives their bit length
+        rank = bits - np.frexp(rest.astype(np.float64))[1] + 1
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+
+    def merge(self, other):
+        """Add the words counted by another sketch of the same precision"""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self):
+        """
+        Estimated number of distinct words
+
+        Returns:
+            int: Cardinality estimate
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+
+        # Linear counting is more accurate for small sets
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+class StreamingStatistics:
+    """
+    Word, sentence and vocabulary statistics computed chunk by chunk
+
+    Memory stays constant however much text is consumed: chunks are counted
+    and discarded, only the unfinished word at the end of a chunk is carried
+    over, and the vocabulary is estimated with a HyperLogLog sketch. Results
+    of several documents or workers combine with merge().
+
+    Chinese, Japanese and Korean have no spaces between words (or, for
+    Korean, within sentences only), so for those scripts each chunk is
+    split into sentences and words with the same tokenizers as
+    ContentAnalyzer. Set script before the first chunk of a document.
+    """
+
+    def __init__(self, precision=HLL_PRECISION, script=None):
+        self.character_count = 0
+        self.word_count = 0
+        self.sentence_count = 0
+        self.vocabulary = HyperLogLog(precision)
+        # 'zh', 'ja' or 'ko' for the current document, see utils.tokenizers.cjk_script
+        self.script = script
+        self._open_sentence = False
+        self._carry = ''
+
+    def update(self, chunk):
+        """
+        Consume the next chunk of text
+
+        Args:
+            chunk (str): Text following the previous chunk
+
+        Returns:
+            StreamingStatistics: self, for chaining
+        """
+        self.character_count += len(chunk)
+        text = self._carry + chunk
+
+        boundaries = _CJK_BOUNDARIES if self.script else _BOUNDARIES
+        cut = max(text.rfind(boundary) for boundary in boundaries) + 1
+        if not cut and len(text) > MAX_CARRY_CHARS:
+            cut = len(text)
+        self._carry = text[cut:]
+        self._count(text[:cut])
+        return self
+
+    def consume(self, chunks):
+        """
+        Consume several chunks
+
+        Args:
+            chunks (iterable): Text chunks in order
+
+        Returns:
+            StreamingStatistics: self, for chaining
+        """
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    def end_document(self):
+        """Count the rest of the current document, e.g. before starting the next one"""
+        self._count(self._carry)
+        self._carry = ''
+        if self._open_sentence:
+            self.sentence_count += 1
+            self._open_sentence = False
+        return self
+
+    def _count(self, text):
+        """Count complete words and sentences of text"""
+        if not text:
+            return
+
+        if self.script:
+            self._count_cjk(text)
+            return
+
+        words = _WORD.findall(text.lower())
+        self.word_count += len(words)
+        self.vocabulary.update(set(words))
+
+        segments = _SENTENCE_END.split(text)
+        for segment in segments[:-1]:
+            if self._open_sentence or _WORD_CHAR.search(segment):
+                self.sentence_count += 1
+            self._open_sentence = False
+        self._open_sentence = self._open_sentence or bool(_WORD_CHAR.search(segments[-1]))
+
+    def _count_cjk(self, text):
+        """Count words and sentences of CJK text, which ends at a sentence end"""
+        tokenize = word_tokenizer(self.script)
+        sentences = split_cjk_sentences(text)
+        words = [
+            token for sentence in sentences
+            for token in (token.lower() for token in tokenize(sentence))
+            if token.isalnum()
+        ]
+        self.word_count += len(words)
+        self.vocabulary.update(set(words))
+        self.sentence_count += len(sentences)
+
+    def merge(self, other):
+        """
+        Add the statistics of another finished document or corpus
+
+        Args:
+            other (StreamingStatistics): Statistics to add
+
+        Returns:
+            StreamingStatistics: self, for chaining
+        """
+        self.end_document()
+        other.end_document()
+        self.character_count += other.character_count
+        self.word_count += other.word_count
+        self.sentence_count += other.sentence_count
+        self.vocabulary.merge(other.vocabulary)
+        return self
+
+    def result(self):
+        """
+        Statistics of everything consumed so far
+
+        Returns:
+            dict: Same fields as ContentAnalyzer.get_text_statistics plus the
+            estimated 'vocabulary_size' and 'type_token_ratio'
+        """
+        # Finish a copy, so more chunks of the same document can follow
+        final = copy.copy(self)
+        final.vocabulary = copy.deepcopy(self.vocabulary)
+        final.end_document()
+
+        word_count = final.word_count
+        vocabulary_size = min(final.vocabulary.count(), word_count)
+        avg_sentence_length = word_count / final.sentence_count if final.sentence_count else 0
+
+        return {
+            'success': True,
+            'word_count': word_count,
+            'sentence_count': final.sentence_count,
+            'character_count': final.character_count,
+            'avg_sentence_length': round(avg_sentence_length, 1),
+            'reading_time_minutes': round(word_count / 200, 1),
+            'vocabulary_size': vocabulary_size,
+            'type_token_ratio': round(vocabulary_size / word_count, 4) if word_count else 0.0,
+            'approximate': True
+        }
+
+
+def chunk_text(text, chunk_size=1 << 20):
+    """
+    Split a string into consecutive chunks
+
+    Args:
+        text (str): Text to split
+        chunk_size (int): Characters per chunk
+
+    Returns:
+        generator: Chunks of text
+    """
+    for start in range(0, len(text), chunk_size):
+        yield text[start:start + chunk_size]
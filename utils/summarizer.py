@@ -2,10 +2,12 @@
 Summarizer Module
 Handles text summarization using extractive methods
 """
-from textblob import TextBlob
 import nltk
-from nltk.tokenize import sent_tokenize
-from collections import defaultdict
+import numpy as np
+from utils.tokens import build_token_stream
+from utils.tokenizers import min_word_length
+from utils.profiler import timed
+from utils.resources import resource_manager
 import config
 
 
@@ -18,19 +20,22 @@ class TextSummarizer:
         except LookupError:
             nltk.download('punkt', quiet=True)
     
-    def extractive_summarize(self, text, num_sentences=3):
+    @timed('summarizer.extractive_summarize')
+    def extractive_summarize(self, text, num_sentences=3, language='en'):
         """
         Create extractive summary by selecting most important sentences
         
         Args:
             text (str): Text to summarize
             num_sentences (int): Number of sentences in summary
+            language (str): Language code used for sentence splitting
             
         Returns:
             dict: Summary result
         """
         try:
-            sentences = sent_tokenize(text)
+            stream = build_token_stream(text, language)
+            sentences = stream.sentences
             
             if len(sentences) <= num_sentences:
                 return {
@@ -41,21 +46,7 @@ class TextSummarizer:
                     'summary_sentences': len(sentences)
                 }
             
-            # Score sentences based on word frequency
-            word_frequencies = self._calculate_word_frequencies(text)
-            sentence_scores = self._score_sentences(sentences, word_frequencies)
-            
-            # Get top sentences
-            top_sentences = sorted(
-                sentence_scores.items(), 
-                key=lambda x: x[1], 
-                reverse=True
-            )[:num_sentences]
-            
-            # Sort by original order
-            top_sentences = sorted(top_sentences, key=lambda x: sentences.index(x[0]))
-            
-            summary = ' '.join([sentence for sentence, score in top_sentences])
+            summary = ' '.join(sentences[i] for i in self._select_sentences(stream, num_sentences))
             
             return {
                 'success': True,
@@ -71,58 +62,97 @@ class TextSummarizer:
                 'message': 'Summarization failed. Please try with different text.'
             }
     
-    def _calculate_word_frequencies(self, text):
-        """Calculate word frequencies for scoring"""
-        blob = TextBlob(text.lower())
-        words = [word for word in blob.words if word.isalnum() and len(word) > 2]
+    @timed('summarizer.abstractive_summarize')
+    def abstractive_summarize(self, text, language='en'):
+        """
+        Create an abstractive summary with the configured transformers model
+        
+        Args:
+            text (str): Text to summarize
+            language (str): Language code; the default model is English-only
+            
+        Returns:
+            dict: Summary result, unsuccessful if the model is unavailable
+        """
+        try:
+            # Checked first, so the model is not loaded just to reject the text
+            if language != 'en' and config.SUMMARIZER_MODEL == 'facebook/bart-large-cnn':
+                raise ValueError("The default summarization model only supports English")
+            model = resource_manager.transformer('summarization', config.SUMMARIZER_MODEL)
+            if model is None:
+                raise RuntimeError(f"Summarization model '{config.SUMMARIZER_MODEL}' is not available")
+            
+            summary = model(
+                text,
+                max_length=config.MAX_SUMMARY_LENGTH,
+                min_length=config.MIN_SUMMARY_LENGTH,
+                truncation=True
+            )[0]['summary_text']
+            
+            return {
+                'success': True,
+                'summary': summary,
+                'method': 'abstractive',
+                'model': config.SUMMARIZER_MODEL
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'message': 'Abstractive summarization is unavailable.'
+            }
+    
+    def _select_sentences(self, stream, num_sentences):
+        """Return indices of the top scoring sentences in original order"""
+        # Score sentences based on word frequency
+        word_frequencies = self._calculate_word_frequencies(stream)
+        sentence_scores = self._score_sentences(stream, word_frequencies)
         
-        word_freq = defaultdict(int)
-        for word in words:
-            word_freq[word] += 1
+        # Get top sentences, ties keep document order
+        top_sentences = np.argsort(-sentence_scores, kind='stable')[:num_sentences]
         
-        # Normalize frequencies
-        max_freq = max(word_freq.values()) if word_freq else 1
-        for word in word_freq:
-            word_freq[word] = word_freq[word] / max_freq
+        # Sort by original order
+        return np.sort(top_sentences)
+    
+    def _calculate_word_frequencies(self, stream):
+        """Calculate normalized word frequencies for scoring, indexed by token ID"""
+        min_length = min_word_length(stream.script, 3)
+        keep = stream.vocabulary.mask(lambda word: word.isalnum() and len(word) >= min_length)
+        word_freq = stream.counts(keep).astype(np.float64)
         
-        return word_freq
+        # Normalize frequencies
+        max_freq = word_freq.max() if word_freq.size and word_freq.max() > 0 else 1
+        return word_freq / max_freq
     
-    def _score_sentences(self, sentences, word_frequencies):
+    def _score_sentences(self, stream, word_frequencies):
         """Score sentences based on word frequencies"""
-        sentence_scores = {}
-        
-        for sentence in sentences:
-            blob = TextBlob(sentence.lower())
-            words = [word for word in blob.words if word.isalnum()]
-            
-            score = 0
-            for word in words:
-                if word in word_frequencies:
-                    score += word_frequencies[word]
-            
-            # Normalize by sentence length to avoid bias toward longer sentences
-            if len(words) > 0:
-                sentence_scores[sentence] = score / len(words)
-            else:
-                sentence_scores[sentence] = 0
+        alnum = stream.vocabulary.mask(str.isalnum)
+        scores, lengths = stream.sentence_sums(word_frequencies, alnum)
         
-        return sentence_scores
+        # Normalize by sentence length to avoid bias toward longer sentences
+        return np.divide(scores, lengths, out=np.zeros_like(scores), where=lengths > 0)
     
-    def bullet_point_summary(self, text, num_points=5):
+    @timed('summarizer.bullet_point_summary')
+    def bullet_point_summary(self, text, num_points=5, language='en'):
         """
         Create bullet point summary
         
         Args:
             text (str): Text to summarize
             num_points (int): Number of bullet points
+            language (str): Language code used for sentence splitting
             
         Returns:
             list: Bullet points
         """
-        result = self.extractive_summarize(text, num_points)
-        
-        if result['success']:
-            sentences = sent_tokenize(result['summary'])
+        try:
+            stream = build_token_stream(text, language)
+            
+            if len(stream.sentences) <= num_points:
+                sentences = stream.sentences
+            else:
+                sentences = [stream.sentences[i] for i in self._select_sentences(stream, num_points)]
+            
             return ['• ' + sentence.strip() for sentence in sentences]
-        else:
+        except Exception as e:
             return []
@@ -0,0 +1,208 @@
+"""
+Text Store Module
+Content-addressed storage so results can reference article text instead of copying it
+"""
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+import config
+
+
+class TextStore:
+    """
+    Keep article texts once, keyed by their SHA-256 digest
+
+    Texts live in a byte-bounded in-memory LRU. Texts evicted from memory are
+    written to the spill directory and loaded back on demand, so a reference
+    stays valid after eviction. Identical texts, e.g. the same article opened
+    by several users, are stored once.
+
+    The spill directory is bounded too: spilled texts not used for
+    spill_ttl seconds are deleted when a store is created, and the least
+    recently used ones are deleted whenever the directory grows past
+    spill_max_bytes. References to deleted texts then return None.
+    """
+
+    def __init__(self, max_bytes=None, spill_dir=None, spill_max_bytes=None, spill_ttl=None):
+        self.max_bytes = max_bytes or config.TEXT_STORE_MAX_BYTES
+        self.spill_dir = spill_dir if spill_dir is not None else config.TEXT_STORE_DIR
+        self.spill_max_bytes = spill_max_bytes or config.TEXT_STORE_SPILL_MAX_BYTES
+        self.spill_ttl = spill_ttl or config.TEXT_STORE_SPILL_TTL
+        self.size = 0
+        self.spill_size = 0
+        self._texts = OrderedDict()
+        self._spilled = set()
+        self._lock = threading.Lock()
+
+        if self.spill_dir:
+            self.cleanup()
+
+    def put(self, text):
+        """
+        Store a text
+
+        Args:
+            text (str): Text to store
+
+        Returns:
+            dict: Reference with the 'sha256' digest and text 'length'
+        """
+        data = text.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            if digest in self._texts:
+                self._texts.move_to_end(digest)
+            else:
+                self._texts[digest] = data
+                self.size += len(data)
+                self._evict()
+
+        return {'sha256': digest, 'length': len(text)}
+
+    def get(self, ref, start=0, end=None):
+        """
+        Load a stored text or a span of it
+
+        Args:
+            ref (dict): Reference returned by put()
+            start (int): First character of the span
+            end (int): End of the span (exclusive), defaults to the end of the text
+
+        Returns:
+            str: The text, or None if it is no longer available
+        """
+        digest = ref['sha256']
+        with self._lock:
+            data = self._texts.get(digest)
+            if data is not None:
+                self._texts.move_to_end(digest)
+
+        if data is None:
+            data = self._load(digest)
+            if data is None:
+                return None
+            with self._lock:
+                if digest not in self._texts:
+                    self._texts[digest] = data
+                    self.size += len(data)
+                    self._evict()
+
+        return data.decode('utf-8')[start:end]
+
+    def __contains__(self, ref):
+        digest = ref['sha256']
+        with self._lock:
+            return digest in self._texts or (
+                bool(self.spill_dir) and os.path.exists(self._spill_path(digest))
+            )
+
+    def _evict(self):
+        """Move least recently used texts to disk until under the byte budget"""
+        while self.size > self.max_bytes and len(self._texts) > 1:
+            digest, data = self._texts.popitem(last=False)
+            self.size -= len(data)
+            self._spill(digest, data)
+
+    def _spill_path(self, digest):
+        return os.path.join(self.spill_dir, digest[:2], digest)
+
+    def _spill(self, digest, data):
+        """Write an evicted text to the spill directory"""
+        if not self.spill_dir:
+            return
+
+        path = self._spill_path(digest)
+        if os.path.exists(path):
+            return
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        self._spilled.add(digest)
+        self.spill_size += len(data)
+        if self.spill_size > self.spill_max_bytes:
+            # Leave some headroom so the directory is not scanned on every spill
+            self._prune(int(self.spill_max_bytes * 0.9))
+
+    def _load(self, digest):
+        """Read a spilled text, or None if it was never spilled or was deleted"""
+        if not self.spill_dir:
+            return None
+        path = self._spill_path(digest)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # The modification time marks recent use for pruning
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+
+    def _spill_files(self):
+        """(path, size, modification time) of every file in the spill directory"""
+        files = []
+        if not os.path.isdir(self.spill_dir):
+            return files
+        for entry in os.scandir(self.spill_dir):
+            if not entry.is_dir():
+                continue
+            for file_entry in os.scandir(entry.path):
+                try:
+                    stat = file_entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((file_entry.path, stat.st_size, stat.st_mtime))
+        return files
+
+    def _prune(self, max_bytes):
+        """Delete expired spilled texts, then the least recently used ones over max_bytes"""
+        cutoff = time.time() - self.spill_ttl
+        files = sorted(self._spill_files(), key=lambda file: file[2])
+        total = sum(size for _, size, _ in files)
+        removed = 0
+
+        for path, size, mtime in files:
+            if mtime >= cutoff and total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._spilled.discard(os.path.basename(path))
+            total -= size
+            removed += 1
+
+        self.spill_size = total
+        return removed
+
+    def cleanup(self):
+        """
+        Apply the spill directory's TTL and size limit
+
+        Returns:
+            int: Number of spilled texts deleted
+        """
+        if not self.spill_dir:
+            return 0
+        with self._lock:
+            return self._prune(self.spill_max_bytes)
+
+    def close(self):
+        """Drop all texts and delete the files this store spilled"""
+        with self._lock:
+            for digest in self._spilled:
+                try:
+                    os.remove(self._spill_path(digest))
+                except FileNotFoundError:
+                    pass
+            self._spilled.clear()
+            self._texts.clear()
+            self.size = 0
+            self.spill_size = 0
@@ -0,0 +1,199 @@
+"""
+Tokens Module
+Compact, vocabulary-interned token representation shared by the analyzers
+"""
+from functools import lru_cache
+import numpy as np
+from utils.languages import normalize_language, split_sentences
+from utils.tokenizers import cjk_script, word_tokenizer
+import config
+
+
+class Vocabulary:
+    """Map token strings to dense integer IDs"""
+
+    def __init__(self):
+        self.index = {}
+        self.words = []
+
+    def __len__(self):
+        return len(self.words)
+
+    def intern(self, word):
+        """
+        Return the ID of a word, adding it if unseen
+
+        Args:
+            word (str): Token string
+
+        Returns:
+            int: Token ID
+        """
+        token_id = self.index.get(word)
+        if token_id is None:
+            token_id = len(self.words)
+            self.index[word] = token_id
+            self.words.append(word)
+        return token_id
+
+    def mask(self, predicate):
+        """
+        Evaluate a predicate once per vocabulary entry
+
+        Args:
+            predicate (callable): Function taking a word and returning bool
+
+        Returns:
+            numpy.ndarray: Boolean array indexed by token ID
+        """
+        return np.fromiter(
+            (predicate(word) for word in self.words),
+            dtype=bool,
+            count=len(self.words)
+        )
+
+
+class TokenStream:
+    """Lower-cased token IDs of a document with sentence boundaries"""
+
+    def __init__(self, sentences, ids, sentence_offsets, vocabulary, script=None):
+        self.sentences = sentences
+        self.ids = ids
+        self.sentence_offsets = sentence_offsets
+        self.vocabulary = vocabulary
+        self.script = script
+
+    @classmethod
+    def from_text(cls, text, language='en'):
+        """
+        Tokenize text into a token stream
+
+        Args:
+            text (str): Text to tokenize
+            language (str): Language code used for sentence and word splitting
+
+        Returns:
+            TokenStream: Tokenized document
+        """
+        vocabulary = Vocabulary()
+        script = cjk_script(normalize_language(language), text)
+        tokenize = word_tokenizer(script)
+        sentences = split_sentences(text, language)
+        lengths = []
+
+        def token_ids():
+            for sentence in sentences:
+                tokens = tokenize(sentence)
+                lengths.append(len(tokens))
+                for token in tokens:
+                    yield vocabulary.intern(token.lower())
+
+        ids = np.fromiter(token_ids(), dtype=np.int32)
+        sentence_offsets = np.zeros(len(sentences) + 1, dtype=np.int32)
+        np.cumsum(lengths, out=sentence_offsets[1:])
+
+        return cls(sentences, ids, sentence_offsets, vocabulary, script)
+
+    @property
+    def num_sentences(self):
+        return len(self.sentences)
+
+    @property
+    def sentence_index(self):
+        """Sentence number of every token"""
+        return np.repeat(
+            np.arange(self.num_sentences, dtype=np.int32),
+            np.diff(self.sentence_offsets)
+        )
+
+    def term_sentences(self, token_ids):
+        """
+        Positional index of the sentences mentioning each of several tokens
+
+        Args:
+            token_ids (list): Token IDs to look up
+
+        Returns:
+            tuple: (term number, sentence number) arrays with one entry per
+            distinct pair, term numbers index into token_ids
+        """
+        lookup = np.full(len(self.vocabulary), -1, dtype=np.int64)
+        lookup[np.asarray(token_ids, dtype=np.int64)] = np.arange(len(token_ids))
+
+        terms = lookup[self.ids]
+        found = terms >= 0
+        # Encode each pair as one integer so duplicates within a sentence collapse
+        pairs = np.unique(terms[found] * self.num_sentences + self.sentence_index[found])
+        return pairs // self.num_sentences, pairs % self.num_sentences
+
+    def counts(self, mask=None):
+        """
+        Count token occurrences
+
+        Args:
+            mask (numpy.ndarray): Optional boolean array of token IDs to keep
+
+        Returns:
+            numpy.ndarray: Frequency of each token ID
+        """
+        ids = self.ids if mask is None else self.ids[mask[self.ids]]
+        return np.bincount(ids, minlength=len(self.vocabulary))
+
+    def sentence_sums(self, weights, mask=None):
+        """
+        Sum per-token weights within each sentence
+
+        Args:
+            weights (numpy.ndarray): Weight of each token ID
+            mask (numpy.ndarray): Optional boolean array of token IDs to include
+
+        Returns:
+            tuple: (weight sums, token counts) per sentence
+        """
+        sentence_index = self.sentence_index
+        ids = self.ids
+        if mask is not None:
+            keep = mask[ids]
+            ids = ids[keep]
+            sentence_index = sentence_index[keep]
+
+        sums = np.bincount(sentence_index, weights=weights[ids], minlength=self.num_sentences)
+        counts = np.bincount(sentence_index, minlength=self.num_sentences)
+        return sums, counts
+
+    def most_common(self, counts, top_n):
+        """
+        Return the most frequent words, ties in order of first appearance
+
+        Args:
+            counts (numpy.ndarray): Frequency of each token ID
+            top_n (int): Number of words to return
+
+        Returns:
+            list: (word, count) tuples
+        """
+        order = np.argsort(-counts, kind='stable')[:top_n]
+        return [
+            (self.vocabulary.words[token_id], int(counts[token_id]))
+            for token_id in order
+            if counts[token_id] > 0
+        ]
+
+    def nbytes(self):
+        """Memory used by the token arrays"""
+        return self.ids.nbytes + self.sentence_offsets.nbytes
+
+
+@lru_cache(maxsize=config.TOKEN_CACHE_SIZE)
+def build_token_stream(text, language='en'):
+    """
+    Tokenize text, reusing the result for repeated calls on the same text
+
+    Args:
+        text (str): Text to tokenize
+        language (str): Language code used for sentence and word splitting
+
+    Returns:
+        TokenStream: Tokenized document
+    """
+    return TokenStream.from_text(text, language)
@@ -3,6 +3,7 @@ Translator Module
 Handles multilingual translation
 """
 from googletrans import Translator as GoogleTranslator
+from utils.profiler import timed
 import config
 
 
@@ -12,6 +13,7 @@ class Translator:
     def __init__(self):
         self.translator = GoogleTranslator()
     
+    @timed('translator.translate_text')
     def translate_text(self, text, target_language='en', source_language='auto'):
         """
         Translate text to target language
@@ -52,6 +54,7 @@ class Translator:
                 'message': 'Translation failed. The text might be too long or the service is unavailable.'
             }
     
+    @timed('translator.detect_language')
     def detect_language(self, text):
         """
         Detect the language of text